@@ -0,0 +1,86 @@
+"""
+Run all benchmark suites and print the results with the environment as
+JSON, so runs of different releases can be compared:
+
+    python -m benchmarks --output 2.2.0.json
+    python -m benchmarks --compare 2.2.0.json
+
+`--compare` reports the change of each benchmark's best time relative
+to the baseline and exits with status 1 if any got slower than
+`--threshold`.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+
+from benchmarks import imports
+from benchmarks import parsing
+from benchmarks import sending
+from benchmarks import serialization
+from benchmarks.utils import environment
+from benchmarks.utils import report
+
+SUITES = {
+    "imports": imports.run,
+    "serialization": serialization.run,
+    "parsing": parsing.run,
+    "sending": sending.run,
+}
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> tuple[list[dict[str, Any]], bool]:
+    regressed = False
+    changes = []
+    for suite, results in current["suites"].items():
+        previous = {
+            result["name"]: result for result in baseline["suites"].get(suite, [])
+        }
+        for result in results:
+            before = previous.get(result["name"])
+            if before is None:
+                continue
+            change = result["best_us"] / before["best_us"] - 1
+            regressed = regressed or change > threshold
+            changes.append(
+                {"suite": suite, "name": result["name"], "change": round(change, 4)}
+            )
+    return changes, regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "suites", nargs="*", metavar="suite", help=f"any of: {', '.join(SUITES)}"
+    )
+    parser.add_argument("--output", help="write results to this file")
+    parser.add_argument("--compare", help="results of a previous run")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+
+    results = {
+        "environment": environment(),
+        "suites": {name: SUITES[name]() for name in args.suites or SUITES},
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            report(results, file)
+    else:
+        report(results)
+
+    if args.compare:
+        with open(args.compare) as file:
+            changes, regressed = compare(json.load(file), results, args.threshold)
+        report(changes, sys.stderr)
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Cold start cost: the time to import `mailtrap` and get ready to send,
+measured in a fresh interpreter for every run, so nothing is cached in
+`sys.modules`. Interpreter startup itself isn't included.
+
+Run with `python -m benchmarks.imports`.
+"""
+
+import subprocess
+import sys
+from typing import Any
+
+from benchmarks.utils import report
+
+SCENARIOS = {
+    "import mailtrap": "import mailtrap",
+    "send path": """
+import mailtrap as mt
+client = mt.MailtrapClient(token="benchmark")
+mail = mt.Mail(
+    sender=mt.Address(email="sender@example.com"),
+    to=[mt.Address(email="recipient@example.com")],
+    subject="Subject",
+    text="Text",
+)
+client.sending_api
+mail.to_json_bytes()
+""",
+    "everything": """
+import mailtrap as mt
+for name in mt.__all__:
+    getattr(mt, name)
+client = mt.MailtrapClient(token="benchmark", account_id="1")
+client.testing_api, client.contacts_api, client.email_templates_api
+client.suppressions_api, client.sending_api
+""",
+}
+
+TIMER = """
+import time
+started = time.perf_counter()
+exec(compile({code!r}, "<benchmark>", "exec"))
+print(time.perf_counter() - started)
+"""
+
+
+def time_cold(code: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def measure_cold(name: str, code: str, repeat: int = 10) -> dict[str, Any]:
+    """Like `utils.measure`, but each run is a single call in a new process."""
+    timings = [time_cold(code) for _ in range(repeat)]
+    return {
+        "name": name,
+        "calls": 1,
+        "best_us": min(timings) * 1e6,
+        "mean_us": sum(timings) / len(timings) * 1e6,
+    }
+
+
+def run() -> list[dict[str, Any]]:
+    return [measure_cold(name, code) for name, code in SCENARIOS.items()]
+
+
+if __name__ == "__main__":
+    report(run())
@@ -0,0 +1,85 @@
+"""
+Decoding overhead of response models: the list endpoints returning the
+most data, parsed the old way (`json` + model init) and straight from the
+raw body as the client does.
+
+Run with `python -m benchmarks.parsing`.
+"""
+
+import json
+from typing import Any
+
+from benchmarks.utils import measure
+from benchmarks.utils import report
+from mailtrap.models.common import get_type_adapter
+from mailtrap.models.messages import EmailMessage
+from mailtrap.models.projects import Project
+from mailtrap.models.suppressions import Suppression
+from mailtrap.stub_server import StubState
+
+SUPPRESSIONS_BODY = json.dumps(
+    [
+        {
+            "id": f"suppression-{i}",
+            "type": "hard bounce",
+            "created_at": "2025-01-01T10:00:00Z",
+            "email": f"user{i}@example.com",
+            "sending_stream": "transactional",
+            "domain_name": "example.com",
+            "message_subject": "Welcome",
+        }
+        for i in range(1000)
+    ]
+).encode()
+
+
+def stub_state() -> StubState:
+    """50 projects with 2 inboxes each and a page of 30 messages."""
+    state = StubState()
+    for i in range(50):
+        project = state.add_project(f"Project {i}")
+        for j in range(2):
+            state.add_inbox(project["id"], f"Inbox {j}")
+    for i in range(30):
+        mail = {
+            "from": {"email": "sender@example.com", "name": "Sender"},
+            "to": [{"email": f"user{i}@example.com", "name": "User"}],
+            "subject": f"Message {i}",
+            "text": "Hello",
+            "html": "<p>Hello</p>",
+        }
+        state.deliver(mail, state.default_inbox_id)
+    return state
+
+
+STATE = stub_state()
+MESSAGES_BODY = json.dumps(
+    [message["data"] for message in STATE.messages.values()]
+).encode()
+PROJECTS_BODY = json.dumps(
+    [STATE.render_project(project) for project in STATE.projects.values()]
+).encode()
+
+
+def parse_bodies(name: str, model: Any, body: bytes) -> list[dict[str, Any]]:
+    return [
+        measure(
+            f"{name}.json+init", lambda: [model(**item) for item in json.loads(body)]
+        ),
+        measure(
+            f"{name}.validate_json",
+            lambda: get_type_adapter(list[model]).validate_json(body),
+        ),
+    ]
+
+
+def run() -> list[dict[str, Any]]:
+    return [
+        *parse_bodies("messages[30]", EmailMessage, MESSAGES_BODY),
+        *parse_bodies("projects[50x2]", Project, PROJECTS_BODY),
+        *parse_bodies("suppressions[1000]", Suppression, SUPPRESSIONS_BODY),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
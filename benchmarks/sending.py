@@ -0,0 +1,61 @@
+"""
+End-to-end sending through the real HTTP stack against a local
+`StubServer`, so the numbers cover serialization, connection reuse,
+threading and response parsing, but not the network.
+
+Run with `python -m benchmarks.sending`.
+"""
+
+from typing import Any
+
+import mailtrap as mt
+from benchmarks.utils import measure
+from benchmarks.utils import report
+from mailtrap.stub_server import StubServer
+
+MAILS_PER_CALL = 200
+
+MAIL = mt.Mail(
+    sender=mt.Address(email="sender@example.com", name="Sender"),
+    to=[mt.Address(email="recipient@example.com")],
+    subject="Order confirmation",
+    text="Your order is confirmed.",
+    category="Orders",
+)
+
+
+def send_many(client: mt.MailtrapClient, concurrency: int) -> None:
+    for result in client.send_many([MAIL] * MAILS_PER_CALL, concurrency=concurrency):
+        if not result.success:
+            raise RuntimeError(result.error)
+
+
+def run() -> list[dict[str, Any]]:
+    with StubServer(max_recorded_requests=0, max_sent=0) as server:
+        client = mt.MailtrapClient(token="benchmark", api_host=server.url)
+        sending_api = client.sending_api
+        return [
+            measure("send", lambda: client.send(MAIL)),
+            measure(
+                f"send_many[{MAILS_PER_CALL}].concurrency=1",
+                lambda: send_many(client, 1),
+                repeat=3,
+                ops=MAILS_PER_CALL,
+            ),
+            measure(
+                f"send_many[{MAILS_PER_CALL}].concurrency=8",
+                lambda: send_many(client, 8),
+                repeat=3,
+                ops=MAILS_PER_CALL,
+            ),
+            measure(
+                f"send_in_batches[{MAILS_PER_CALL}]",
+                lambda: sending_api.send_in_batches([MAIL] * MAILS_PER_CALL),
+                repeat=3,
+                ops=MAILS_PER_CALL,
+            ),
+        ]
+
+
+if __name__ == "__main__":
+    report(run())
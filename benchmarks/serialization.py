@@ -0,0 +1,91 @@
+"""
+Serialization overhead of request models: emails of different sizes and
+bulk contact imports.
+
+Run with `python -m benchmarks.serialization`, or all suites with
+`python -m benchmarks`.
+"""
+
+import base64
+import json
+import os
+from typing import Any
+
+from pydantic import TypeAdapter
+
+import mailtrap as mt
+from benchmarks.utils import measure
+from benchmarks.utils import report
+from mailtrap.models.common import dump_json_array
+from mailtrap.models.common import dump_json_object
+
+SMALL_MAIL = mt.Mail(
+    sender=mt.Address(email="sender@example.com", name="Sender"),
+    to=[mt.Address(email="recipient@example.com")],
+    subject="Password reset",
+    text="Follow the link to reset your password.",
+    category="Password reset",
+)
+
+LARGE_MAIL = mt.Mail(
+    sender=mt.Address(email="sender@example.com", name="Sender"),
+    to=[mt.Address(email=f"recipient{i}@example.com") for i in range(50)],
+    subject="Monthly newsletter",
+    html="<p>" + "Lorem ipsum dolor sit amet. " * 20_000 + "</p>",
+    category="Newsletter",
+)
+
+ATTACHMENTS_MAIL = mt.Mail(
+    sender=mt.Address(email="sender@example.com", name="Sender"),
+    to=[mt.Address(email="recipient@example.com")],
+    subject="Quarterly reports",
+    text="Reports are attached.",
+    attachments=[
+        mt.Attachment(content=base64.b64encode(os.urandom(1 << 20)), filename=f"{i}.pdf")
+        for i in range(10)
+    ],
+)
+
+IMPORT_CONTACTS = [
+    mt.ImportContactParams(
+        email=f"user{i}@example.com",
+        fields={"first_name": "User", "zip_code": i},
+        list_ids_included=[1, 2],
+    )
+    for i in range(50_000)
+]
+
+
+def uncached_api_data(mail: mt.BaseMail) -> dict[str, Any]:
+    """Serialization as done before adapters were cached."""
+    return TypeAdapter(type(mail)).dump_python(mail, by_alias=True, exclude_none=True)
+
+
+def run() -> list[dict[str, Any]]:
+    return [
+        measure("mail.api_data[uncached_adapter]", lambda: uncached_api_data(SMALL_MAIL)),
+        measure("mail.api_data", lambda: SMALL_MAIL.api_data),
+        measure(
+            "large_mail.api_data+json.dumps",
+            lambda: json.dumps(LARGE_MAIL.api_data).encode(),
+        ),
+        measure("large_mail.to_json_bytes", LARGE_MAIL.to_json_bytes),
+        measure("attachments_mail[10x1MB].api_data", lambda: ATTACHMENTS_MAIL.api_data),
+        measure("attachments_mail[10x1MB].to_json_bytes", ATTACHMENTS_MAIL.to_json_bytes),
+        measure(
+            "import_contacts[50k].api_data+json.dumps",
+            lambda: json.dumps(
+                {"contacts": [contact.api_data for contact in IMPORT_CONTACTS]}
+            ).encode(),
+            repeat=3,
+        ),
+        measure(
+            "import_contacts[50k].dump_json",
+            lambda: dump_json_object(contacts=dump_json_array(IMPORT_CONTACTS)),
+            repeat=3,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    report(run())
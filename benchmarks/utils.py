@@ -0,0 +1,58 @@
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timezone
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
+from typing import Any
+from typing import Optional
+from typing import TextIO
+
+
+def measure(
+    name: str, func: Callable[[], Any], repeat: int = 5, ops: int = 1
+) -> dict[str, Any]:
+    """
+    Time `func` and return the best per-call duration of `repeat` runs.
+    When a call performs `ops` operations, e.g. sends a batch of emails,
+    per-operation timings and throughput are reported as well.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = timer.repeat(repeat=repeat, number=number)
+    best = min(timings) / number
+    result = {
+        "name": name,
+        "calls": number,
+        "best_us": best * 1e6,
+        "mean_us": sum(timings) / len(timings) / number * 1e6,
+    }
+    if ops > 1:
+        result["ops"] = ops
+        result["best_op_us"] = best / ops * 1e6
+        result["ops_per_second"] = ops / best
+    return result
+
+
+def environment() -> dict[str, Any]:
+    """What the results depend on besides the code, to compare runs fairly."""
+    try:
+        mailtrap_version: Optional[str] = version("mailtrap")
+    except PackageNotFoundError:
+        mailtrap_version = None
+    return {
+        "mailtrap": mailtrap_version,
+        "pydantic": version("pydantic"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def report(results: Any, file: TextIO = sys.stdout) -> None:
+    json.dump(results, file, indent=2)
+    file.write("\n")
@@ -1,4 +1,8 @@
+from collections.abc import Iterable
+
 import mailtrap as mt
+from mailtrap.models.mail import BatchSendResponse
+from mailtrap.models.mail import BatchSendResponseItem
 
 API_TOKEN = "<YOUR_API_TOKEN>"
 INBOX_ID = "<YOUR_INBOX_ID>"
@@ -29,15 +33,35 @@ mail_from_template = mt.MailFromTemplate(
         "company_info_country": "Test_Company_info_country",
     },
 )
+batch_base = mt.BatchMail(
+    sender=mt.Address(email="<SENDER_EMAIL>", name="<SENDER_NAME>"),
+    subject="You are awesome!",
+    text="Congrats for sending test email with Mailtrap!",
+    category="Integration Test",
+)
+batch_requests = [
+    mt.BatchEmailRequest(to=[mt.Address(email="<RECEIVER_EMAIL>")]),
+    mt.BatchEmailRequest(
+        to=[mt.Address(email="<ANOTHER_RECEIVER_EMAIL>")],
+        subject="You are awesome too!",
+    ),
+]
 
 
 def send(client: mt.MailtrapClient, mail: mt.BaseMail) -> mt.SEND_ENDPOINT_RESPONSE:
     return client.send(mail)
 
 
-def batch_send(client: mt.MailtrapClient, mail: mt.BaseMail) -> mt.SEND_ENDPOINT_RESPONSE:
-    # will be added soon
-    pass
+def batch_send(
+    client: mt.MailtrapClient, base: mt.BatchMail, requests: list[mt.BatchEmailRequest]
+) -> BatchSendResponse:
+    return client.sending_api.send_batch(base, requests)
+
+
+def send_in_batches(
+    client: mt.MailtrapClient, mails: Iterable[mt.BaseMail]
+) -> list[BatchSendResponseItem]:
+    return client.sending_api.send_in_batches(mails)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Optional
 
 import mailtrap as mt
@@ -41,6 +42,12 @@ def list_messages(
     )
 
 
+def iter_all_messages(
+    inbox_id: int, search: Optional[str] = None
+) -> Iterator[EmailMessage]:
+    return messages_api.iter_messages(inbox_id=inbox_id, search=search, prefetch=True)
+
+
 def forward_message(inbox_id: int, message_id: int, email: str) -> ForwardedMessage:
     return messages_api.forward(inbox_id=inbox_id, message_id=message_id, email=email)
 
@@ -73,6 +80,13 @@ def get_message_as_eml(inbox_id: int, message_id: str) -> str:
     return messages_api.get_message_as_eml(inbox_id=inbox_id, message_id=message_id)
 
 
+def save_message_as_eml(inbox_id: int, message_id: int, path: str) -> int:
+    with open(path, "wb") as file:
+        return messages_api.download_body(
+            inbox_id=inbox_id, message_id=message_id, file=file, body_format="eml"
+        )
+
+
 def get_mail_headers(inbox_id: int, message_id: str) -> str:
     return messages_api.get_mail_headers(inbox_id=inbox_id, message_id=message_id)
 
@@ -1,24 +1,105 @@
-from .client import SEND_ENDPOINT_RESPONSE
-from .client import MailtrapClient
-from .exceptions import APIError
-from .exceptions import AuthorizationError
-from .exceptions import ClientConfigurationError
-from .exceptions import MailtrapError
-from .models.contacts import ContactListParams
-from .models.contacts import CreateContactFieldParams
-from .models.contacts import CreateContactParams
-from .models.contacts import ImportContactParams
-from .models.contacts import UpdateContactFieldParams
-from .models.contacts import UpdateContactParams
-from .models.inboxes import CreateInboxParams
-from .models.inboxes import UpdateInboxParams
-from .models.mail import Address
-from .models.mail import Attachment
-from .models.mail import BaseMail
-from .models.mail import Disposition
-from .models.mail import Mail
-from .models.mail import MailFromTemplate
-from .models.messages import UpdateEmailMessageParams
-from .models.projects import ProjectParams
-from .models.templates import CreateEmailTemplateParams
-from .models.templates import UpdateEmailTemplateParams
+"""
+Names are imported on first access (PEP 562), so `import mailtrap` stays
+cheap: a process that only sends emails never loads the API facades and
+models it doesn't use.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from .attachment_cache import AttachmentCache
+    from .client import SEND_ENDPOINT_RESPONSE
+    from .client import AsyncMailtrapClient
+    from .client import MailtrapClient
+    from .dedup import DedupCache
+    from .exceptions import APIError
+    from .exceptions import AuthorizationError
+    from .exceptions import ClientConfigurationError
+    from .exceptions import MailtrapError
+    from .hooks import RequestHooks
+    from .hooks import RequestInfo
+    from .models.common import warmup_models
+    from .models.contacts import ContactListParams
+    from .models.contacts import CreateContactFieldParams
+    from .models.contacts import CreateContactParams
+    from .models.contacts import ImportContactParams
+    from .models.contacts import UpdateContactFieldParams
+    from .models.contacts import UpdateContactParams
+    from .models.inboxes import CreateInboxParams
+    from .models.inboxes import UpdateInboxParams
+    from .models.mail import Address
+    from .models.mail import Attachment
+    from .models.mail import BaseMail
+    from .models.mail import BatchEmailRequest
+    from .models.mail import BatchMail
+    from .models.mail import Disposition
+    from .models.mail import Mail
+    from .models.mail import MailFromTemplate
+    from .models.messages import UpdateEmailMessageParams
+    from .models.projects import ProjectParams
+    from .models.templates import CreateEmailTemplateParams
+    from .models.templates import UpdateEmailTemplateParams
+    from .outbox import Outbox
+    from .rate_limit import RateLimiter
+    from .retry import RetryPolicy
+    from .stats import ClientStats
+    from .stats import EndpointStats
+    from .stats import LatencyHistogram
+
+_LAZY_IMPORTS = {
+    "AttachmentCache": ".attachment_cache",
+    "SEND_ENDPOINT_RESPONSE": ".client",
+    "AsyncMailtrapClient": ".client",
+    "MailtrapClient": ".client",
+    "DedupCache": ".dedup",
+    "APIError": ".exceptions",
+    "AuthorizationError": ".exceptions",
+    "ClientConfigurationError": ".exceptions",
+    "MailtrapError": ".exceptions",
+    "RequestHooks": ".hooks",
+    "RequestInfo": ".hooks",
+    "warmup_models": ".models.common",
+    "ContactListParams": ".models.contacts",
+    "CreateContactFieldParams": ".models.contacts",
+    "CreateContactParams": ".models.contacts",
+    "ImportContactParams": ".models.contacts",
+    "UpdateContactFieldParams": ".models.contacts",
+    "UpdateContactParams": ".models.contacts",
+    "CreateInboxParams": ".models.inboxes",
+    "UpdateInboxParams": ".models.inboxes",
+    "Address": ".models.mail",
+    "Attachment": ".models.mail",
+    "BaseMail": ".models.mail",
+    "BatchEmailRequest": ".models.mail",
+    "BatchMail": ".models.mail",
+    "Disposition": ".models.mail",
+    "Mail": ".models.mail",
+    "MailFromTemplate": ".models.mail",
+    "UpdateEmailMessageParams": ".models.messages",
+    "ProjectParams": ".models.projects",
+    "CreateEmailTemplateParams": ".models.templates",
+    "UpdateEmailTemplateParams": ".models.templates",
+    "Outbox": ".outbox",
+    "RateLimiter": ".rate_limit",
+    "RetryPolicy": ".retry",
+    "ClientStats": ".stats",
+    "EndpointStats": ".stats",
+    "LatencyHistogram": ".stats",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
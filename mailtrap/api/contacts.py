@@ -1,7 +1,12 @@
+from mailtrap.api.resources.contact_fields import AsyncContactFieldsApi
 from mailtrap.api.resources.contact_fields import ContactFieldsApi
+from mailtrap.api.resources.contact_imports import AsyncContactImportsApi
 from mailtrap.api.resources.contact_imports import ContactImportsApi
+from mailtrap.api.resources.contact_lists import AsyncContactListsApi
 from mailtrap.api.resources.contact_lists import ContactListsApi
+from mailtrap.api.resources.contacts import AsyncContactsApi
 from mailtrap.api.resources.contacts import ContactsApi
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 
 
@@ -25,3 +30,25 @@ class ContactsBaseApi:
     @property
     def contacts(self) -> ContactsApi:
         return ContactsApi(account_id=self._account_id, client=self._client)
+
+
+class AsyncContactsBaseApi:
+    def __init__(self, client: AsyncHttpClient, account_id: str) -> None:
+        self._account_id = account_id
+        self._client = client
+
+    @property
+    def contact_fields(self) -> AsyncContactFieldsApi:
+        return AsyncContactFieldsApi(account_id=self._account_id, client=self._client)
+
+    @property
+    def contact_lists(self) -> AsyncContactListsApi:
+        return AsyncContactListsApi(account_id=self._account_id, client=self._client)
+
+    @property
+    def contact_imports(self) -> AsyncContactImportsApi:
+        return AsyncContactImportsApi(account_id=self._account_id, client=self._client)
+
+    @property
+    def contacts(self) -> AsyncContactsApi:
+        return AsyncContactsApi(account_id=self._account_id, client=self._client)
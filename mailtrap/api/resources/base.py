@@ -0,0 +1,21 @@
+from typing import Generic
+from typing import TypeVar
+
+from mailtrap.http import AsyncHttpClient
+from mailtrap.http import HttpClient
+
+ClientT = TypeVar("ClientT", HttpClient, AsyncHttpClient)
+
+
+class BaseAccountApi(Generic[ClientT]):
+    """
+    Common state of account scoped resources.
+
+    Every resource is split into a base class holding path building and
+    response parsing, and thin sync/async subclasses doing the I/O, so the
+    two flavours can't drift apart.
+    """
+
+    def __init__(self, client: ClientT, account_id: str) -> None:
+        self._account_id = account_id
+        self._client: ClientT = client
@@ -1,5 +1,8 @@
 from typing import Optional
 
+from mailtrap.api.resources.base import BaseAccountApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 from mailtrap.models.common import DeletedObject
 from mailtrap.models.contacts import ContactField
@@ -7,28 +10,34 @@ from mailtrap.models.contacts import CreateContactFieldParams
 from mailtrap.models.contacts import UpdateContactFieldParams
 
 
-class ContactFieldsApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
-        self._account_id = account_id
-        self._client = client
+class BaseContactFieldsApi(BaseAccountApi[ClientT]):
+    def _api_path(self, field_id: Optional[int] = None) -> str:
+        path = f"/api/accounts/{self._account_id}/contacts/fields"
+        if field_id is not None:
+            return f"{path}/{field_id}"
+        return path
+
 
+class ContactFieldsApi(BaseContactFieldsApi[HttpClient]):
     def get_list(self) -> list[ContactField]:
         """Get all Contact Fields existing in your account."""
-        response = self._client.get(self._api_path())
-        return [ContactField(**field) for field in response]
+        return self._client.get(
+            self._api_path(),
+            response_type=list[ContactField],
+            endpoint="contact_fields.get_list",
+        )
 
     def get_by_id(self, field_id: int) -> ContactField:
         """Get a contact Field by ID."""
         response = self._client.get(
-            self._api_path(field_id),
+            self._api_path(field_id), endpoint="contact_fields.get_by_id"
         )
         return ContactField(**response)
 
     def create(self, field_params: CreateContactFieldParams) -> ContactField:
         """Create new Contact Fields. Please note, you can have up to 40 fields."""
         response = self._client.post(
-            self._api_path(),
-            json=field_params.api_data,
+            self._api_path(), json=field_params.api_data, endpoint="contact_fields.create"
         )
         return ContactField(**response)
 
@@ -42,6 +51,7 @@ class ContactFieldsApi:
         response = self._client.patch(
             self._api_path(field_id),
             json=field_params.api_data,
+            endpoint="contact_fields.update",
         )
         return ContactField(**response)
 
@@ -51,11 +61,54 @@ class ContactFieldsApi:
         which is used in Automations, Email Campaigns (started or scheduled), and in
         conditions of Contact Segments (you'll see the corresponding error)
         """
-        self._client.delete(self._api_path(field_id))
+        self._client.delete(self._api_path(field_id), endpoint="contact_fields.delete")
         return DeletedObject(field_id)
 
-    def _api_path(self, field_id: Optional[int] = None) -> str:
-        path = f"/api/accounts/{self._account_id}/contacts/fields"
-        if field_id is not None:
-            return f"{path}/{field_id}"
-        return path
+
+class AsyncContactFieldsApi(BaseContactFieldsApi[AsyncHttpClient]):
+    async def get_list(self) -> list[ContactField]:
+        """Get all Contact Fields existing in your account."""
+        return await self._client.get(
+            self._api_path(),
+            response_type=list[ContactField],
+            endpoint="contact_fields.get_list",
+        )
+
+    async def get_by_id(self, field_id: int) -> ContactField:
+        """Get a contact Field by ID."""
+        response = await self._client.get(
+            self._api_path(field_id), endpoint="contact_fields.get_by_id"
+        )
+        return ContactField(**response)
+
+    async def create(self, field_params: CreateContactFieldParams) -> ContactField:
+        """Create new Contact Fields. Please note, you can have up to 40 fields."""
+        response = await self._client.post(
+            self._api_path(), json=field_params.api_data, endpoint="contact_fields.create"
+        )
+        return ContactField(**response)
+
+    async def update(
+        self, field_id: int, field_params: UpdateContactFieldParams
+    ) -> ContactField:
+        """
+        Update existing Contact Field. Please note,
+        you cannot change data_type of the field.
+        """
+        response = await self._client.patch(
+            self._api_path(field_id),
+            json=field_params.api_data,
+            endpoint="contact_fields.update",
+        )
+        return ContactField(**response)
+
+    async def delete(self, field_id: int) -> DeletedObject:
+        """
+        Delete existing Contact Field Please, note, you cannot delete a Contact Field
+        which is used in Automations, Email Campaigns (started or scheduled), and in
+        conditions of Contact Segments (you'll see the corresponding error)
+        """
+        await self._client.delete(
+            self._api_path(field_id), endpoint="contact_fields.delete"
+        )
+        return DeletedObject(field_id)
@@ -1,15 +1,28 @@
 from typing import Optional
 
+from mailtrap.api.resources.base import BaseAccountApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
+from mailtrap.models.common import dump_json_array
+from mailtrap.models.common import dump_json_object
 from mailtrap.models.contacts import ContactImport
 from mailtrap.models.contacts import ImportContactParams
 
 
-class ContactImportsApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
-        self._account_id = account_id
-        self._client = client
+class BaseContactImportsApi(BaseAccountApi[ClientT]):
+    @staticmethod
+    def _import_payload(contacts: list[ImportContactParams]) -> bytes:
+        return dump_json_object(contacts=dump_json_array(contacts))
 
+    def _api_path(self, import_id: Optional[int] = None) -> str:
+        path = f"/api/accounts/{self._account_id}/contacts/imports"
+        if import_id is not None:
+            return f"{path}/{import_id}"
+        return path
+
+
+class ContactImportsApi(BaseContactImportsApi[HttpClient]):
     def import_contacts(self, contacts: list[ImportContactParams]) -> ContactImport:
         """
         Import contacts in bulk with support for custom fields and list management.
@@ -19,17 +32,37 @@ class ContactImportsApi:
         """
         response = self._client.post(
             self._api_path(),
-            json={"contacts": [contact.api_data for contact in contacts]},
+            content=self._import_payload(contacts),
+            endpoint="contact_imports.import_contacts",
         )
         return ContactImport(**response)
 
     def get_by_id(self, import_id: int) -> ContactImport:
         """Get Contact Import by ID."""
-        response = self._client.get(self._api_path(import_id))
+        response = self._client.get(
+            self._api_path(import_id), endpoint="contact_imports.get_by_id"
+        )
         return ContactImport(**response)
 
-    def _api_path(self, import_id: Optional[int] = None) -> str:
-        path = f"/api/accounts/{self._account_id}/contacts/imports"
-        if import_id is not None:
-            return f"{path}/{import_id}"
-        return path
+
+class AsyncContactImportsApi(BaseContactImportsApi[AsyncHttpClient]):
+    async def import_contacts(self, contacts: list[ImportContactParams]) -> ContactImport:
+        """
+        Import contacts in bulk with support for custom fields and list management.
+        Existing contacts with matching email addresses will be updated automatically.
+        You can import up to 50,000 contacts per request. The import process runs
+        asynchronously - use the returned import ID to check the status and results.
+        """
+        response = await self._client.post(
+            self._api_path(),
+            content=self._import_payload(contacts),
+            endpoint="contact_imports.import_contacts",
+        )
+        return ContactImport(**response)
+
+    async def get_by_id(self, import_id: int) -> ContactImport:
+        """Get Contact Import by ID."""
+        response = await self._client.get(
+            self._api_path(import_id), endpoint="contact_imports.get_by_id"
+        )
+        return ContactImport(**response)
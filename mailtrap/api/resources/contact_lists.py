@@ -1,31 +1,42 @@
 from typing import Optional
 
+from mailtrap.api.resources.base import BaseAccountApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 from mailtrap.models.common import DeletedObject
 from mailtrap.models.contacts import ContactList
 from mailtrap.models.contacts import ContactListParams
 
 
-class ContactListsApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
-        self._account_id = account_id
-        self._client = client
+class BaseContactListsApi(BaseAccountApi[ClientT]):
+    def _api_path(self, list_id: Optional[int] = None) -> str:
+        path = f"/api/accounts/{self._account_id}/contacts/lists"
+        if list_id is not None:
+            return f"{path}/{list_id}"
+        return path
 
+
+class ContactListsApi(BaseContactListsApi[HttpClient]):
     def get_list(self) -> list[ContactList]:
         """Get all contact lists existing in your account."""
-        response = self._client.get(self._api_path())
-        return [ContactList(**field) for field in response]
+        return self._client.get(
+            self._api_path(),
+            response_type=list[ContactList],
+            endpoint="contact_lists.get_list",
+        )
 
     def get_by_id(self, list_id: int) -> ContactList:
         """Get a contact list by ID."""
-        response = self._client.get(self._api_path(list_id))
+        response = self._client.get(
+            self._api_path(list_id), endpoint="contact_lists.get_by_id"
+        )
         return ContactList(**response)
 
     def create(self, list_params: ContactListParams) -> ContactList:
         """Create new Contact Lists."""
         response = self._client.post(
-            self._api_path(),
-            json=list_params.api_data,
+            self._api_path(), json=list_params.api_data, endpoint="contact_lists.create"
         )
         return ContactList(**response)
 
@@ -34,16 +45,51 @@ class ContactListsApi:
         response = self._client.patch(
             self._api_path(list_id),
             json=list_params.api_data,
+            endpoint="contact_lists.update",
         )
         return ContactList(**response)
 
     def delete(self, list_id: int) -> DeletedObject:
         """Delete existing Contact List."""
-        self._client.delete(self._api_path(list_id))
+        self._client.delete(self._api_path(list_id), endpoint="contact_lists.delete")
         return DeletedObject(list_id)
 
-    def _api_path(self, list_id: Optional[int] = None) -> str:
-        path = f"/api/accounts/{self._account_id}/contacts/lists"
-        if list_id is not None:
-            return f"{path}/{list_id}"
-        return path
+
+class AsyncContactListsApi(BaseContactListsApi[AsyncHttpClient]):
+    async def get_list(self) -> list[ContactList]:
+        """Get all contact lists existing in your account."""
+        return await self._client.get(
+            self._api_path(),
+            response_type=list[ContactList],
+            endpoint="contact_lists.get_list",
+        )
+
+    async def get_by_id(self, list_id: int) -> ContactList:
+        """Get a contact list by ID."""
+        response = await self._client.get(
+            self._api_path(list_id), endpoint="contact_lists.get_by_id"
+        )
+        return ContactList(**response)
+
+    async def create(self, list_params: ContactListParams) -> ContactList:
+        """Create new Contact Lists."""
+        response = await self._client.post(
+            self._api_path(), json=list_params.api_data, endpoint="contact_lists.create"
+        )
+        return ContactList(**response)
+
+    async def update(self, list_id: int, list_params: ContactListParams) -> ContactList:
+        """Update existing Contact List."""
+        response = await self._client.patch(
+            self._api_path(list_id),
+            json=list_params.api_data,
+            endpoint="contact_lists.update",
+        )
+        return ContactList(**response)
+
+    async def delete(self, list_id: int) -> DeletedObject:
+        """Delete existing Contact List."""
+        await self._client.delete(
+            self._api_path(list_id), endpoint="contact_lists.delete"
+        )
+        return DeletedObject(list_id)
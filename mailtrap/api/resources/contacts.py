@@ -1,6 +1,10 @@
+from typing import Any
 from typing import Optional
 from urllib.parse import quote
 
+from mailtrap.api.resources.base import BaseAccountApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 from mailtrap.models.common import DeletedObject
 from mailtrap.models.contacts import Contact
@@ -9,23 +13,34 @@ from mailtrap.models.contacts import CreateContactParams
 from mailtrap.models.contacts import UpdateContactParams
 
 
-class ContactsApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
-        self._account_id = account_id
-        self._client = client
+class BaseContactsApi(BaseAccountApi[ClientT]):
+    @staticmethod
+    def _parse_contact(response: dict[str, Any]) -> Contact:
+        return ContactResponse(**response).data
+
+    def _api_path(self, contact_id_or_email: Optional[str] = None) -> str:
+        path = f"/api/accounts/{self._account_id}/contacts"
+        if contact_id_or_email is not None:
+            return f"{path}/{quote(contact_id_or_email, safe='')}"
+        return path
+
 
+class ContactsApi(BaseContactsApi[HttpClient]):
     def get_by_id(self, contact_id_or_email: str) -> Contact:
         """Get contact using id or email (URL encoded)."""
-        response = self._client.get(self._api_path(contact_id_or_email))
-        return ContactResponse(**response).data
+        response = self._client.get(
+            self._api_path(contact_id_or_email), endpoint="contacts.get_by_id"
+        )
+        return self._parse_contact(response)
 
     def create(self, contact_params: CreateContactParams) -> Contact:
         """Create a new contact."""
         response = self._client.post(
             self._api_path(),
             json={"contact": contact_params.api_data},
+            endpoint="contacts.create",
         )
-        return ContactResponse(**response).data
+        return self._parse_contact(response)
 
     def update(
         self, contact_id_or_email: str, contact_params: UpdateContactParams
@@ -34,16 +49,49 @@ class ContactsApi:
         response = self._client.patch(
             self._api_path(contact_id_or_email),
             json={"contact": contact_params.api_data},
+            endpoint="contacts.update",
         )
-        return ContactResponse(**response).data
+        return self._parse_contact(response)
 
     def delete(self, contact_id_or_email: str) -> DeletedObject:
         """Delete contact using id or email (URL encoded)."""
-        self._client.delete(self._api_path(contact_id_or_email))
+        self._client.delete(
+            self._api_path(contact_id_or_email), endpoint="contacts.delete"
+        )
         return DeletedObject(contact_id_or_email)
 
-    def _api_path(self, contact_id_or_email: Optional[str] = None) -> str:
-        path = f"/api/accounts/{self._account_id}/contacts"
-        if contact_id_or_email is not None:
-            return f"{path}/{quote(contact_id_or_email, safe='')}"
-        return path
+
+class AsyncContactsApi(BaseContactsApi[AsyncHttpClient]):
+    async def get_by_id(self, contact_id_or_email: str) -> Contact:
+        """Get contact using id or email (URL encoded)."""
+        response = await self._client.get(
+            self._api_path(contact_id_or_email), endpoint="contacts.get_by_id"
+        )
+        return self._parse_contact(response)
+
+    async def create(self, contact_params: CreateContactParams) -> Contact:
+        """Create a new contact."""
+        response = await self._client.post(
+            self._api_path(),
+            json={"contact": contact_params.api_data},
+            endpoint="contacts.create",
+        )
+        return self._parse_contact(response)
+
+    async def update(
+        self, contact_id_or_email: str, contact_params: UpdateContactParams
+    ) -> Contact:
+        """Update contact using id or email (URL encoded)."""
+        response = await self._client.patch(
+            self._api_path(contact_id_or_email),
+            json={"contact": contact_params.api_data},
+            endpoint="contacts.update",
+        )
+        return self._parse_contact(response)
+
+    async def delete(self, contact_id_or_email: str) -> DeletedObject:
+        """Delete contact using id or email (URL encoded)."""
+        await self._client.delete(
+            self._api_path(contact_id_or_email), endpoint="contacts.delete"
+        )
+        return DeletedObject(contact_id_or_email)
@@ -1,24 +1,68 @@
+import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
 from typing import Any
 from typing import Optional
 from typing import cast
 
+from mailtrap.api.resources.base import BaseAccountApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.config import DEFAULT_CHUNK_SIZE
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 from mailtrap.models.messages import AnalysisReport
 from mailtrap.models.messages import AnalysisReportResponse
 from mailtrap.models.messages import EmailMessage
 from mailtrap.models.messages import ForwardedMessage
+from mailtrap.models.messages import MessageBodyFormat
 from mailtrap.models.messages import SpamReport
 from mailtrap.models.messages import UpdateEmailMessageParams
 
 
-class MessagesApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
-        self._account_id = account_id
-        self._client = client
+class BaseMessagesApi(BaseAccountApi[ClientT]):
+    @staticmethod
+    def _list_params(
+        search: Optional[str] = None,
+        last_id: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if search:
+            params["search"] = search
+        if last_id:
+            params["last_id"] = last_id
+        if page:
+            params["page"] = page
+        return params
+
+    @staticmethod
+    def _parse_spam_report(response: dict[str, Any]) -> SpamReport:
+        return SpamReport(**response["report"])
+
+    @staticmethod
+    def _parse_mail_headers(response: dict[str, Any]) -> dict[str, Any]:
+        return cast(dict[str, Any], response["headers"])
+
+    def _api_path(self, inbox_id: int, message_id: Optional[int] = None) -> str:
+        path = f"/api/accounts/{self._account_id}/inboxes/{inbox_id}/messages"
+        if message_id:
+            return f"{path}/{message_id}"
+        return path
+
+    def _body_path(
+        self, inbox_id: int, message_id: int, body_format: MessageBodyFormat
+    ) -> str:
+        return f"{self._api_path(inbox_id, message_id)}/body.{body_format}"
 
+
+class MessagesApi(BaseMessagesApi[HttpClient]):
     def show_message(self, inbox_id: int, message_id: int) -> EmailMessage:
         """Get email message by ID."""
-        response = self._client.get(self._api_path(inbox_id, message_id))
+        response = self._client.get(
+            self._api_path(inbox_id, message_id), endpoint="messages.show_message"
+        )
         return EmailMessage(**response)
 
     def update(
@@ -31,12 +75,15 @@ class MessagesApi:
         response = self._client.patch(
             self._api_path(inbox_id, message_id),
             json={"message": message_params.api_data},
+            endpoint="messages.update",
         )
         return EmailMessage(**response)
 
     def delete(self, inbox_id: int, message_id: int) -> EmailMessage:
         """Delete message from inbox."""
-        response = self._client.delete(self._api_path(inbox_id, message_id))
+        response = self._client.delete(
+            self._api_path(inbox_id, message_id), endpoint="messages.delete"
+        )
         return EmailMessage(**response)
 
     def get_list(
@@ -76,16 +123,43 @@ class MessagesApi:
             - `last_id` has higher priority if both are provided.
             - Each response contains at most 30 messages.
         """
-        params: dict[str, Any] = {}
-        if search:
-            params["search"] = search
-        if last_id:
-            params["last_id"] = last_id
-        if page:
-            params["page"] = page
+        return self._client.get(
+            self._api_path(inbox_id),
+            params=self._list_params(search, last_id, page),
+            response_type=list[EmailMessage],
+            endpoint="messages.get_list",
+        )
+
+    def iter_messages(
+        self, inbox_id: int, search: Optional[str] = None, prefetch: bool = False
+    ) -> Iterator[EmailMessage]:
+        """
+        Iterate over all messages of the inbox, newest first.
+
+        Pages are requested one by one via `last_id` as the iteration goes,
+        so only a single page is held in memory. With `prefetch=True` the
+        next page is fetched in a background thread while the caller
+        processes the current one.
+        """
+        if not prefetch:
+            page = self.get_list(inbox_id, search=search)
+            while page:
+                yield from page
+                page = self.get_list(inbox_id, search=search, last_id=page[-1].id)
+            return
 
-        response = self._client.get(self._api_path(inbox_id), params=params)
-        return [EmailMessage(**message) for message in response]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = self.get_list(inbox_id, search=search)
+            while page:
+                next_page = executor.submit(
+                    self.get_list, inbox_id, search=search, last_id=page[-1].id
+                )
+                try:
+                    yield from page
+                except BaseException:
+                    next_page.cancel()
+                    raise
+                page = next_page.result()
 
     def forward(self, inbox_id: int, message_id: int, email: str) -> ForwardedMessage:
         """
@@ -93,60 +167,347 @@ class MessagesApi:
         The email address must be confirmed by the recipient in advance.
         """
         response = self._client.post(
-            f"{self._api_path(inbox_id, message_id)}/forward", json={"email": email}
+            f"{self._api_path(inbox_id, message_id)}/forward",
+            json={"email": email},
+            endpoint="messages.forward",
         )
         return ForwardedMessage(**response)
 
     def get_spam_report(self, inbox_id: int, message_id: int) -> SpamReport:
         """Get a brief spam report by message ID."""
-        response = self._client.get(f"{self._api_path(inbox_id, message_id)}/spam_report")
-        return SpamReport(**response["report"])
+        response = self._client.get(
+            f"{self._api_path(inbox_id, message_id)}/spam_report",
+            endpoint="messages.get_spam_report",
+        )
+        return self._parse_spam_report(response)
 
     def get_html_analysis(self, inbox_id: int, message_id: int) -> AnalysisReport:
         """Get a brief HTML report by message ID."""
-        response = self._client.get(f"{self._api_path(inbox_id, message_id)}/analyze")
+        response = self._client.get(
+            f"{self._api_path(inbox_id, message_id)}/analyze",
+            endpoint="messages.get_html_analysis",
+        )
         return AnalysisReportResponse(**response).report
 
     def get_text_message(self, inbox_id: int, message_id: int) -> str:
         """Get text email body, if it exists."""
         return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.txt")
+            str,
+            self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.txt",
+                endpoint="messages.get_text_message",
+            ),
         )
 
     def get_raw_message(self, inbox_id: int, message_id: int) -> str:
         """Get raw email body."""
         return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.raw")
+            str,
+            self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.raw",
+                endpoint="messages.get_raw_message",
+            ),
         )
 
     def get_html_source(self, inbox_id: int, message_id: int) -> str:
         """Get HTML source of email."""
         return cast(
             str,
-            self._client.get(f"{self._api_path(inbox_id, message_id)}/body.htmlsource"),
+            self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.htmlsource",
+                endpoint="messages.get_html_source",
+            ),
         )
 
     def get_html_message(self, inbox_id: int, message_id: int) -> str:
         """Get formatted HTML email body. Not applicable for plain text emails."""
         return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.html")
+            str,
+            self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.html",
+                endpoint="messages.get_html_message",
+            ),
         )
 
     def get_message_as_eml(self, inbox_id: int, message_id: int) -> str:
         """Get email message in .eml format."""
         return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.eml")
+            str,
+            self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.eml",
+                endpoint="messages.get_message_as_eml",
+            ),
         )
 
     def get_mail_headers(self, inbox_id: int, message_id: int) -> dict[str, Any]:
         """Get mail headers of a message."""
         response = self._client.get(
-            f"{self._api_path(inbox_id, message_id)}/mail_headers"
+            f"{self._api_path(inbox_id, message_id)}/mail_headers",
+            endpoint="messages.get_mail_headers",
         )
-        return cast(dict[str, Any], response["headers"])
+        return self._parse_mail_headers(response)
 
-    def _api_path(self, inbox_id: int, message_id: Optional[int] = None) -> str:
-        path = f"/api/accounts/{self._account_id}/inboxes/{inbox_id}/messages"
-        if message_id:
-            return f"{path}/{message_id}"
-        return path
+    def get_body_bytes(
+        self,
+        inbox_id: int,
+        message_id: int,
+        body_format: MessageBodyFormat = "eml",
+    ) -> bytes:
+        """
+        Get a message body (`raw`, `eml`, `htmlsource`, `html` or `txt`) as
+        undecoded bytes, e.g. to save or hash it.
+        """
+        return self._client.get_bytes(
+            self._body_path(inbox_id, message_id, body_format),
+            endpoint="messages.get_body_bytes",
+        )
+
+    def stream_body(
+        self,
+        inbox_id: int,
+        message_id: int,
+        body_format: MessageBodyFormat = "eml",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Get a message body (`raw`, `eml`, `htmlsource`, `html` or `txt`)
+        as an iterator of byte chunks, without loading it into memory.
+        """
+        return self._client.stream(
+            self._body_path(inbox_id, message_id, body_format),
+            chunk_size,
+            endpoint="messages.stream_body",
+        )
+
+    def download_body(
+        self,
+        inbox_id: int,
+        message_id: int,
+        file: IO[bytes],
+        body_format: MessageBodyFormat = "eml",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Write a message body to a binary file object chunk by chunk.
+        Returns the number of bytes written.
+        """
+        size = 0
+        for chunk in self.stream_body(inbox_id, message_id, body_format, chunk_size):
+            file.write(chunk)
+            size += len(chunk)
+        return size
+
+
+class AsyncMessagesApi(BaseMessagesApi[AsyncHttpClient]):
+    async def show_message(self, inbox_id: int, message_id: int) -> EmailMessage:
+        """Get email message by ID."""
+        response = await self._client.get(
+            self._api_path(inbox_id, message_id), endpoint="messages.show_message"
+        )
+        return EmailMessage(**response)
+
+    async def update(
+        self, inbox_id: int, message_id: int, message_params: UpdateEmailMessageParams
+    ) -> EmailMessage:
+        """
+        Update message attributes
+        (right now only the **is_read** attribute is available for modification).
+        """
+        response = await self._client.patch(
+            self._api_path(inbox_id, message_id),
+            json={"message": message_params.api_data},
+            endpoint="messages.update",
+        )
+        return EmailMessage(**response)
+
+    async def delete(self, inbox_id: int, message_id: int) -> EmailMessage:
+        """Delete message from inbox."""
+        response = await self._client.delete(
+            self._api_path(inbox_id, message_id), endpoint="messages.delete"
+        )
+        return EmailMessage(**response)
+
+    async def get_list(
+        self,
+        inbox_id: int,
+        search: Optional[str] = None,
+        last_id: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> list[EmailMessage]:
+        """
+        Get messages from the inbox, up to 30 messages per request.
+        See `MessagesApi.get_list` for the description of the parameters.
+        """
+        return await self._client.get(
+            self._api_path(inbox_id),
+            params=self._list_params(search, last_id, page),
+            response_type=list[EmailMessage],
+            endpoint="messages.get_list",
+        )
+
+    async def iter_messages(
+        self, inbox_id: int, search: Optional[str] = None, prefetch: bool = False
+    ) -> AsyncIterator[EmailMessage]:
+        """
+        Iterate over all messages of the inbox, newest first.
+        See `MessagesApi.iter_messages`, with `prefetch=True` the next page
+        is fetched in a separate task.
+        """
+        page = await self.get_list(inbox_id, search=search)
+        while page:
+            last_id = page[-1].id
+            if not prefetch:
+                for message in page:
+                    yield message
+                page = await self.get_list(inbox_id, search=search, last_id=last_id)
+                continue
+
+            next_page = asyncio.ensure_future(
+                self.get_list(inbox_id, search=search, last_id=last_id)
+            )
+            try:
+                for message in page:
+                    yield message
+            except BaseException:
+                next_page.cancel()
+                raise
+            page = await next_page
+
+    async def forward(
+        self, inbox_id: int, message_id: int, email: str
+    ) -> ForwardedMessage:
+        """
+        Forward message to an email address.
+        The email address must be confirmed by the recipient in advance.
+        """
+        response = await self._client.post(
+            f"{self._api_path(inbox_id, message_id)}/forward",
+            json={"email": email},
+            endpoint="messages.forward",
+        )
+        return ForwardedMessage(**response)
+
+    async def get_spam_report(self, inbox_id: int, message_id: int) -> SpamReport:
+        """Get a brief spam report by message ID."""
+        response = await self._client.get(
+            f"{self._api_path(inbox_id, message_id)}/spam_report",
+            endpoint="messages.get_spam_report",
+        )
+        return self._parse_spam_report(response)
+
+    async def get_html_analysis(self, inbox_id: int, message_id: int) -> AnalysisReport:
+        """Get a brief HTML report by message ID."""
+        response = await self._client.get(
+            f"{self._api_path(inbox_id, message_id)}/analyze",
+            endpoint="messages.get_html_analysis",
+        )
+        return AnalysisReportResponse(**response).report
+
+    async def get_text_message(self, inbox_id: int, message_id: int) -> str:
+        """Get text email body, if it exists."""
+        return cast(
+            str,
+            await self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.txt",
+                endpoint="messages.get_text_message",
+            ),
+        )
+
+    async def get_raw_message(self, inbox_id: int, message_id: int) -> str:
+        """Get raw email body."""
+        return cast(
+            str,
+            await self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.raw",
+                endpoint="messages.get_raw_message",
+            ),
+        )
+
+    async def get_html_source(self, inbox_id: int, message_id: int) -> str:
+        """Get HTML source of email."""
+        return cast(
+            str,
+            await self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.htmlsource",
+                endpoint="messages.get_html_source",
+            ),
+        )
+
+    async def get_html_message(self, inbox_id: int, message_id: int) -> str:
+        """Get formatted HTML email body. Not applicable for plain text emails."""
+        return cast(
+            str,
+            await self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.html",
+                endpoint="messages.get_html_message",
+            ),
+        )
+
+    async def get_message_as_eml(self, inbox_id: int, message_id: int) -> str:
+        """Get email message in .eml format."""
+        return cast(
+            str,
+            await self._client.get(
+                f"{self._api_path(inbox_id, message_id)}/body.eml",
+                endpoint="messages.get_message_as_eml",
+            ),
+        )
+
+    async def get_mail_headers(self, inbox_id: int, message_id: int) -> dict[str, Any]:
+        """Get mail headers of a message."""
+        response = await self._client.get(
+            f"{self._api_path(inbox_id, message_id)}/mail_headers",
+            endpoint="messages.get_mail_headers",
+        )
+        return self._parse_mail_headers(response)
+
+    async def get_body_bytes(
+        self,
+        inbox_id: int,
+        message_id: int,
+        body_format: MessageBodyFormat = "eml",
+    ) -> bytes:
+        """
+        Get a message body (`raw`, `eml`, `htmlsource`, `html` or `txt`) as
+        undecoded bytes, e.g. to save or hash it.
+        """
+        return await self._client.get_bytes(
+            self._body_path(inbox_id, message_id, body_format),
+            endpoint="messages.get_body_bytes",
+        )
+
+    def stream_body(
+        self,
+        inbox_id: int,
+        message_id: int,
+        body_format: MessageBodyFormat = "eml",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Get a message body (`raw`, `eml`, `htmlsource`, `html` or `txt`)
+        as an async iterator of byte chunks, without loading it into memory.
+        """
+        return self._client.stream(
+            self._body_path(inbox_id, message_id, body_format),
+            chunk_size,
+            endpoint="messages.stream_body",
+        )
+
+    async def download_body(
+        self,
+        inbox_id: int,
+        message_id: int,
+        file: IO[bytes],
+        body_format: MessageBodyFormat = "eml",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Write a message body to a binary file object chunk by chunk.
+        Returns the number of bytes written.
+        """
+        size = 0
+        body = self.stream_body(inbox_id, message_id, body_format, chunk_size)
+        async for chunk in body:
+            file.write(chunk)
+            size += len(chunk)
+        return size
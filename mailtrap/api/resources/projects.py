@@ -1,24 +1,34 @@
 from typing import Optional
 
+from mailtrap.api.resources.base import BaseAccountApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 from mailtrap.models.common import DeletedObject
 from mailtrap.models.projects import Project
 from mailtrap.models.projects import ProjectParams
 
 
-class ProjectsApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
-        self._account_id = account_id
-        self._client = client
+class BaseProjectsApi(BaseAccountApi[ClientT]):
+    def _api_path(self, project_id: Optional[int] = None) -> str:
+        path = f"/api/accounts/{self._account_id}/projects"
+        if project_id:
+            return f"{path}/{project_id}"
+        return path
+
 
+class ProjectsApi(BaseProjectsApi[HttpClient]):
     def get_list(self) -> list[Project]:
         """List projects and their inboxes to which the API token has access."""
-        response = self._client.get(self._api_path())
-        return [Project(**project) for project in response]
+        return self._client.get(
+            self._api_path(), response_type=list[Project], endpoint="projects.get_list"
+        )
 
     def get_by_id(self, project_id: int) -> Project:
         """Get the project and its inboxes."""
-        response = self._client.get(self._api_path(project_id))
+        response = self._client.get(
+            self._api_path(project_id), endpoint="projects.get_by_id"
+        )
         return Project(**response)
 
     def create(self, project_params: ProjectParams) -> Project:
@@ -29,6 +39,7 @@ class ProjectsApi:
         response = self._client.post(
             self._api_path(),
             json={"project": project_params.api_data},
+            endpoint="projects.create",
         )
         return Project(**response)
 
@@ -40,16 +51,59 @@ class ProjectsApi:
         response = self._client.patch(
             self._api_path(project_id),
             json={"project": project_params.api_data},
+            endpoint="projects.update",
         )
         return Project(**response)
 
     def delete(self, project_id: int) -> DeletedObject:
         """Delete project and its inboxes."""
-        response = self._client.delete(self._api_path(project_id))
+        response = self._client.delete(
+            self._api_path(project_id), endpoint="projects.delete"
+        )
         return DeletedObject(**response)
 
-    def _api_path(self, project_id: Optional[int] = None) -> str:
-        path = f"/api/accounts/{self._account_id}/projects"
-        if project_id:
-            return f"{path}/{project_id}"
-        return path
+
+class AsyncProjectsApi(BaseProjectsApi[AsyncHttpClient]):
+    async def get_list(self) -> list[Project]:
+        """List projects and their inboxes to which the API token has access."""
+        return await self._client.get(
+            self._api_path(), response_type=list[Project], endpoint="projects.get_list"
+        )
+
+    async def get_by_id(self, project_id: int) -> Project:
+        """Get the project and its inboxes."""
+        response = await self._client.get(
+            self._api_path(project_id), endpoint="projects.get_by_id"
+        )
+        return Project(**response)
+
+    async def create(self, project_params: ProjectParams) -> Project:
+        """
+        Create a new project.
+        The project name is min 2 characters and max 100 characters long.
+        """
+        response = await self._client.post(
+            self._api_path(),
+            json={"project": project_params.api_data},
+            endpoint="projects.create",
+        )
+        return Project(**response)
+
+    async def update(self, project_id: int, project_params: ProjectParams) -> Project:
+        """
+        Update project name.
+        The project name is min 2 characters and max 100 characters long.
+        """
+        response = await self._client.patch(
+            self._api_path(project_id),
+            json={"project": project_params.api_data},
+            endpoint="projects.update",
+        )
+        return Project(**response)
+
+    async def delete(self, project_id: int) -> DeletedObject:
+        """Delete project and its inboxes."""
+        response = await self._client.delete(
+            self._api_path(project_id), endpoint="projects.delete"
+        )
+        return DeletedObject(**response)
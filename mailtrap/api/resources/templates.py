@@ -1,5 +1,8 @@
 from typing import Optional
 
+from mailtrap.api.resources.base import BaseAccountApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 from mailtrap.models.common import DeletedObject
 from mailtrap.models.templates import CreateEmailTemplateParams
@@ -7,19 +10,28 @@ from mailtrap.models.templates import EmailTemplate
 from mailtrap.models.templates import UpdateEmailTemplateParams
 
 
-class TemplatesApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
-        self._account_id = account_id
-        self._client = client
+class BaseTemplatesApi(BaseAccountApi[ClientT]):
+    def _api_path(self, template_id: Optional[int] = None) -> str:
+        path = f"/api/accounts/{self._account_id}/email_templates"
+        if template_id:
+            return f"{path}/{template_id}"
+        return path
 
+
+class TemplatesApi(BaseTemplatesApi[HttpClient]):
     def get_list(self) -> list[EmailTemplate]:
         """Get all email templates existing in your account."""
-        response = self._client.get(self._api_path())
-        return [EmailTemplate(**template) for template in response]
+        return self._client.get(
+            self._api_path(),
+            response_type=list[EmailTemplate],
+            endpoint="templates.get_list",
+        )
 
     def get_by_id(self, template_id: int) -> EmailTemplate:
         """Get an email template by ID."""
-        response = self._client.get(self._api_path(template_id))
+        response = self._client.get(
+            self._api_path(template_id), endpoint="templates.get_by_id"
+        )
         return EmailTemplate(**response)
 
     def create(self, template_params: CreateEmailTemplateParams) -> EmailTemplate:
@@ -27,6 +39,7 @@ class TemplatesApi:
         response = self._client.post(
             self._api_path(),
             json={"email_template": template_params.api_data},
+            endpoint="templates.create",
         )
         return EmailTemplate(**response)
 
@@ -37,16 +50,55 @@ class TemplatesApi:
         response = self._client.patch(
             self._api_path(template_id),
             json={"email_template": template_params.api_data},
+            endpoint="templates.update",
         )
         return EmailTemplate(**response)
 
     def delete(self, template_id: int) -> DeletedObject:
         """Delete an email template."""
-        self._client.delete(self._api_path(template_id))
+        self._client.delete(self._api_path(template_id), endpoint="templates.delete")
         return DeletedObject(template_id)
 
-    def _api_path(self, template_id: Optional[int] = None) -> str:
-        path = f"/api/accounts/{self._account_id}/email_templates"
-        if template_id:
-            return f"{path}/{template_id}"
-        return path
+
+class AsyncTemplatesApi(BaseTemplatesApi[AsyncHttpClient]):
+    async def get_list(self) -> list[EmailTemplate]:
+        """Get all email templates existing in your account."""
+        return await self._client.get(
+            self._api_path(),
+            response_type=list[EmailTemplate],
+            endpoint="templates.get_list",
+        )
+
+    async def get_by_id(self, template_id: int) -> EmailTemplate:
+        """Get an email template by ID."""
+        response = await self._client.get(
+            self._api_path(template_id), endpoint="templates.get_by_id"
+        )
+        return EmailTemplate(**response)
+
+    async def create(self, template_params: CreateEmailTemplateParams) -> EmailTemplate:
+        """Create a new email template."""
+        response = await self._client.post(
+            self._api_path(),
+            json={"email_template": template_params.api_data},
+            endpoint="templates.create",
+        )
+        return EmailTemplate(**response)
+
+    async def update(
+        self, template_id: int, template_params: UpdateEmailTemplateParams
+    ) -> EmailTemplate:
+        """Update an email template."""
+        response = await self._client.patch(
+            self._api_path(template_id),
+            json={"email_template": template_params.api_data},
+            endpoint="templates.update",
+        )
+        return EmailTemplate(**response)
+
+    async def delete(self, template_id: int) -> DeletedObject:
+        """Delete an email template."""
+        await self._client.delete(
+            self._api_path(template_id), endpoint="templates.delete"
+        )
+        return DeletedObject(template_id)
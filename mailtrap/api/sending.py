@@ -1,14 +1,56 @@
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures import wait
+from itertools import islice
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
 from typing import Optional
 
+from requests import RequestException
+
+from mailtrap.api.resources.base import ClientT
+from mailtrap.config import DEFAULT_POOL_MAXSIZE
+from mailtrap.config import MAX_BATCH_SIZE
+from mailtrap.dedup import IDEMPOTENCY_KEY_HEADER
+from mailtrap.dedup import DedupCache
+from mailtrap.dedup import get_idempotency_key
+from mailtrap.exceptions import APIError
+from mailtrap.exceptions import AuthorizationError
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
+from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dump_json_array
+from mailtrap.models.common import dump_json_object
 from mailtrap.models.mail.base import BaseMail
 from mailtrap.models.mail.base import SendingMailResponse
+from mailtrap.models.mail.base import SendResult
+from mailtrap.models.mail.batch import BatchEmailRequest
+from mailtrap.models.mail.batch import BatchMail
+from mailtrap.models.mail.batch import BatchSendResponse
+from mailtrap.models.mail.batch import BatchSendResponseItem
+
+if TYPE_CHECKING:
+    import asyncio
 
 
-class SendingApi:
-    def __init__(self, client: HttpClient, inbox_id: Optional[str] = None) -> None:
+class BaseSendingApi(Generic[ClientT]):
+    def __init__(
+        self,
+        client: ClientT,
+        inbox_id: Optional[str] = None,
+        dedup_cache: Optional[DedupCache] = None,
+    ) -> None:
         self._inbox_id = inbox_id
-        self._client = client
+        self._client: ClientT = client
+        self._dedup_cache = dedup_cache
 
     @property
     def _api_url(self) -> str:
@@ -17,7 +59,381 @@ class SendingApi:
             return f"{url}/{self._inbox_id}"
         return url
 
-    def send(self, mail: BaseMail) -> SendingMailResponse:
-        """Send email (text, html, text&html, templates)."""
-        response = self._client.post(self._api_url, json=mail.api_data)
-        return SendingMailResponse(**response)
+    @property
+    def _batch_api_url(self) -> str:
+        url = "/api/batch"
+        if self._inbox_id:
+            return f"{url}/{self._inbox_id}"
+        return url
+
+    def _get_idempotency_key(
+        self, payload: bytes, idempotency_key: Optional[str]
+    ) -> Optional[str]:
+        if idempotency_key is None and self._dedup_cache is not None:
+            return get_idempotency_key(payload)
+        return idempotency_key
+
+    def _send_options(self, idempotency_key: Optional[str]) -> dict[str, Any]:
+        """Sends with a key are retried only if the retry policy opts in."""
+        if idempotency_key is None:
+            return {}
+        retry_policy = self._client.retry_policy
+        return {
+            "idempotent": retry_policy is not None and retry_policy.retry_keyed_sends,
+            "headers": {IDEMPOTENCY_KEY_HEADER: idempotency_key},
+        }
+
+    def _get_sent(self, idempotency_key: Optional[str]) -> Optional[SendingMailResponse]:
+        if idempotency_key is None or self._dedup_cache is None:
+            return None
+        return self._dedup_cache.get(idempotency_key)
+
+    def _record_sent(
+        self, idempotency_key: Optional[str], response: SendingMailResponse
+    ) -> None:
+        if idempotency_key is not None and self._dedup_cache is not None:
+            if response.success:
+                self._dedup_cache.add(idempotency_key, response)
+
+    @staticmethod
+    def _batch_payload(
+        base: Optional[BatchMail], requests: Sequence[RequestParams]
+    ) -> bytes:
+        if not 1 <= len(requests) <= MAX_BATCH_SIZE:
+            raise ValueError(f"A batch must contain 1 to {MAX_BATCH_SIZE} emails")
+        if base is None:
+            return dump_json_object(requests=dump_json_array(requests))
+        return dump_json_object(
+            base=base.to_json_bytes(), requests=dump_json_array(requests)
+        )
+
+    @staticmethod
+    def _encoded_batch_payload(requests: Sequence[bytes]) -> bytes:
+        if not 1 <= len(requests) <= MAX_BATCH_SIZE:
+            raise ValueError(f"A batch must contain 1 to {MAX_BATCH_SIZE} emails")
+        return dump_json_object(requests=b"[" + b",".join(requests) + b"]")
+
+    @staticmethod
+    def _chunks(mails: Iterable[BaseMail], batch_size: int) -> Iterator[list[BaseMail]]:
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+
+        iterator = iter(mails)
+        while chunk := list(islice(iterator, batch_size)):
+            yield chunk
+
+    @classmethod
+    def _parse_batch_response(
+        cls, response: dict[str, Any], size: int
+    ) -> list[BatchSendResponseItem]:
+        batch_response = BatchSendResponse(**response)
+        if not batch_response.responses:
+            errors = batch_response.errors or ["Batch was not processed"]
+            return cls._failed_batch(errors, size)
+        if len(batch_response.responses) != size:
+            # Results can't be matched to emails, none is known to be sent
+            errors = [
+                f"Expected {size} results in the batch response, "
+                f"got {len(batch_response.responses)}"
+            ]
+            return cls._failed_batch(errors, size)
+        return batch_response.responses
+
+    @staticmethod
+    def _failed_batch(errors: list[str], size: int) -> list[BatchSendResponseItem]:
+        return [
+            BatchSendResponseItem(success=False, errors=list(errors)) for _ in range(size)
+        ]
+
+    @staticmethod
+    def _max_pending(concurrency: int) -> int:
+        """
+        How many emails may be taken from the input ahead of the results.
+
+        Twice the concurrency keeps every worker busy while the caller is
+        still handling finished results, without reading the whole input.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        return concurrency * 2
+
+
+class SendingApi(BaseSendingApi[HttpClient]):
+    def send(
+        self, mail: BaseMail, idempotency_key: Optional[str] = None
+    ) -> SendingMailResponse:
+        """
+        Send email (text, html, text&html, templates).
+
+        A send with `idempotency_key` carries it in the `Idempotency-Key`
+        header, and is retried if the client's retry policy has
+        `retry_keyed_sends` enabled. With a
+        `DedupCache`, the key defaults to the hash of the email and repeated
+        sends within the cache window return the recorded response.
+        """
+        payload = mail.to_json_bytes()
+        key = self._get_idempotency_key(payload, idempotency_key)
+        sent = self._get_sent(key)
+        if sent is not None:
+            return sent
+
+        response = self._client.post(
+            self._api_url,
+            content=payload,
+            **self._send_options(key),
+            endpoint="sending.send",
+        )
+        sending_response = SendingMailResponse(**response)
+        self._record_sent(key, sending_response)
+        return sending_response
+
+    def send_batch(
+        self,
+        base: Optional[BatchMail],
+        requests: Sequence[BatchEmailRequest],
+    ) -> BatchSendResponse:
+        """
+        Send up to 500 emails in one request. Fields of `base` are shared by
+        all messages, each request only has to provide recipients and overrides.
+        Results in `responses` are in the same order as `requests`.
+        """
+        response = self._client.post(
+            self._batch_api_url,
+            content=self._batch_payload(base, requests),
+            endpoint="sending.send_batch",
+        )
+        return BatchSendResponse(**response)
+
+    def send_encoded_batch(
+        self, requests: Sequence[bytes]
+    ) -> list[BatchSendResponseItem]:
+        """
+        Send emails that are already serialized with `to_json_bytes()`, e.g.
+        restored from a spool, in one batch request.
+        Returns a result per email in input order.
+        """
+        response = self._client.post(
+            self._batch_api_url,
+            content=self._encoded_batch_payload(requests),
+            endpoint="sending.send_encoded_batch",
+        )
+        return self._parse_batch_response(response, len(requests))
+
+    def send_in_batches(
+        self, mails: Iterable[BaseMail], batch_size: int = MAX_BATCH_SIZE
+    ) -> list[BatchSendResponseItem]:
+        """
+        Send any number of emails through the batch endpoint, `batch_size`
+        emails per request. The iterable is consumed lazily, one batch at a time.
+
+        Returns a result per email in input order. When a whole batch is
+        rejected or can't be sent because of a network error, each of its
+        emails gets a failed result with the errors, and the next batches
+        are still sent.
+        """
+        results: list[BatchSendResponseItem] = []
+        for chunk in self._chunks(mails, batch_size):
+            payload = self._batch_payload(None, chunk)
+            try:
+                response = self._client.post(
+                    self._batch_api_url,
+                    content=payload,
+                    endpoint="sending.send_in_batches",
+                )
+            except AuthorizationError:
+                raise
+            except APIError as exc:
+                results.extend(self._failed_batch(exc.errors, len(chunk)))
+            except RequestException as exc:
+                results.extend(self._failed_batch([str(exc)], len(chunk)))
+            else:
+                results.extend(self._parse_batch_response(response, len(chunk)))
+        return results
+
+    def send_many(
+        self,
+        mails: Iterable[BaseMail],
+        concurrency: int = DEFAULT_POOL_MAXSIZE,
+        ordered: bool = True,
+    ) -> Iterator[SendResult]:
+        """
+        Send emails one by one from `concurrency` threads sharing this client.
+
+        Yields a `SendResult` per email, in input order or, with
+        `ordered=False`, as soon as each send completes. A failed send is
+        reported in `SendResult.error` and doesn't stop the others.
+
+        The iterable is consumed lazily, only a few emails ahead of the
+        results, so it can be an arbitrarily long generator. Emails that
+        weren't submitted yet are not sent if the iteration is abandoned.
+        Keep `concurrency` within the client's `pool_maxsize`, otherwise
+        connections are not reused.
+        """
+        max_pending = self._max_pending(concurrency)
+        executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="mailtrap-send"
+        )
+        try:
+            if ordered:
+                queue: deque[Future[SendResult]] = deque()
+                for index, mail in enumerate(mails):
+                    queue.append(executor.submit(self._send_result, index, mail))
+                    if len(queue) >= max_pending:
+                        yield queue.popleft().result()
+                while queue:
+                    yield queue.popleft().result()
+                return
+
+            pending: set[Future[SendResult]] = set()
+            for index, mail in enumerate(mails):
+                pending.add(executor.submit(self._send_result, index, mail))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _send_result(self, index: int, mail: BaseMail) -> SendResult:
+        try:
+            response = self.send(mail)
+        except Exception as exc:
+            return SendResult(index=index, mail=mail, error=exc)
+        return SendResult(index=index, mail=mail, response=response)
+
+
+class AsyncSendingApi(BaseSendingApi[AsyncHttpClient]):
+    async def send(
+        self, mail: BaseMail, idempotency_key: Optional[str] = None
+    ) -> SendingMailResponse:
+        """
+        Send email (text, html, text&html, templates).
+        See `SendingApi.send` for `idempotency_key`.
+        """
+        payload = mail.to_json_bytes()
+        key = self._get_idempotency_key(payload, idempotency_key)
+        sent = self._get_sent(key)
+        if sent is not None:
+            return sent
+
+        response = await self._client.post(
+            self._api_url,
+            content=payload,
+            **self._send_options(key),
+            endpoint="sending.send",
+        )
+        sending_response = SendingMailResponse(**response)
+        self._record_sent(key, sending_response)
+        return sending_response
+
+    async def send_batch(
+        self,
+        base: Optional[BatchMail],
+        requests: Sequence[BatchEmailRequest],
+    ) -> BatchSendResponse:
+        """
+        Send up to 500 emails in one request. Fields of `base` are shared by
+        all messages, each request only has to provide recipients and overrides.
+        Results in `responses` are in the same order as `requests`.
+        """
+        response = await self._client.post(
+            self._batch_api_url,
+            content=self._batch_payload(base, requests),
+            endpoint="sending.send_batch",
+        )
+        return BatchSendResponse(**response)
+
+    async def send_encoded_batch(
+        self, requests: Sequence[bytes]
+    ) -> list[BatchSendResponseItem]:
+        """
+        Send emails that are already serialized with `to_json_bytes()` in one
+        batch request. See `SendingApi.send_encoded_batch`.
+        """
+        response = await self._client.post(
+            self._batch_api_url,
+            content=self._encoded_batch_payload(requests),
+            endpoint="sending.send_encoded_batch",
+        )
+        return self._parse_batch_response(response, len(requests))
+
+    async def send_in_batches(
+        self, mails: Iterable[BaseMail], batch_size: int = MAX_BATCH_SIZE
+    ) -> list[BatchSendResponseItem]:
+        """
+        Send any number of emails through the batch endpoint, `batch_size`
+        emails per request. See `SendingApi.send_in_batches`.
+        """
+        import httpx
+
+        results: list[BatchSendResponseItem] = []
+        for chunk in self._chunks(mails, batch_size):
+            payload = self._batch_payload(None, chunk)
+            try:
+                response = await self._client.post(
+                    self._batch_api_url,
+                    content=payload,
+                    endpoint="sending.send_in_batches",
+                )
+            except AuthorizationError:
+                raise
+            except APIError as exc:
+                results.extend(self._failed_batch(exc.errors, len(chunk)))
+            except httpx.TransportError as exc:
+                results.extend(self._failed_batch([str(exc)], len(chunk)))
+            else:
+                results.extend(self._parse_batch_response(response, len(chunk)))
+        return results
+
+    async def send_many(
+        self,
+        mails: Iterable[BaseMail],
+        concurrency: int = DEFAULT_POOL_MAXSIZE,
+        ordered: bool = True,
+    ) -> AsyncIterator[SendResult]:
+        """
+        Send emails one by one with up to `concurrency` requests in flight.
+        See `SendingApi.send_many`.
+        """
+        import asyncio
+
+        max_pending = self._max_pending(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        pending: deque[asyncio.Future[SendResult]] = deque()
+        try:
+            for index, mail in enumerate(mails):
+                pending.append(
+                    asyncio.ensure_future(self._send_result(semaphore, index, mail))
+                )
+                if len(pending) < max_pending:
+                    continue
+                if ordered:
+                    yield await pending.popleft()
+                    continue
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.remove(task)
+                    yield task.result()
+
+            if ordered:
+                while pending:
+                    yield await pending.popleft()
+            else:
+                for next_done in asyncio.as_completed(list(pending)):
+                    yield await next_done
+                pending.clear()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_result(
+        self, semaphore: "asyncio.Semaphore", index: int, mail: BaseMail
+    ) -> SendResult:
+        async with semaphore:
+            try:
+                response = await self.send(mail)
+            except Exception as exc:
+                return SendResult(index=index, mail=mail, error=exc)
+        return SendResult(index=index, mail=mail, response=response)
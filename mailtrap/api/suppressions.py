@@ -1,4 +1,6 @@
+from mailtrap.api.resources.suppressions import AsyncSuppressionsApi
 from mailtrap.api.resources.suppressions import SuppressionsApi
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 
 
@@ -10,3 +12,13 @@ class SuppressionsBaseApi:
     @property
     def suppressions(self) -> SuppressionsApi:
         return SuppressionsApi(account_id=self._account_id, client=self._client)
+
+
+class AsyncSuppressionsBaseApi:
+    def __init__(self, client: AsyncHttpClient, account_id: str) -> None:
+        self._account_id = account_id
+        self._client = client
+
+    @property
+    def suppressions(self) -> AsyncSuppressionsApi:
+        return AsyncSuppressionsApi(account_id=self._account_id, client=self._client)
@@ -1,4 +1,6 @@
+from mailtrap.api.resources.templates import AsyncTemplatesApi
 from mailtrap.api.resources.templates import TemplatesApi
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 
 
@@ -10,3 +12,13 @@ class EmailTemplatesApi:
     @property
     def templates(self) -> TemplatesApi:
         return TemplatesApi(account_id=self._account_id, client=self._client)
+
+
+class AsyncEmailTemplatesApi:
+    def __init__(self, client: AsyncHttpClient, account_id: str) -> None:
+        self._account_id = account_id
+        self._client = client
+
+    @property
+    def templates(self) -> AsyncTemplatesApi:
+        return AsyncTemplatesApi(account_id=self._account_id, client=self._client)
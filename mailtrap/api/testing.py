@@ -1,9 +1,14 @@
 from typing import Optional
 
+from mailtrap.api.resources.attachments import AsyncAttachmentsApi
 from mailtrap.api.resources.attachments import AttachmentsApi
+from mailtrap.api.resources.inboxes import AsyncInboxesApi
 from mailtrap.api.resources.inboxes import InboxesApi
+from mailtrap.api.resources.messages import AsyncMessagesApi
 from mailtrap.api.resources.messages import MessagesApi
+from mailtrap.api.resources.projects import AsyncProjectsApi
 from mailtrap.api.resources.projects import ProjectsApi
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
 
 
@@ -30,3 +35,28 @@ class TestingApi:
     @property
     def attachments(self) -> AttachmentsApi:
         return AttachmentsApi(account_id=self._account_id, client=self._client)
+
+
+class AsyncTestingApi:
+    def __init__(
+        self, client: AsyncHttpClient, account_id: str, inbox_id: Optional[str] = None
+    ) -> None:
+        self._account_id = account_id
+        self._inbox_id = inbox_id
+        self._client = client
+
+    @property
+    def projects(self) -> AsyncProjectsApi:
+        return AsyncProjectsApi(account_id=self._account_id, client=self._client)
+
+    @property
+    def inboxes(self) -> AsyncInboxesApi:
+        return AsyncInboxesApi(account_id=self._account_id, client=self._client)
+
+    @property
+    def messages(self) -> AsyncMessagesApi:
+        return AsyncMessagesApi(account_id=self._account_id, client=self._client)
+
+    @property
+    def attachments(self) -> AsyncAttachmentsApi:
+        return AsyncAttachmentsApi(account_id=self._account_id, client=self._client)
@@ -0,0 +1,152 @@
+import hashlib
+import mimetypes
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+from typing import Union
+
+from mailtrap.models.mail.attachment import Attachment
+from mailtrap.models.mail.attachment import AttachmentContent
+from mailtrap.models.mail.attachment import Disposition
+from mailtrap.models.mail.attachment import StrPath
+
+DEFAULT_ATTACHMENT_CACHE_SIZE = 64 * 1024 * 1024  # bytes of encoded content
+
+_FileStat = tuple[str, int, int]
+
+
+class AttachmentCache:
+    """
+    Size-bounded cache of base64-encoded attachments, keyed by the SHA-256
+    of their data.
+
+    Attachments created through the cache share one encoded copy, so a file
+    attached to many emails is read and encoded once:
+
+        cache = AttachmentCache()
+        terms = cache.attachment("terms.pdf")
+        mails = [mt.Mail(..., attachments=[terms]) for ...]
+
+    Once the encoded contents exceed `max_bytes` the least recently used
+    ones are evicted. Emails still referencing them keep working.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_ATTACHMENT_CACHE_SIZE) -> None:
+        self.max_bytes = max_bytes
+        self._contents: OrderedDict[str, AttachmentContent] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._size = 0
+        self._file_digests: dict[_FileStat, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """Total bytes of encoded content held by the cache."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def get_content(self, source: Union[StrPath, bytes]) -> AttachmentContent:
+        """Return the encoded content of a file or of raw bytes."""
+        if isinstance(source, bytes):
+            return self._get_or_encode(hashlib.sha256(source).hexdigest(), source)
+        return self._get_file_content(source)
+
+    def attachment(
+        self,
+        source: Union[StrPath, bytes],
+        filename: Optional[str] = None,
+        disposition: Optional[Disposition] = None,
+        mimetype: Optional[str] = None,
+        content_id: Optional[str] = None,
+    ) -> Attachment:
+        """
+        Create an attachment with cached content, see `Attachment.from_path`.
+        `filename` is required for raw bytes.
+        """
+        if filename is None:
+            if isinstance(source, bytes):
+                raise ValueError("filename is required for attachments from bytes")
+            filename = os.path.basename(source)
+
+        return Attachment(
+            content=self.get_content(source),
+            filename=filename,
+            disposition=disposition,
+            mimetype=mimetype or mimetypes.guess_type(filename)[0],
+            content_id=content_id,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._contents.clear()
+            self._sizes.clear()
+            self._file_digests.clear()
+            self._size = 0
+
+    def _get_file_content(self, path: StrPath) -> AttachmentContent:
+        with open(path, "rb") as file:
+            stat = os.fstat(file.fileno())
+            key = (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+            digest = self._file_digests.get(key)
+            if digest is not None:
+                content = self._lookup(digest)
+                if content is not None:
+                    return content
+
+            if stat.st_size == 0:
+                return self._get_or_encode(hashlib.sha256(b"").hexdigest(), b"", key)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return self._get_or_encode(hashlib.sha256(data).hexdigest(), data, key)
+
+    def _get_or_encode(
+        self,
+        digest: str,
+        data: Union[bytes, mmap.mmap],
+        file_key: Optional[_FileStat] = None,
+    ) -> AttachmentContent:
+        content = self._lookup(digest)
+        if content is None:
+            content = AttachmentContent.from_encoded(AttachmentContent(data).encode())
+            self._store(digest, content, file_key)
+        return content
+
+    def _lookup(self, digest: str) -> Optional[AttachmentContent]:
+        with self._lock:
+            content = self._contents.get(digest)
+            if content is None:
+                self.misses += 1
+                return None
+            self._contents.move_to_end(digest)
+            self.hits += 1
+            return content
+
+    def _store(
+        self, digest: str, content: AttachmentContent, file_key: Optional[_FileStat]
+    ) -> None:
+        size = len(content.encode())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if file_key is not None:
+                self._file_digests[file_key] = digest
+            if digest in self._contents:
+                return
+            self._contents[digest] = content
+            self._sizes[digest] = size
+            self._size += size
+            while self._size > self.max_bytes:
+                evicted, _ = self._contents.popitem(last=False)
+                self._size -= self._sizes.pop(evicted)
+                self._forget_files(evicted)
+
+    def _forget_files(self, digest: str) -> None:
+        stale = [key for key, value in self._file_digests.items() if value == digest]
+        for key in stale:
+            del self._file_digests[key]
@@ -1,28 +1,76 @@
+import threading
 import warnings
+import weakref
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Generic
 from typing import Optional
 from typing import Union
 from typing import cast
 
-from pydantic import TypeAdapter
-
-from mailtrap.api.contacts import ContactsBaseApi
+from mailtrap.api.resources.base import ClientT
+from mailtrap.api.sending import AsyncSendingApi
 from mailtrap.api.sending import SendingApi
-from mailtrap.api.suppressions import SuppressionsBaseApi
-from mailtrap.api.templates import EmailTemplatesApi
-from mailtrap.api.testing import TestingApi
 from mailtrap.config import BULK_HOST
+from mailtrap.config import DEFAULT_POOL_MAXSIZE
+from mailtrap.config import DEFAULT_REQUEST_TIMEOUT
 from mailtrap.config import GENERAL_HOST
 from mailtrap.config import SANDBOX_HOST
 from mailtrap.config import SENDING_HOST
+from mailtrap.dedup import DedupCache
 from mailtrap.exceptions import ClientConfigurationError
+from mailtrap.hooks import RequestHooks
+from mailtrap.http import AsyncHttpClient
 from mailtrap.http import HttpClient
+from mailtrap.models.common import get_type_adapter
 from mailtrap.models.mail import BaseMail
 from mailtrap.models.mail.base import SendingMailResponse
+from mailtrap.models.mail.base import SendResult
+from mailtrap.rate_limit import RateLimiter
+from mailtrap.retry import RetryPolicy
+from mailtrap.stats import ClientStats
+from mailtrap.stats import StatsCollector
+
+if TYPE_CHECKING:
+    from mailtrap.api.contacts import AsyncContactsBaseApi
+    from mailtrap.api.contacts import ContactsBaseApi
+    from mailtrap.api.suppressions import AsyncSuppressionsBaseApi
+    from mailtrap.api.suppressions import SuppressionsBaseApi
+    from mailtrap.api.templates import AsyncEmailTemplatesApi
+    from mailtrap.api.templates import EmailTemplatesApi
+    from mailtrap.api.testing import AsyncTestingApi
+    from mailtrap.api.testing import TestingApi
 
 SEND_ENDPOINT_RESPONSE = dict[str, Union[bool, list[str]]]
 
 
-class MailtrapClient:
+def _keep_alive(
+    client_ref: "weakref.ref[MailtrapClient]",
+    hosts: list[str],
+    connections: int,
+    interval: float,
+    stop: threading.Event,
+) -> None:
+    """Warm up the connections to `hosts` every `interval` seconds."""
+    while not stop.wait(interval):
+        client = client_ref()
+        if client is None:
+            return
+        for host in hosts:
+            if stop.is_set():
+                break
+            client._get_http_client(host).warmup(connections)
+        del client
+
+
+class BaseMailtrapClient(ABC, Generic[ClientT]):
+    """Configuration, validation and per-host HTTP client pooling."""
+
     DEFAULT_HOST = SENDING_HOST
     DEFAULT_PORT = 443
     BULK_HOST = BULK_HOST
@@ -37,6 +85,16 @@ class MailtrapClient:
         sandbox: bool = False,
         account_id: Optional[str] = None,
         inbox_id: Optional[str] = None,
+        timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        dedup_cache: Optional[DedupCache] = None,
+        general_api_host: Optional[str] = None,
+        hooks: Sequence[RequestHooks] = (),
+        collect_stats: bool = False,
+        max_idle_time: Optional[float] = None,
     ) -> None:
         self.token = token
         self.api_host = api_host
@@ -45,52 +103,189 @@ class MailtrapClient:
         self.sandbox = sandbox
         self.account_id = account_id
         self.inbox_id = inbox_id
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.dedup_cache = dedup_cache
+        self.general_api_host = general_api_host
+        self.hooks = tuple(hooks)
+        self.max_idle_time = max_idle_time
+
+        self._stats: Optional[StatsCollector] = None
+        if collect_stats:
+            self._stats = StatsCollector()
+            self.hooks += (self._stats,)
+
+        self._http_clients: dict[tuple[str, tuple[tuple[str, str], ...]], ClientT] = {}
+        self._http_clients_lock = threading.Lock()
 
         self._validate_itself()
 
     @property
-    def testing_api(self) -> TestingApi:
+    def headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "User-Agent": (
+                "mailtrap-python (https://github.com/railsware/mailtrap-python)"
+            ),
+        }
+
+    def stats(self) -> ClientStats:
+        """
+        Snapshot of request, error and retry counters, calls in flight and
+        latency histograms by endpoint. Requires `collect_stats=True`.
+        """
+        return self._get_stats_collector().snapshot()
+
+    def reset_stats(self) -> None:
+        self._get_stats_collector().reset()
+
+    def _get_stats_collector(self) -> StatsCollector:
+        if self._stats is None:
+            raise ClientConfigurationError("`collect_stats` is required for stats")
+        return self._stats
+
+    @property
+    def _sending_api_host(self) -> str:
+        if self.api_host:
+            return self.api_host
+        if self.sandbox:
+            return SANDBOX_HOST
+        if self.bulk:
+            return BULK_HOST
+        return SENDING_HOST
+
+    @property
+    def _general_api_host(self) -> str:
+        return self.general_api_host or GENERAL_HOST
+
+    def _get_http_client(self, host: str) -> ClientT:
+        """
+        Return the pooled HTTP client for `host`, creating it on first use.
+
+        All API facades share these clients, so keep-alive connections
+        are reused across calls instead of being re-established each time.
+        Clients are cached by their headers too, so a new `token` takes
+        effect on the next call, and those of the old one are closed with
+        the others by `close()`. Other settings, e.g. `timeout`, are fixed
+        once a host was used.
+        """
+        headers = self.headers
+        key = (host, tuple(headers.items()))
+        http_client = self._http_clients.get(key)
+        if http_client is not None:
+            return http_client
+
+        with self._http_clients_lock:
+            http_client = self._http_clients.get(key)
+            if http_client is None:
+                http_client = self._create_http_client(host, headers)
+                self._http_clients[key] = http_client
+            return http_client
+
+    @abstractmethod
+    def _create_http_client(self, host: str, headers: dict[str, str]) -> ClientT: ...
+
+    def _validate_account_id(self) -> None:
+        if not self.account_id:
+            raise ClientConfigurationError("`account_id` is required for Testing API")
+
+    def _validate_itself(self) -> None:
+        if self.sandbox and not self.inbox_id:
+            raise ClientConfigurationError("`inbox_id` is required for sandbox mode")
+
+        if not self.sandbox and self.inbox_id:
+            raise ClientConfigurationError(
+                "`inbox_id` is not allowed in non-sandbox mode"
+            )
+
+        if self.bulk and self.sandbox:
+            raise ClientConfigurationError("bulk mode is not allowed in sandbox mode")
+
+
+class MailtrapClient(BaseMailtrapClient[HttpClient]):
+    _keepalive: Optional[threading.Event] = None
+    _keepalive_thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "MailtrapClient":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def testing_api(self) -> "TestingApi":
+        from mailtrap.api.testing import TestingApi
+
         self._validate_account_id()
         return TestingApi(
             account_id=cast(str, self.account_id),
             inbox_id=self.inbox_id,
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._get_http_client(self._general_api_host),
         )
 
     @property
-    def email_templates_api(self) -> EmailTemplatesApi:
+    def email_templates_api(self) -> "EmailTemplatesApi":
+        from mailtrap.api.templates import EmailTemplatesApi
+
         self._validate_account_id()
         return EmailTemplatesApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._get_http_client(self._general_api_host),
         )
 
     @property
-    def contacts_api(self) -> ContactsBaseApi:
+    def contacts_api(self) -> "ContactsBaseApi":
+        from mailtrap.api.contacts import ContactsBaseApi
+
         self._validate_account_id()
         return ContactsBaseApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._get_http_client(self._general_api_host),
         )
 
     @property
-    def suppressions_api(self) -> SuppressionsBaseApi:
+    def suppressions_api(self) -> "SuppressionsBaseApi":
+        from mailtrap.api.suppressions import SuppressionsBaseApi
+
         self._validate_account_id()
         return SuppressionsBaseApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._get_http_client(self._general_api_host),
         )
 
     @property
     def sending_api(self) -> SendingApi:
-        http_client = HttpClient(host=self._sending_api_host, headers=self.headers)
-        return SendingApi(client=http_client, inbox_id=self.inbox_id)
+        return SendingApi(
+            client=self._get_http_client(self._sending_api_host),
+            inbox_id=self.inbox_id,
+            dedup_cache=self.dedup_cache,
+        )
 
-    def send(self, mail: BaseMail) -> SEND_ENDPOINT_RESPONSE:
-        sending_response = self.sending_api.send(mail)
+    def send(
+        self, mail: BaseMail, idempotency_key: Optional[str] = None
+    ) -> SEND_ENDPOINT_RESPONSE:
+        sending_response = self.sending_api.send(mail, idempotency_key)
         return cast(
             SEND_ENDPOINT_RESPONSE,
-            TypeAdapter(SendingMailResponse).dump_python(sending_response),
+            get_type_adapter(SendingMailResponse).dump_python(sending_response),
+        )
+
+    def send_many(
+        self,
+        mails: Iterable[BaseMail],
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[SendResult]:
+        """
+        Send emails concurrently over the pooled connections, see
+        `SendingApi.send_many`. `concurrency` defaults to `pool_maxsize`.
+        """
+        return self.sending_api.send_many(
+            mails, concurrency=concurrency or self.pool_maxsize, ordered=ordered
         )
 
     @property
@@ -114,38 +309,188 @@ class MailtrapClient:
             return f"{url}/{self.inbox_id}"
         return url
 
+    def warmup(
+        self,
+        hosts: Optional[Iterable[str]] = None,
+        connections: int = 1,
+        keepalive_interval: Optional[float] = None,
+    ) -> dict[str, int]:
+        """
+        Open `connections` pooled connections to each of `hosts`, the
+        sending host by default, so the first requests skip DNS, TCP and
+        TLS setup. Returns the number of ready connections per host.
+
+        With `keepalive_interval`, a background thread repeats the warm-up
+        every that many seconds, so the connections aren't dropped as idle
+        by the server or the network in between. It stops on `close()`.
+        """
+        hosts = list(hosts or [self._sending_api_host])
+        ready = {host: self._get_http_client(host).warmup(connections) for host in hosts}
+        if keepalive_interval is not None:
+            self._stop_keepalive()
+            self._keepalive = threading.Event()
+            self._keepalive_thread = threading.Thread(
+                target=_keep_alive,
+                args=(
+                    weakref.ref(self),
+                    hosts,
+                    connections,
+                    keepalive_interval,
+                    self._keepalive,
+                ),
+                name="mailtrap-keepalive",
+                daemon=True,
+            )
+            self._keepalive_thread.start()
+        return ready
+
+    def close(self) -> None:
+        """Close pooled connections of all hosts used by this client."""
+        self._stop_keepalive()
+        with self._http_clients_lock:
+            http_clients = list(self._http_clients.values())
+            self._http_clients.clear()
+        for http_client in http_clients:
+            http_client.close()
+
+    def _stop_keepalive(self) -> None:
+        """Stop the keep-alive thread and wait for a warm-up in progress."""
+        if self._keepalive is not None:
+            self._keepalive.set()
+            self._keepalive = None
+        thread, self._keepalive_thread = self._keepalive_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _create_http_client(self, host: str, headers: dict[str, str]) -> HttpClient:
+        return HttpClient(
+            host=host,
+            headers=headers,
+            timeout=self.timeout,
+            pool_maxsize=self.pool_maxsize,
+            keep_alive=self.keep_alive,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            max_idle_time=self.max_idle_time,
+        )
+
+
+class AsyncMailtrapClient(BaseMailtrapClient[AsyncHttpClient]):
+    """
+    asyncio flavour of `MailtrapClient`.
+
+    Facades and resources mirror the sync client, but every API call is a
+    coroutine. Requires `httpx`: `pip install mailtrap[async]`.
+    """
+
+    async def __aenter__(self) -> "AsyncMailtrapClient":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
     @property
-    def headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-            "User-Agent": (
-                "mailtrap-python (https://github.com/railsware/mailtrap-python)"
-            ),
-        }
+    def testing_api(self) -> "AsyncTestingApi":
+        from mailtrap.api.testing import AsyncTestingApi
+
+        self._validate_account_id()
+        return AsyncTestingApi(
+            account_id=cast(str, self.account_id),
+            inbox_id=self.inbox_id,
+            client=self._get_http_client(self._general_api_host),
+        )
 
     @property
-    def _sending_api_host(self) -> str:
-        if self.api_host:
-            return self.api_host
-        if self.sandbox:
-            return SANDBOX_HOST
-        if self.bulk:
-            return BULK_HOST
-        return SENDING_HOST
+    def email_templates_api(self) -> "AsyncEmailTemplatesApi":
+        from mailtrap.api.templates import AsyncEmailTemplatesApi
 
-    def _validate_account_id(self) -> None:
-        if not self.account_id:
-            raise ClientConfigurationError("`account_id` is required for Testing API")
+        self._validate_account_id()
+        return AsyncEmailTemplatesApi(
+            account_id=cast(str, self.account_id),
+            client=self._get_http_client(self._general_api_host),
+        )
 
-    def _validate_itself(self) -> None:
-        if self.sandbox and not self.inbox_id:
-            raise ClientConfigurationError("`inbox_id` is required for sandbox mode")
+    @property
+    def contacts_api(self) -> "AsyncContactsBaseApi":
+        from mailtrap.api.contacts import AsyncContactsBaseApi
 
-        if not self.sandbox and self.inbox_id:
-            raise ClientConfigurationError(
-                "`inbox_id` is not allowed in non-sandbox mode"
-            )
+        self._validate_account_id()
+        return AsyncContactsBaseApi(
+            account_id=cast(str, self.account_id),
+            client=self._get_http_client(self._general_api_host),
+        )
 
-        if self.bulk and self.sandbox:
-            raise ClientConfigurationError("bulk mode is not allowed in sandbox mode")
+    @property
+    def suppressions_api(self) -> "AsyncSuppressionsBaseApi":
+        from mailtrap.api.suppressions import AsyncSuppressionsBaseApi
+
+        self._validate_account_id()
+        return AsyncSuppressionsBaseApi(
+            account_id=cast(str, self.account_id),
+            client=self._get_http_client(self._general_api_host),
+        )
+
+    @property
+    def sending_api(self) -> AsyncSendingApi:
+        return AsyncSendingApi(
+            client=self._get_http_client(self._sending_api_host),
+            inbox_id=self.inbox_id,
+            dedup_cache=self.dedup_cache,
+        )
+
+    async def send(
+        self, mail: BaseMail, idempotency_key: Optional[str] = None
+    ) -> SEND_ENDPOINT_RESPONSE:
+        sending_response = await self.sending_api.send(mail, idempotency_key)
+        return cast(
+            SEND_ENDPOINT_RESPONSE,
+            get_type_adapter(SendingMailResponse).dump_python(sending_response),
+        )
+
+    def send_many(
+        self,
+        mails: Iterable[BaseMail],
+        concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[SendResult]:
+        """
+        Send emails concurrently over the pooled connections, see
+        `SendingApi.send_many`. `concurrency` defaults to `pool_maxsize`.
+        """
+        return self.sending_api.send_many(
+            mails, concurrency=concurrency or self.pool_maxsize, ordered=ordered
+        )
+
+    async def warmup(
+        self, hosts: Optional[Iterable[str]] = None, connections: int = 1
+    ) -> dict[str, int]:
+        """
+        Open `connections` pooled connections to each of `hosts`, the
+        sending host by default. See `MailtrapClient.warmup`.
+        """
+        hosts = list(hosts or [self._sending_api_host])
+        return {
+            host: await self._get_http_client(host).warmup(connections) for host in hosts
+        }
+
+    async def aclose(self) -> None:
+        """Close pooled connections of all hosts used by this client."""
+        with self._http_clients_lock:
+            http_clients = list(self._http_clients.values())
+            self._http_clients.clear()
+        for http_client in http_clients:
+            await http_client.aclose()
+
+    def _create_http_client(self, host: str, headers: dict[str, str]) -> AsyncHttpClient:
+        return AsyncHttpClient(
+            host=host,
+            headers=headers,
+            timeout=self.timeout,
+            pool_maxsize=self.pool_maxsize,
+            keep_alive=self.keep_alive,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            hooks=self.hooks,
+            max_idle_time=self.max_idle_time,
+        )
@@ -4,3 +4,7 @@ SANDBOX_HOST = "sandbox.api.mailtrap.io"
 SENDING_HOST = "send.api.mailtrap.io"
 
 DEFAULT_REQUEST_TIMEOUT = 30  # in seconds
+DEFAULT_POOL_MAXSIZE = 10  # connections kept alive per host
+DEFAULT_CHUNK_SIZE = 64 * 1024  # bytes per chunk of streamed downloads
+
+MAX_BATCH_SIZE = 500  # messages per batch send request
@@ -0,0 +1,76 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from mailtrap.models.mail.base import SendingMailResponse
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+DEFAULT_DEDUP_CACHE_SIZE = 10_000  # remembered sends
+DEFAULT_DEDUP_WINDOW = 3600.0  # in seconds
+
+
+def get_idempotency_key(payload: bytes) -> str:
+    """Idempotency key derived from a serialized email: its SHA-256."""
+    return hashlib.sha256(payload).hexdigest()
+
+
+class DedupCache:
+    """
+    Bounded memory of recent successful sends, keyed by idempotency key.
+
+    With a cache configured, every send carries an idempotency key, either
+    the one given by the caller or the hash of the serialized email. A send
+    repeating a key seen within the last `window` seconds isn't made again,
+    it returns the recorded response with the original `message_ids`:
+
+        client = mt.MailtrapClient(token=..., dedup_cache=mt.DedupCache())
+
+    Only the `max_size` most recent keys are kept, and only sends that
+    completed are recorded: concurrent sends of the same email all go out.
+    Beyond the cache, duplicates are avoided only if the server honors the
+    `Idempotency-Key` header, which is why keyed sends aren't retried unless
+    the retry policy has `retry_keyed_sends`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_DEDUP_CACHE_SIZE,
+        window: float = DEFAULT_DEDUP_WINDOW,
+    ) -> None:
+        self.max_size = max_size
+        self.window = window
+        self._responses: OrderedDict[str, tuple[float, SendingMailResponse]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, key: str) -> Optional[SendingMailResponse]:
+        """Return the response of a send with this key made within the window."""
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is None:
+                return None
+            sent_at, response = entry
+            if time.monotonic() - sent_at > self.window:
+                del self._responses[key]
+                return None
+            self.hits += 1
+            return response
+
+    def add(self, key: str, response: SendingMailResponse) -> None:
+        with self._lock:
+            self._responses[key] = (time.monotonic(), response)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.max_size:
+                self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
@@ -0,0 +1,80 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Phases of RequestInfo.timings, in seconds
+RATE_LIMIT = "rate_limit"  # waiting for the client-side rate limiter
+SERIALIZE = "serialize"  # encoding the JSON body
+NETWORK = "network"  # connection from the pool, sending, waiting and reading
+BACKOFF = "backoff"  # sleeping between retries
+PARSE = "parse"  # decoding and validating the response body
+
+
+@dataclass
+class RequestInfo:
+    """
+    One API call as seen by `RequestHooks`, including all its retries.
+
+    `endpoint` is a stable label like `messages.get_list`, or the path for
+    calls made without one. Byte sizes are None when unknown, e.g. for
+    streamed downloads.
+    """
+
+    method: str
+    endpoint: str
+    path: str
+    attempts: int = 0
+    status: Optional[int] = None
+    request_bytes: int = 0
+    response_bytes: Optional[int] = None
+    timings: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Seconds spent in the client for this call, all phases together."""
+        return sum(self.timings.values())
+
+    def add_timing(self, phase: str, seconds: float) -> None:
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+
+class RequestHooks:
+    """
+    Instrumentation callbacks of `HttpClient` and `AsyncHttpClient`.
+
+    Subclass and override the methods you need. Each call starts with
+    `on_request_start` and ends with either `on_response` or `on_error`,
+    which receive the same `RequestInfo` filled with the status, sizes and
+    phase timings. Hooks run synchronously in the calling thread or event
+    loop, so they should be quick; exceptions raised by them are logged
+    and don't affect the call.
+    """
+
+    def on_request_start(self, info: RequestInfo) -> None:
+        pass
+
+    def on_response(self, info: RequestInfo) -> None:
+        pass
+
+    def on_error(self, info: RequestInfo, error: BaseException) -> None:
+        pass
+
+
+def call_hooks(
+    hooks: Sequence[RequestHooks],
+    name: str,
+    info: RequestInfo,
+    error: Optional[BaseException] = None,
+) -> None:
+    for hook in hooks:
+        try:
+            if error is None:
+                getattr(hook, name)(info)
+            else:
+                hook.on_error(info, error)
+        except Exception:
+            logger.exception("Mailtrap request hook %r failed", hook)
@@ -1,66 +1,275 @@
+import os
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from json import JSONDecodeError
+from typing import TYPE_CHECKING
 from typing import Any
 from typing import NoReturn
 from typing import Optional
+from typing import Protocol
+from typing import TypeVar
+from typing import cast
+from typing import get_origin
+from typing import overload
 
+from pydantic_core import to_json
+from requests import RequestException
 from requests import Response
 from requests import Session
+from requests.adapters import HTTPAdapter
 
+from mailtrap.config import DEFAULT_CHUNK_SIZE
+from mailtrap.config import DEFAULT_POOL_MAXSIZE
 from mailtrap.config import DEFAULT_REQUEST_TIMEOUT
 from mailtrap.exceptions import APIError
 from mailtrap.exceptions import AuthorizationError
+from mailtrap.hooks import BACKOFF
+from mailtrap.hooks import NETWORK
+from mailtrap.hooks import PARSE
+from mailtrap.hooks import RATE_LIMIT
+from mailtrap.hooks import SERIALIZE
+from mailtrap.hooks import RequestHooks
+from mailtrap.hooks import RequestInfo
+from mailtrap.hooks import call_hooks
+from mailtrap.models.common import get_type_adapter
+from mailtrap.rate_limit import RateLimiter
+from mailtrap.retry import RetryPolicy
+from mailtrap.retry import get_server_delay
 
+if TYPE_CHECKING:
+    import httpx
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+T = TypeVar("T")
+
+# Clients whose connection pools are replaced in forked child processes
+# and, with `max_idle_time`, checked for idle connections in the background
+_live_clients: "weakref.WeakSet[BaseHttpClient]" = weakref.WeakSet()
+
+_reaper: Optional[threading.Thread] = None
+_reaper_lock = threading.Lock()
+_reaper_wakeup = threading.Event()
+
+
+def _start_reaper() -> None:
+    global _reaper
+    with _reaper_lock:
+        if _reaper is not None and _reaper.is_alive():
+            # A new client may have a shorter `max_idle_time`
+            _reaper_wakeup.set()
+        else:
+            _reaper = threading.Thread(
+                target=_reap_idle_connections, name="mailtrap-idle-reaper", daemon=True
+            )
+            _reaper.start()
+
+
+def _reap_idle_connections() -> None:
+    """
+    Close connections of clients unused for their `max_idle_time`, checking
+    twice per the shortest one. Stops when no such client is left.
+    """
+    global _reaper
+    while True:
+        with _reaper_lock:
+            clients = [
+                client
+                for client in list(_live_clients)
+                if isinstance(client, HttpClient) and client._max_idle_time is not None
+            ]
+            if not clients:
+                _reaper = None
+                return
+        interval = min(cast(float, client._max_idle_time) for client in clients) / 2
+        for client in clients:
+            client.close_idle()
+        # Hold no references while waiting, so dropped clients are collected
+        del client, clients
+        _reaper_wakeup.wait(interval)
+        _reaper_wakeup.clear()
+
+
+def _reset_clients_after_fork() -> None:
+    global _reaper, _reaper_lock, _reaper_wakeup
+    _reaper, _reaper_lock, _reaper_wakeup = None, threading.Lock(), threading.Event()
+    for client in list(_live_clients):
+        client._reset_after_fork()
+        if isinstance(client, HttpClient) and client._max_idle_time is not None:
+            _start_reaper()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
+class _Response(Protocol):
+    """Subset of the response interface shared by `requests` and `httpx`."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    @property
+    def text(self) -> str: ...
+
+    def json(self) -> Any: ...
+
+
+class BaseHttpClient:
+    """Transport independent part of the HTTP clients: URLs, retries and errors."""
 
-class HttpClient:
     def __init__(
         self,
         host: str,
-        headers: Optional[dict[str, str]] = None,
         timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Sequence[RequestHooks] = (),
+        max_idle_time: Optional[float] = None,
     ):
         self._host = host
-        self._session = Session()
-        self._session.headers.update(headers or {})
+        self._base_url = (host if "://" in host else f"https://{host}").rstrip("/")
         self._timeout = timeout
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        self._retry_policy = retry_policy
+        self._retry_count = 0
+        self._rate_limiter = rate_limiter
+        self._hooks = tuple(hooks)
+        self._max_idle_time = max_idle_time
+        _live_clients.add(self)
 
-    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.get(
-            self._url(path), params=params, timeout=self._timeout
-        )
-        return self._process_response(response)
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        return self._retry_policy
+
+    @property
+    def retry_count(self) -> int:
+        """Total number of retries performed by this client."""
+        return self._retry_count
+
+    def _reset_after_fork(self) -> None:
+        """
+        Give a forked child process connections of its own. Pooled sockets
+        are inherited from the parent, and using them from both processes
+        mixes up their requests and responses.
+        """
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        idempotent: Optional[bool],
+        response: Optional[_Response] = None,
+    ) -> Optional[float]:
+        """
+        Return how long to sleep before repeating a failed request,
+        or None if it must not be repeated.
+        """
+        if self._retry_policy is None:
+            return None
 
-    def post(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.post(self._url(path), json=json, timeout=self._timeout)
-        return self._process_response(response)
+        status_code = response.status_code if response is not None else None
+        if not self._retry_policy.should_retry(method, attempt, status_code, idempotent):
+            return None
 
-    def put(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.put(self._url(path), json=json, timeout=self._timeout)
-        return self._process_response(response)
+        self._retry_count += 1
+        headers = response.headers if response is not None else None
+        return self._retry_policy.get_delay(attempt, headers)
 
-    def patch(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.patch(self._url(path), json=json, timeout=self._timeout)
-        return self._process_response(response)
+    def _on_failed_attempt(self, response: _Response) -> None:
+        """Hold the host's rate limit bucket for as long as the server asked to."""
+        if self._rate_limiter is None or response.status_code != 429:
+            return
 
-    def delete(self, path: str) -> Any:
-        response = self._session.delete(self._url(path), timeout=self._timeout)
-        return self._process_response(response)
+        delay = get_server_delay(response.headers)
+        if delay:
+            self._rate_limiter.pause(self._host, delay)
+
+    @contextmanager
+    def _track(
+        self, method: str, path: str, endpoint: Optional[str]
+    ) -> Iterator[RequestInfo]:
+        """Collect the call's `RequestInfo` and report it to the hooks."""
+        info = RequestInfo(method=method, endpoint=endpoint or path, path=path)
+        call_hooks(self._hooks, "on_request_start", info)
+        try:
+            yield info
+        except BaseException as exc:
+            call_hooks(self._hooks, "on_error", info, exc)
+            raise
+        call_hooks(self._hooks, "on_response", info)
+
+    @staticmethod
+    def _encode_body(
+        info: RequestInfo, json: Optional[dict[str, Any]], content: Optional[bytes]
+    ) -> Optional[bytes]:
+        started = time.perf_counter()
+        if content is None and json is not None:
+            content = to_json(json)
+        info.add_timing(SERIALIZE, time.perf_counter() - started)
+        info.request_bytes = len(content) if content is not None else 0
+        return content
+
+    def _parse(
+        self, info: RequestInfo, response: _Response, response_type: Optional[Any]
+    ) -> Any:
+        info.status = response.status_code
+        info.response_bytes = len(response.content)
+        started = time.perf_counter()
+        result = self._process_response(response, response_type)
+        info.add_timing(PARSE, time.perf_counter() - started)
+        return result
 
     def _url(self, path: str) -> str:
-        return f"https://{self._host}/{path.lstrip('/')}"
+        """HTTPS unless `host` comes with a scheme, e.g. `http://localhost:8025`."""
+        return f"{self._base_url}/{path.lstrip('/')}"
 
-    def _process_response(self, response: Response) -> Any:
-        if not response.ok:
+    def _process_response(
+        self, response: _Response, response_type: Optional[Any] = None
+    ) -> Any:
+        """
+        Decode a response body.
+
+        With `response_type` the raw bytes are validated straight into that
+        type by pydantic-core, skipping the intermediate Python dicts.
+        An empty body is None, or an empty list for a list `response_type`.
+        """
+        if response.status_code >= 400:
             self._handle_failed_response(response)
 
-        if not response.content.strip():
-            return None
+        content = response.content
+        if not content or content.isspace():
+            return [] if get_origin(response_type) is list else None
+
+        if response_type is not None:
+            return get_type_adapter(response_type).validate_json(content)
 
         try:
             return response.json()
         except (JSONDecodeError, ValueError):
             return response.text
 
-    def _handle_failed_response(self, response: Response) -> NoReturn:
+    def _handle_failed_response(self, response: _Response) -> NoReturn:
         status_code = response.status_code
 
         if not response.content:
@@ -104,3 +313,601 @@ class HttpClient:
             return flatten_errors(data["error"])
 
         return ["Unknown error"]
+
+
+class HttpClient(BaseHttpClient):
+    def __init__(
+        self,
+        host: str,
+        headers: Optional[dict[str, str]] = None,
+        timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Sequence[RequestHooks] = (),
+        max_idle_time: Optional[float] = None,
+    ):
+        super().__init__(
+            host,
+            timeout=timeout,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            max_idle_time=max_idle_time,
+        )
+        self._headers = headers or {}
+        self._session = self._build_session(self._headers)
+        self._last_used = time.perf_counter()
+        if max_idle_time is not None:
+            _start_reaper()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections. The client reconnects if used again."""
+        self._session.close()
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Open up to `connections` pooled connections to the host, DNS lookup
+        and TLS handshake included, so the next requests don't wait for them.
+        Connections already open are reused and count towards `connections`,
+        which is capped at `pool_maxsize`.
+
+        Returns the number of connections ready, fewer if some failed,
+        and 0 without any request if `connections` is below 1.
+        """
+        connections = min(connections, self._pool_maxsize)
+        if connections < 1:
+            return 0
+        # Responses aren't read until all arrived, so each request holds a
+        # connection of its own instead of reusing one freed by another.
+        with ThreadPoolExecutor(connections) as executor:
+            futures = [executor.submit(self._ping) for _ in range(connections)]
+        ready = 0
+        for future in futures:
+            try:
+                future.result().content  # returns the connection to the pool
+            except RequestException:
+                continue
+            ready += 1
+        self._last_used = time.perf_counter()
+        return ready
+
+    def close_idle(self) -> None:
+        """Close pooled connections if none was used for `max_idle_time`."""
+        if self._is_idle(time.perf_counter()):
+            self._session.close()
+
+    def _ping(self) -> Response:
+        # A redirect would open a connection to another host, not this one
+        return self._session.request(
+            "HEAD",
+            self._url("/"),
+            timeout=self._timeout,
+            stream=True,
+            allow_redirects=False,
+        )
+
+    def _is_idle(self, now: float) -> bool:
+        return (
+            self._max_idle_time is not None
+            and now - self._last_used >= self._max_idle_time
+        )
+
+    @overload
+    def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        *,
+        endpoint: Optional[str] = None,
+    ) -> Any: ...
+
+    @overload
+    def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        *,
+        response_type: type[T],
+        endpoint: Optional[str] = None,
+    ) -> T: ...
+
+    def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        response_type: Optional[Any] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return self._request(
+            "GET", path, response_type=response_type, endpoint=endpoint, params=params
+        )
+
+    def post(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return self._request(
+            "POST",
+            path,
+            idempotent=idempotent,
+            endpoint=endpoint,
+            json=json,
+            content=content,
+            headers=headers,
+        )
+
+    def put(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        content: Optional[bytes] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return self._request(
+            "PUT",
+            path,
+            idempotent=idempotent,
+            endpoint=endpoint,
+            json=json,
+            content=content,
+        )
+
+    def patch(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        content: Optional[bytes] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return self._request(
+            "PATCH",
+            path,
+            idempotent=idempotent,
+            endpoint=endpoint,
+            json=json,
+            content=content,
+        )
+
+    def delete(
+        self, path: str, idempotent: Optional[bool] = None, endpoint: Optional[str] = None
+    ) -> Any:
+        return self._request("DELETE", path, idempotent=idempotent, endpoint=endpoint)
+
+    def get_bytes(self, path: str, endpoint: Optional[str] = None) -> bytes:
+        """GET a binary body as is, without JSON parsing or text decoding."""
+        with self._track("GET", path, endpoint) as info:
+            response = self._send(info, "GET", path)
+            info.status = response.status_code
+            if not response.ok:
+                self._process_response(response)
+            info.response_bytes = len(response.content)
+            return response.content
+
+    def stream(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        endpoint: Optional[str] = None,
+    ) -> Iterator[bytes]:
+        """
+        GET a binary body in chunks of up to `chunk_size` bytes without
+        buffering it whole.
+
+        The request is made right away, so API errors are raised by this call.
+        The connection returns to the pool once the iterator is exhausted
+        or closed.
+        """
+        with self._track("GET", path, endpoint) as info:
+            response = self._send(info, "GET", path, stream=True)
+            info.status = response.status_code
+            if not response.ok:
+                with response:
+                    self._process_response(response)
+        return self._iter_chunks(response, chunk_size)
+
+    @staticmethod
+    def _iter_chunks(response: Response, chunk_size: int) -> Iterator[bytes]:
+        with response:
+            yield from response.iter_content(chunk_size)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        idempotent: Optional[bool] = None,
+        response_type: Optional[Any] = None,
+        endpoint: Optional[str] = None,
+        json: Optional[dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        with self._track(method, path, endpoint) as info:
+            body = self._encode_body(info, json, content)
+            if body is not None:
+                kwargs["data"] = body
+                kwargs["headers"] = {**JSON_HEADERS, **(headers or {})}
+            elif headers:
+                kwargs["headers"] = headers
+            response = self._send(info, method, path, idempotent, **kwargs)
+            return self._parse(info, response, response_type)
+
+    def _send(
+        self,
+        info: RequestInfo,
+        method: str,
+        path: str,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Make the request, repeating it as the retry policy allows."""
+        attempt = 1
+        while True:
+            info.attempts = attempt
+            if self._rate_limiter is not None:
+                started = time.perf_counter()
+                self._rate_limiter.acquire(self._host)
+                info.add_timing(RATE_LIMIT, time.perf_counter() - started)
+            started = time.perf_counter()
+            if self._is_idle(started):
+                # The server has likely dropped them meanwhile
+                self._session.close()
+            self._last_used = started
+            try:
+                response = self._session.request(
+                    method, self._url(path), timeout=self._timeout, **kwargs
+                )
+            except RequestException:
+                self._last_used = time.perf_counter()
+                info.add_timing(NETWORK, self._last_used - started)
+                delay = self._retry_delay(method, attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                self._last_used = time.perf_counter()
+                info.add_timing(NETWORK, self._last_used - started)
+                if response.ok:
+                    return response
+                self._on_failed_attempt(response)
+                delay = self._retry_delay(method, attempt, idempotent, response)
+                if delay is None:
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            info.add_timing(BACKOFF, delay)
+            attempt += 1
+
+    def _reset_after_fork(self) -> None:
+        # The inherited sockets are left to the garbage collector, which
+        # only closes this process's descriptors. An explicit close of the
+        # session could shut down connections the parent still uses.
+        self._session = self._build_session(self._headers)
+
+    def _build_session(self, headers: dict[str, str]) -> Session:
+        """
+        Build a session with a connection pool sized for concurrent use.
+
+        The session talks to a single host, so one pool is enough and
+        `pool_maxsize` bounds the number of keep-alive connections to it.
+        """
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(headers)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    asyncio counterpart of `HttpClient` built on top of `httpx.AsyncClient`.
+
+    Requires the optional `httpx` dependency: `pip install mailtrap[async]`.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        headers: Optional[dict[str, str]] = None,
+        timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hooks: Sequence[RequestHooks] = (),
+        max_idle_time: Optional[float] = None,
+    ):
+        super().__init__(
+            host,
+            timeout=timeout,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+            max_idle_time=max_idle_time,
+        )
+        self._headers = headers or {}
+        self._client = self._build_client(self._headers)
+
+    @overload
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        *,
+        endpoint: Optional[str] = None,
+    ) -> Any: ...
+
+    @overload
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        *,
+        response_type: type[T],
+        endpoint: Optional[str] = None,
+    ) -> T: ...
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        response_type: Optional[Any] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return await self._request(
+            "GET", path, response_type=response_type, endpoint=endpoint, params=params
+        )
+
+    async def post(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return await self._request(
+            "POST",
+            path,
+            idempotent=idempotent,
+            endpoint=endpoint,
+            json=json,
+            content=content,
+            headers=headers,
+        )
+
+    async def put(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        content: Optional[bytes] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return await self._request(
+            "PUT",
+            path,
+            idempotent=idempotent,
+            endpoint=endpoint,
+            json=json,
+            content=content,
+        )
+
+    async def patch(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        content: Optional[bytes] = None,
+        endpoint: Optional[str] = None,
+    ) -> Any:
+        return await self._request(
+            "PATCH",
+            path,
+            idempotent=idempotent,
+            endpoint=endpoint,
+            json=json,
+            content=content,
+        )
+
+    async def delete(
+        self, path: str, idempotent: Optional[bool] = None, endpoint: Optional[str] = None
+    ) -> Any:
+        return await self._request(
+            "DELETE", path, idempotent=idempotent, endpoint=endpoint
+        )
+
+    async def get_bytes(self, path: str, endpoint: Optional[str] = None) -> bytes:
+        """GET a binary body as is, without JSON parsing or text decoding."""
+        with self._track("GET", path, endpoint) as info:
+            response = await self._send(info, "GET", path)
+            info.status = response.status_code
+            if not response.is_success:
+                self._process_response(response)
+            info.response_bytes = len(response.content)
+            return response.content
+
+    async def stream(
+        self,
+        path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        endpoint: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        GET a binary body in chunks of up to `chunk_size` bytes without
+        buffering it whole. The request is made when the iteration starts.
+        """
+        with self._track("GET", path, endpoint) as info:
+            response = await self._send(info, "GET", path, stream=True)
+            info.status = response.status_code
+            if not response.is_success:
+                try:
+                    await response.aread()
+                    self._process_response(response)
+                finally:
+                    await response.aclose()
+        try:
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        idempotent: Optional[bool] = None,
+        response_type: Optional[Any] = None,
+        endpoint: Optional[str] = None,
+        json: Optional[dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        headers: Optional[dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        with self._track(method, path, endpoint) as info:
+            body = self._encode_body(info, json, content)
+            if body is not None:
+                kwargs["content"] = body
+                kwargs["headers"] = {**JSON_HEADERS, **(headers or {})}
+            elif headers:
+                kwargs["headers"] = headers
+            response = await self._send(info, method, path, idempotent, **kwargs)
+            return self._parse(info, response, response_type)
+
+    async def _send(
+        self,
+        info: RequestInfo,
+        method: str,
+        path: str,
+        idempotent: Optional[bool] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """Make the request, repeating it as the retry policy allows."""
+        import asyncio
+
+        import httpx
+
+        attempt = 1
+        while True:
+            info.attempts = attempt
+            if self._rate_limiter is not None:
+                started = time.perf_counter()
+                await self._rate_limiter.acquire_async(self._host)
+                info.add_timing(RATE_LIMIT, time.perf_counter() - started)
+            request = self._client.build_request(method, self._url(path), **kwargs)
+            started = time.perf_counter()
+            try:
+                response = await self._client.send(request, stream=stream)
+            except httpx.TransportError:
+                info.add_timing(NETWORK, time.perf_counter() - started)
+                delay = self._retry_delay(method, attempt, idempotent)
+                if delay is None:
+                    raise
+            else:
+                info.add_timing(NETWORK, time.perf_counter() - started)
+                if response.is_success:
+                    return response
+                self._on_failed_attempt(response)
+                delay = self._retry_delay(method, attempt, idempotent, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            info.add_timing(BACKOFF, delay)
+            attempt += 1
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def warmup(self, connections: int = 1) -> int:
+        """
+        Open up to `connections` pooled connections to the host.
+        See `HttpClient.warmup`.
+        """
+        import asyncio
+
+        import httpx
+
+        connections = min(connections, self._pool_maxsize)
+        if connections < 1:
+            return 0
+        responses = await asyncio.gather(
+            *(self._ping() for _ in range(connections)), return_exceptions=True
+        )
+        ready = 0
+        for response in responses:
+            if isinstance(response, httpx.TransportError):
+                continue
+            if isinstance(response, BaseException):
+                raise response
+            await response.aread()
+            await response.aclose()
+            ready += 1
+        return ready
+
+    async def _ping(self) -> "httpx.Response":
+        request = self._client.build_request("HEAD", self._url("/"))
+        return await self._client.send(request, stream=True)
+
+    def _reset_after_fork(self) -> None:
+        self._client = self._build_client(self._headers)
+
+    def _build_client(self, headers: dict[str, str]) -> "httpx.AsyncClient":
+        """
+        Build an `httpx.AsyncClient` with a bounded connection pool.
+
+        Requests beyond `pool_maxsize` wait for a free connection instead of
+        failing, so any number of coroutines can share one client.
+        """
+        try:
+            import httpx
+        except ImportError as exc:
+            raise ImportError(
+                "httpx is required for async support, "
+                "install it with `pip install mailtrap[async]`"
+            ) from exc
+
+        keepalive_connections = self._pool_maxsize if self._keep_alive else 0
+        limits = httpx.Limits(
+            max_connections=self._pool_maxsize,
+            max_keepalive_connections=keepalive_connections,
+        )
+        if self._max_idle_time is not None:
+            # httpx closes connections idle for longer on its own
+            limits.keepalive_expiry = self._max_idle_time
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=httpx.Timeout(self._timeout, pool=None),
+            limits=limits,
+        )
@@ -3,10 +3,11 @@ from typing import Optional
 
 from pydantic.dataclasses import dataclass
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
 from mailtrap.models.mail.attachment import Disposition
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class Attachment:
     id: int
     message_id: int
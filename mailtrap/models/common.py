@@ -1,13 +1,48 @@
+import json
+from collections.abc import Iterable
 from typing import Any
 from typing import TypeVar
 from typing import Union
 from typing import cast
 
+from pydantic import ConfigDict
 from pydantic import TypeAdapter
 from pydantic.dataclasses import dataclass
+from pydantic.dataclasses import rebuild_dataclass
 
 T = TypeVar("T", bound="RequestParams")
 
+# Response models compile their validators on first use rather than at
+# import, so processes that never call an API don't pay for its models.
+RESPONSE_MODEL_CONFIG = ConfigDict(defer_build=True)
+
+_type_adapters: dict[Any, TypeAdapter[Any]] = {}
+
+
+def get_type_adapter(type_: Any) -> TypeAdapter[Any]:
+    """
+    Return a `TypeAdapter` for `type_`, built once per type.
+
+    Building an adapter compiles a core schema, which costs far more
+    than the (de)serialization it's then used for.
+    """
+    adapter = _type_adapters.get(type_)
+    if adapter is None:
+        adapter = _type_adapters[type_] = TypeAdapter(type_)
+    return adapter
+
+
+def warmup_models(*models: type) -> None:
+    """
+    Compile the validators of `models` and of lists of them now, e.g. at
+    worker startup, so that the first responses don't wait for it:
+
+        warmup_models(EmailMessage, Inbox)
+    """
+    for model in models:
+        rebuild_dataclass(model)
+        get_type_adapter(list[model])  # type: ignore[valid-type]
+
 
 @dataclass
 class RequestParams:
@@ -15,10 +50,29 @@ class RequestParams:
     def api_data(self: T) -> dict[str, Any]:
         return cast(
             dict[str, Any],
-            TypeAdapter(type(self)).dump_python(self, by_alias=True, exclude_none=True),
+            get_type_adapter(type(self)).dump_python(
+                self, by_alias=True, exclude_none=True
+            ),
         )
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON with pydantic-core, skipping the dict step."""
+        return get_type_adapter(type(self)).dump_json(
+            self, by_alias=True, exclude_none=True
+        )
 
-@dataclass
+
+def dump_json_array(params: Iterable[RequestParams]) -> bytes:
+    """Join already serialized models into a JSON array."""
+    return b"[" + b",".join(param.to_json_bytes() for param in params) + b"]"
+
+
+def dump_json_object(**fields: bytes) -> bytes:
+    """Build a JSON object from already serialized values."""
+    members = (json.dumps(key).encode() + b":" + value for key, value in fields.items())
+    return b"{" + b",".join(members) + b"}"
+
+
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class DeletedObject:
     id: Union[int, str]
@@ -4,6 +4,7 @@ from typing import Union
 
 from pydantic.dataclasses import dataclass
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
 from mailtrap.models.common import RequestParams
 
 
@@ -24,7 +25,7 @@ class UpdateContactFieldParams(RequestParams):
             raise ValueError("At least one field must be provided for update action")
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class ContactField:
     id: int
     name: str
@@ -37,7 +38,7 @@ class ContactListParams(RequestParams):
     name: str
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class ContactList:
     id: int
     name: str
@@ -81,7 +82,7 @@ class UpdateContactParams(RequestParams):
             raise ValueError("At least one field must be provided for update action")
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class Contact:
     id: str
     email: str
@@ -92,7 +93,7 @@ class Contact:
     updated_at: int
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class ContactResponse:
     data: Contact
 
@@ -104,7 +105,7 @@ class ContactImportStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class ContactImport:
     id: int
     status: ContactImportStatus
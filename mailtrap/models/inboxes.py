@@ -2,11 +2,12 @@ from typing import Optional
 
 from pydantic.dataclasses import dataclass
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
 from mailtrap.models.common import RequestParams
 from mailtrap.models.permissions import Permissions
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class Inbox:
     id: int
     name: str
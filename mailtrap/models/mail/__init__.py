@@ -1,15 +1,29 @@
 from mailtrap.models.mail.address import Address
 from mailtrap.models.mail.attachment import Attachment
+from mailtrap.models.mail.attachment import AttachmentContent
 from mailtrap.models.mail.attachment import Disposition
 from mailtrap.models.mail.base import BaseMail
+from mailtrap.models.mail.base import SendingMailResponse
+from mailtrap.models.mail.base import SendResult
+from mailtrap.models.mail.batch import BatchEmailRequest
+from mailtrap.models.mail.batch import BatchMail
+from mailtrap.models.mail.batch import BatchSendResponse
+from mailtrap.models.mail.batch import BatchSendResponseItem
 from mailtrap.models.mail.from_template import MailFromTemplate
 from mailtrap.models.mail.mail import Mail
 
 __all__ = [
     "Address",
     "Attachment",
+    "AttachmentContent",
     "Disposition",
     "BaseMail",
+    "BatchEmailRequest",
+    "BatchMail",
+    "BatchSendResponse",
+    "BatchSendResponseItem",
     "Mail",
     "MailFromTemplate",
+    "SendingMailResponse",
+    "SendResult",
 ]
@@ -1,27 +1,148 @@
+import base64
+import mimetypes
+import mmap
+import os
 from enum import Enum
+from io import UnsupportedOperation
+from typing import IO
+from typing import Any
 from typing import Optional
+from typing import Union
 
 from pydantic import Field
 from pydantic import FieldSerializationInfo
+from pydantic import GetCoreSchemaHandler
 from pydantic import field_serializer
 from pydantic.dataclasses import dataclass
+from pydantic_core import core_schema
 
 from mailtrap.models.common import RequestParams
 
+StrPath = Union[str, "os.PathLike[str]"]
+
 
 class Disposition(str, Enum):
     INLINE = "inline"
     ATTACHMENT = "attachment"
 
 
+class AttachmentContent:
+    """
+    Raw attachment data that is base64-encoded only when the email is sent.
+
+    The data is a file path, read through `mmap` at serialization time, or
+    an in-memory buffer. Either way the only copy made on the heap is the
+    encoded content itself.
+    """
+
+    def __init__(
+        self,
+        source: Union[StrPath, bytes, memoryview, mmap.mmap],
+        encoded: Optional[bytes] = None,
+    ) -> None:
+        self._source = source
+        self._encoded = encoded
+
+    @classmethod
+    def from_encoded(cls, encoded: bytes) -> "AttachmentContent":
+        """Wrap content that is already base64-encoded, it's sent as is."""
+        return cls(b"", encoded=encoded)
+
+    @classmethod
+    def from_file(cls, file: IO[bytes]) -> "AttachmentContent":
+        """
+        Take the rest of an open binary file. Regular files are memory-mapped
+        and may be closed right after, other file objects are read.
+        """
+        try:
+            fileno = file.fileno()
+            position = file.tell()
+            mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, UnsupportedOperation, ValueError):
+            return cls(file.read())
+        return cls(memoryview(mapped)[position:])
+
+    def encode(self) -> bytes:
+        """Return the content encoded as base64."""
+        if self._encoded is not None:
+            return self._encoded
+        if isinstance(self._source, (bytes, memoryview, mmap.mmap)):
+            return base64.b64encode(self._source)
+
+        with open(self._source, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return b""
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return base64.b64encode(mapped)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(cls)
+
+    def __repr__(self) -> str:
+        if self._encoded is not None:
+            return f"{type(self).__name__}(<{len(self._encoded)} encoded bytes>)"
+        if isinstance(self._source, (bytes, memoryview, mmap.mmap)):
+            return f"{type(self).__name__}(<{len(self._source)} bytes>)"
+        return f"{type(self).__name__}({self._source!r})"
+
+
 @dataclass
 class Attachment(RequestParams):
-    content: bytes
+    content: Union[bytes, AttachmentContent]
     filename: str
     disposition: Optional[Disposition] = None
     mimetype: Optional[str] = Field(default=None, serialization_alias="type")
     content_id: Optional[str] = None
 
+    @classmethod
+    def from_path(
+        cls,
+        path: StrPath,
+        filename: Optional[str] = None,
+        disposition: Optional[Disposition] = None,
+        mimetype: Optional[str] = None,
+        content_id: Optional[str] = None,
+    ) -> "Attachment":
+        """
+        Attach a file from disk. It's read and encoded only when the email
+        is serialized. `filename` and `mimetype` default to the ones of `path`.
+        """
+        filename = filename or os.path.basename(path)
+        return cls(
+            content=AttachmentContent(path),
+            filename=filename,
+            disposition=disposition,
+            mimetype=mimetype or mimetypes.guess_type(filename)[0],
+            content_id=content_id,
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        file: IO[bytes],
+        filename: str,
+        disposition: Optional[Disposition] = None,
+        mimetype: Optional[str] = None,
+        content_id: Optional[str] = None,
+    ) -> "Attachment":
+        """Attach the rest of an open binary file, see `AttachmentContent.from_file`."""
+        return cls(
+            content=AttachmentContent.from_file(file),
+            filename=filename,
+            disposition=disposition,
+            mimetype=mimetype or mimetypes.guess_type(filename)[0],
+            content_id=content_id,
+        )
+
     @field_serializer("content")
-    def serialize_content(self, value: bytes, _info: FieldSerializationInfo) -> str:
+    def serialize_content(
+        self, value: Union[bytes, AttachmentContent], info: FieldSerializationInfo
+    ) -> Union[str, bytes]:
+        if isinstance(value, AttachmentContent):
+            encoded = value.encode()
+            # pydantic-core writes bytes into JSON as is, no need for a str copy
+            return encoded if info.mode_is_json() else encoded.decode()
         return value.decode()
@@ -1,6 +1,7 @@
 from typing import Any
 from typing import Optional
 
+from pydantic import ConfigDict
 from pydantic import Field
 from pydantic.dataclasses import dataclass
 
@@ -24,3 +25,17 @@ class BaseMail(RequestParams):
 class SendingMailResponse:
     success: bool
     message_ids: list[str]
+
+
+@dataclass(config=ConfigDict(arbitrary_types_allowed=True))
+class SendResult:
+    """Outcome of sending one email of `send_many`, `index` is its input position."""
+
+    index: int
+    mail: BaseMail
+    response: Optional[SendingMailResponse] = None
+    error: Optional[Exception] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.response is not None and self.response.success
@@ -0,0 +1,48 @@
+from typing import Any
+from typing import Optional
+
+from pydantic import Field
+from pydantic.dataclasses import dataclass
+
+from mailtrap.models.common import RequestParams
+from mailtrap.models.mail.address import Address
+from mailtrap.models.mail.attachment import Attachment
+
+
+@dataclass
+class BatchMail(RequestParams):
+    """Payload shared by all messages of a batch (the `base` of the request)."""
+
+    sender: Optional[Address] = Field(default=None, serialization_alias="from")
+    subject: Optional[str] = None
+    text: Optional[str] = None
+    html: Optional[str] = None
+    category: Optional[str] = None
+    attachments: Optional[list[Attachment]] = None
+    headers: Optional[dict[str, str]] = None
+    custom_variables: Optional[dict[str, Any]] = None
+    template_uuid: Optional[str] = None
+    template_variables: Optional[dict[str, Any]] = None
+
+
+@dataclass
+class BatchEmailRequest(BatchMail):
+    """Single message of a batch; set fields override the ones from `base`."""
+
+    to: list[Address] = Field(...)  # type: ignore
+    cc: Optional[list[Address]] = None
+    bcc: Optional[list[Address]] = None
+
+
+@dataclass
+class BatchSendResponseItem:
+    success: bool
+    message_ids: Optional[list[str]] = None
+    errors: Optional[list[str]] = None
+
+
+@dataclass
+class BatchSendResponse:
+    success: bool
+    responses: list[BatchSendResponseItem] = Field(default_factory=list)
+    errors: Optional[list[str]] = None
@@ -1,14 +1,19 @@
 from datetime import datetime
 from enum import Enum
 from typing import Any
+from typing import Literal
 from typing import Optional
 from typing import Union
 
 from pydantic import Field
 from pydantic.dataclasses import dataclass
+from pydantic_core import to_json
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
 from mailtrap.models.common import RequestParams
 
+MessageBodyFormat = Literal["raw", "eml", "htmlsource", "html", "txt"]
+
 
 class BlacklistsResult(str, Enum):
     SUCCESS = "success"
@@ -16,14 +21,14 @@ class BlacklistsResult(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class BlacklistsReport:
     name: str
     url: str
     in_black_list: bool
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class Blacklists:
     result: BlacklistsResult
     domain: str
@@ -31,19 +36,19 @@ class Blacklists:
     report: list[BlacklistsReport]
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class SmtpData:
     mail_from_addr: str
     client_ip: str
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class SmtpInformation:
     ok: bool
     data: Optional[SmtpData] = None
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class EmailMessage:
     id: int
     inbox_id: int
@@ -79,20 +84,23 @@ class UpdateEmailMessageParams(RequestParams):
         data["is_read"] = str(data["is_read"]).lower()
         return data
 
+    def to_json_bytes(self) -> bytes:
+        return to_json(self.api_data)
 
-@dataclass
+
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class ForwardedMessage:
     message: str
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class SpamDetail:
     pts: float = Field(alias="Pts")
     rule_name: str = Field(alias="RuleName")
     description: str = Field(alias="Description")
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class SpamReport:
     response_code: int = Field(alias="ResponseCode")
     response_message: str = Field(alias="ResponseMessage")
@@ -103,14 +111,14 @@ class SpamReport:
     details: list[SpamDetail] = Field(alias="Details")
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class EmailClients:
     desktop: list[str]
     mobile: list[str]
     web: list[str]
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class ErrorItem:
     error_line: int
     rule_name: str
@@ -122,21 +130,21 @@ class AnalysisReportStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class AnalysisReport:
     status: AnalysisReportStatus
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class AnalysisReportError(AnalysisReport):
     msg: str
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class AnalysisReportSuccess(AnalysisReport):
     errors: list[ErrorItem]
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class AnalysisReportResponse:
     report: Union[AnalysisReportError, AnalysisReportSuccess]
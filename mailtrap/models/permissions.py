@@ -1,7 +1,9 @@
 from pydantic.dataclasses import dataclass
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
 
-@dataclass
+
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class Permissions:
     can_read: bool
     can_update: bool
@@ -2,18 +2,19 @@ from typing import Optional
 
 from pydantic.dataclasses import dataclass
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
 from mailtrap.models.common import RequestParams
 from mailtrap.models.inboxes import Inbox
 from mailtrap.models.permissions import Permissions
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class ShareLinks:
     admin: str
     viewer: str
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class Project:
     id: int
     name: str
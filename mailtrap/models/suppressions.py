@@ -5,6 +5,8 @@ from typing import Union
 
 from pydantic.dataclasses import dataclass
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
+
 
 class SuppressionType(str, Enum):
     HARD_BOUNCE = "hard bounce"
@@ -18,7 +20,7 @@ class SendingStream(str, Enum):
     BULK = "bulk"
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class Suppression:
     id: str
     type: SuppressionType
@@ -2,6 +2,7 @@ from typing import Optional
 
 from pydantic.dataclasses import dataclass
 
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
 from mailtrap.models.common import RequestParams
 
 
@@ -36,7 +37,7 @@ class UpdateEmailTemplateParams(RequestParams):
             raise ValueError("At least one field must be provided for update action")
 
 
-@dataclass
+@dataclass(config=RESPONSE_MODEL_CONFIG)
 class EmailTemplate:
     id: int
     name: str
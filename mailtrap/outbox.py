@@ -0,0 +1,319 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import NamedTuple
+from typing import Optional
+
+from requests import RequestException
+
+from mailtrap.api.sending import SendingApi
+from mailtrap.config import MAX_BATCH_SIZE
+from mailtrap.exceptions import APIError
+from mailtrap.models.mail.attachment import StrPath
+from mailtrap.models.mail.base import BaseMail
+from mailtrap.models.mail.batch import BatchSendResponseItem
+from mailtrap.retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    payload BLOB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+
+class _Entry(NamedTuple):
+    id: int
+    payload: bytes
+    attempts: int
+
+
+class Outbox:
+    """
+    Durable local queue of outgoing emails in a SQLite database.
+
+    `enqueue` only writes the serialized email to disk, so it's fast and
+    doesn't depend on the API being reachable. Worker threads started with
+    `start` deliver queued emails through the batch endpoint of
+    `sending_api`:
+
+        outbox = Outbox(client.sending_api, "outbox.sqlite3")
+        outbox.start()
+        outbox.enqueue(mail)
+
+    Delivery is at least once: an email is removed only after the API
+    accepted it, and emails claimed by a worker that died are picked up
+    again after `lease_timeout` seconds, also by another process.
+
+    Rate limits, server errors and network errors are retried with the
+    backoff of `retry_policy` until `retry_policy.max_attempts` deliveries
+    were made. Emails rejected by the API, also for an invalid token, and
+    those out of attempts are marked as failed and kept, see `get_failed`
+    and `requeue_failed`.
+    """
+
+    def __init__(
+        self,
+        sending_api: SendingApi,
+        path: StrPath,
+        batch_size: int = 100,
+        concurrency: int = 1,
+        poll_interval: float = 1.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        lease_timeout: float = 300.0,
+    ) -> None:
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+
+        self.sending_api = sending_api
+        self.path = path
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=10, backoff_base=1.0, backoff_cap=300.0
+        )
+        self.lease_timeout = lease_timeout
+
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._workers: list[threading.Thread] = []
+
+        self._connection().executescript(SCHEMA)
+
+    def __enter__(self) -> "Outbox":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def enqueue(self, mail: BaseMail) -> int:
+        """Store the email for delivery and return its outbox ID."""
+        now = time.time()
+        cursor = self._connection().execute(
+            "INSERT INTO outbox (payload, next_attempt_at, created_at) VALUES (?, ?, ?)",
+            (mail.to_json_bytes(), now, now),
+        )
+        self._wakeup.set()
+        return int(cursor.lastrowid or 0)
+
+    def start(self) -> None:
+        """Start delivering queued emails in background threads."""
+        if self._workers:
+            return
+        self._stopping.clear()
+        for number in range(self.concurrency):
+            worker = threading.Thread(
+                target=self._run, name=f"mailtrap-outbox-{number}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers once their current batches are delivered."""
+        self._stopping.set()
+        self._wakeup.set()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+    def drain(self) -> int:
+        """
+        Deliver emails in the current thread until none are due.
+        Returns the number of emails accepted by the API.
+        """
+        delivered = 0
+        while True:
+            entries = self._claim()
+            if not entries:
+                return delivered
+            delivered += self._deliver(entries)
+
+    def count(self, status: str = PENDING) -> int:
+        row = (
+            self._connection()
+            .execute("SELECT COUNT(*) FROM outbox WHERE status = ?", (status,))
+            .fetchone()
+        )
+        return int(row[0])
+
+    def get_failed(self, limit: int = 100) -> list[tuple[int, Optional[str]]]:
+        """IDs and last errors of emails that won't be delivered automatically."""
+        rows = self._connection().execute(
+            "SELECT id, last_error FROM outbox WHERE status = ? ORDER BY id LIMIT ?",
+            (FAILED, limit),
+        )
+        return [(int(row[0]), row[1]) for row in rows]
+
+    def requeue_failed(self) -> int:
+        """Schedule failed emails for delivery again, with fresh attempts."""
+        cursor = self._connection().execute(
+            "UPDATE outbox SET status = ?, attempts = 0, next_attempt_at = ? "
+            "WHERE status = ?",
+            (PENDING, time.time(), FAILED),
+        )
+        self._wakeup.set()
+        return cursor.rowcount
+
+    def _run(self) -> None:
+        try:
+            while not self._stopping.is_set():
+                try:
+                    entries = self._claim()
+                    if entries:
+                        self._deliver(entries)
+                        continue
+                except Exception:
+                    logger.exception("Mailtrap outbox delivery failed")
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+        finally:
+            self._close_connection()
+
+    def _claim(self) -> list[_Entry]:
+        """
+        Lease a batch of due emails, so no other worker picks them up.
+        Emails out of attempts, e.g. because workers died delivering them,
+        are marked as failed instead.
+        """
+        while True:
+            now = time.time()
+            with self._transaction() as connection:
+                rows = connection.execute(
+                    "SELECT id, payload, attempts FROM outbox "
+                    "WHERE status = ? AND next_attempt_at <= ? ORDER BY id LIMIT ?",
+                    (PENDING, now, self.batch_size),
+                ).fetchall()
+                entries = [_Entry(row[0], row[1], row[2] + 1) for row in rows]
+                claimed = [
+                    entry
+                    for entry in entries
+                    if entry.attempts <= self.retry_policy.max_attempts
+                ]
+                connection.executemany(
+                    "UPDATE outbox SET attempts = ?, next_attempt_at = ? WHERE id = ?",
+                    [
+                        (entry.attempts, now + self.lease_timeout, entry.id)
+                        for entry in claimed
+                    ],
+                )
+                connection.executemany(
+                    "UPDATE outbox SET status = ?, "
+                    "last_error = COALESCE(last_error, ?) WHERE id = ?",
+                    [
+                        (FAILED, "Out of delivery attempts", entry.id)
+                        for entry in entries
+                        if entry.attempts > self.retry_policy.max_attempts
+                    ],
+                )
+            if claimed or not entries:
+                return claimed
+
+    def _deliver(self, entries: list[_Entry]) -> int:
+        try:
+            results = self.sending_api.send_encoded_batch(
+                [entry.payload for entry in entries]
+            )
+        except RequestException as exc:
+            self._retry_later(entries, str(exc))
+            return 0
+        except APIError as exc:
+            if exc.status in self.retry_policy.retry_statuses:
+                self._retry_later(entries, str(exc))
+            else:
+                self._fail(entries, str(exc))
+            return 0
+        except Exception as exc:
+            # E.g. a malformed response, the emails must not stay leased
+            self._retry_later(entries, repr(exc))
+            return 0
+
+        delivered = [entry for entry, result in zip(entries, results) if result.success]
+        with self._transaction() as connection:
+            connection.executemany(
+                "DELETE FROM outbox WHERE id = ?", [(entry.id,) for entry in delivered]
+            )
+            connection.executemany(
+                "UPDATE outbox SET status = ?, last_error = ? WHERE id = ?",
+                [
+                    (FAILED, self._format_errors(result), entry.id)
+                    for entry, result in zip(entries, results)
+                    if not result.success
+                ],
+            )
+        return len(delivered)
+
+    def _retry_later(self, entries: list[_Entry], error: str) -> None:
+        logger.warning("Mailtrap outbox will retry %d emails: %s", len(entries), error)
+        now = time.time()
+        retry, exhausted = [], []
+        for entry in entries:
+            if entry.attempts < self.retry_policy.max_attempts:
+                delay = self.retry_policy.get_delay(entry.attempts)
+                retry.append((now + delay, error, entry.id))
+            else:
+                exhausted.append(entry)
+
+        with self._transaction() as connection:
+            connection.executemany(
+                "UPDATE outbox SET next_attempt_at = ?, last_error = ? WHERE id = ?",
+                retry,
+            )
+        if exhausted:
+            self._fail(exhausted, error)
+
+    def _fail(self, entries: list[_Entry], error: str) -> None:
+        with self._transaction() as connection:
+            connection.executemany(
+                "UPDATE outbox SET status = ?, last_error = ? WHERE id = ?",
+                [(FAILED, error, entry.id) for entry in entries],
+            )
+
+    @staticmethod
+    def _format_errors(result: BatchSendResponseItem) -> str:
+        return "; ".join(result.errors or ["Rejected by the API"])
+
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite connections can't be shared by threads, each gets its own."""
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, "connection", None
+        )
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _close_connection(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
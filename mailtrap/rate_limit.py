@@ -0,0 +1,132 @@
+import threading
+import time
+from collections.abc import Mapping
+from typing import Optional
+from typing import Union
+
+RateLimitConfig = Union[float, tuple[float, float]]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled with `rate` tokens per second.
+
+    Up to `capacity` tokens are accumulated while idle, which allows short
+    bursts. A caller that finds the bucket empty reserves a future token and
+    sleeps until it's due, so waiting callers are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        self._lock = threading.Lock()
+        self._rate, self._capacity = self._normalize(rate, capacity)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Change the limit at runtime; already reserved tokens stay reserved."""
+        rate, capacity = self._normalize(rate, capacity)
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate, self._capacity = rate, capacity
+            self._tokens = min(self._tokens, self._capacity)
+
+    def pause(self, seconds: float) -> None:
+        """Withhold tokens for `seconds`, e.g. after the server answered with 429."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self._rate)
+
+    def acquire(self) -> None:
+        """Take a token, blocking the current thread until one is available."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Take a token, suspending the current task until one is available."""
+        import asyncio
+
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    @staticmethod
+    def _normalize(rate: float, capacity: Optional[float]) -> tuple[float, float]:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity is None:
+            capacity = max(1.0, rate)
+        return float(rate), float(capacity)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+
+class RateLimiter:
+    """
+    Client-side rate limits with a separate token bucket per API host.
+
+    Limits are given as requests per second, optionally with a burst size:
+
+        RateLimiter({SENDING_HOST: 10, BULK_HOST: (50, 100)})
+
+    Hosts without a configured limit are not throttled. One limiter can be
+    shared by several clients using the same account to respect account-wide
+    limits.
+    """
+
+    def __init__(self, limits: Optional[Mapping[str, RateLimitConfig]] = None) -> None:
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        for host, config in (limits or {}).items():
+            rate, capacity = config if isinstance(config, tuple) else (config, None)
+            self.set_limit(host, rate, capacity)
+
+    def set_limit(self, host: str, rate: float, burst: Optional[float] = None) -> None:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                self._buckets[host] = TokenBucket(rate, burst)
+            else:
+                bucket.set_rate(rate, burst)
+
+    def remove_limit(self, host: str) -> None:
+        with self._lock:
+            self._buckets.pop(host, None)
+
+    def get_bucket(self, host: str) -> Optional[TokenBucket]:
+        return self._buckets.get(host)
+
+    def pause(self, host: str, seconds: float) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            bucket.pause(seconds)
+
+    def acquire(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, host: str) -> None:
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            await bucket.acquire_async()
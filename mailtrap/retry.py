@@ -0,0 +1,126 @@
+import random
+import time
+from collections.abc import Iterable
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for failed HTTP requests.
+
+    The n-th retry waits a random time between 0 and
+    `min(backoff_cap, backoff_base * 2 ** (n - 1))` seconds, unless the server
+    tells exactly how long to wait via `Retry-After` or rate limit headers.
+
+    Only idempotent requests are retried: methods from `idempotent_methods`
+    or requests explicitly marked as idempotent by the caller. Everything
+    else fails on the first error, because repeating it could e.g. deliver
+    an email twice. Sends carrying an `Idempotency-Key` are retried only
+    with `retry_keyed_sends`, as they're safe only if the server drops
+    repeated keys.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        retry_statuses: Iterable[int] = RETRY_STATUS_CODES,
+        idempotent_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        retry_keyed_sends: bool = False,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_keyed_sends = retry_keyed_sends
+
+    def is_idempotent(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.idempotent_methods
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        idempotent: Optional[bool] = None,
+    ) -> bool:
+        """
+        Decide if the request made on `attempt` (starting at 1) may be repeated.
+
+        `status_code` is None when the request failed on the transport level.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        return self.is_idempotent(method, idempotent)
+
+    def get_delay(
+        self, attempt: int, headers: Optional[Mapping[str, str]] = None
+    ) -> float:
+        """Seconds to wait before the retry following `attempt`."""
+        if headers is not None and self.respect_retry_after:
+            server_delay = get_server_delay(headers)
+            if server_delay is not None:
+                return min(server_delay, self.max_retry_after)
+
+        backoff = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff)
+
+
+def get_server_delay(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Seconds the server asked to wait before the next request, if it did.
+
+    Looks at `Retry-After` first and falls back to an exhausted
+    `X-RateLimit-Remaining` together with `X-RateLimit-Reset`.
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        return _parse_retry_after(retry_after)
+
+    remaining = headers.get("X-RateLimit-Remaining", headers.get("RateLimit-Remaining"))
+    reset = headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset"))
+    if remaining is not None and reset is not None and remaining.strip() == "0":
+        return _parse_rate_limit_reset(reset)
+
+    return None
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _parse_rate_limit_reset(value: str) -> Optional[float]:
+    try:
+        reset = float(value.strip())
+    except ValueError:
+        return None
+
+    # Reset is either seconds until reset or a unix timestamp.
+    if reset > 10**9:
+        return max(0.0, reset - time.time())
+    return max(0.0, reset)
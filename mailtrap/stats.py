@@ -0,0 +1,194 @@
+import math
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Optional
+
+from mailtrap.hooks import RequestHooks
+from mailtrap.hooks import RequestInfo
+
+DEFAULT_HISTOGRAM_PRECISION = 8  # buckets per doubling, about 9% relative error
+MIN_LATENCY = 1e-6  # in seconds, the upper bound of the first bucket
+
+
+class LatencyHistogram:
+    """
+    Latencies counted in logarithmic buckets, `precision` per doubling.
+
+    Recording is O(1) and memory grows with the range of latencies seen,
+    not with their number. Quantiles are estimated with a relative error
+    of at most `2 ** (1 / precision) - 1`. Histograms of the same precision
+    can be merged, e.g. to total several endpoints or processes.
+    """
+
+    def __init__(self, precision: int = DEFAULT_HISTOGRAM_PRECISION) -> None:
+        self.precision = precision
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyHistogram(count={self.count}, "
+            f"p50={self.quantile(0.5):.6f}, p99={self.quantile(0.99):.6f})"
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def record(self, seconds: float) -> None:
+        index = self._bucket(seconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Latency below which `q` (0 to 1) of the recorded ones are,
+        estimated as its bucket's upper bound. 0 for an empty histogram.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max or 0.0)
+        return self.max or 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the latencies recorded by `other` to this histogram."""
+        if other.precision != self.precision:
+            raise ValueError("Histograms of different precision can't be merged")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram(self.precision)
+        histogram.merge(self)
+        return histogram
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= MIN_LATENCY:
+            return 0
+        return math.ceil(math.log2(seconds / MIN_LATENCY) * self.precision)
+
+    def _upper_bound(self, index: int) -> float:
+        return float(MIN_LATENCY * 2 ** (index / self.precision))
+
+
+@dataclass
+class EndpointStats:
+    """
+    Counters of one endpoint. `requests` are completed calls, successful
+    or not, `errors` the failed ones among them, and `retries` the extra
+    attempts they took. `latency` covers completed calls, retries included.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    in_flight: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: "EndpointStats") -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.retries += other.retries
+        self.in_flight += other.in_flight
+        self.latency.merge(other.latency)
+
+    def copy(self) -> "EndpointStats":
+        stats = EndpointStats(latency=LatencyHistogram(self.latency.precision))
+        stats.merge(self)
+        return stats
+
+
+@dataclass
+class ClientStats:
+    """Snapshot of the stats of a client, by endpoint label."""
+
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+
+    @property
+    def total(self) -> EndpointStats:
+        return merge_stats(self.endpoints.values())
+
+
+def merge_stats(stats: Iterable[EndpointStats]) -> EndpointStats:
+    total: Optional[EndpointStats] = None
+    for endpoint_stats in stats:
+        if total is None:
+            total = endpoint_stats.copy()
+        else:
+            total.merge(endpoint_stats)
+    return total or EndpointStats()
+
+
+class StatsCollector(RequestHooks):
+    """Request hooks that keep `EndpointStats` for every endpoint label."""
+
+    def __init__(self, precision: int = DEFAULT_HISTOGRAM_PRECISION) -> None:
+        self.precision = precision
+        self._endpoints: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def on_request_start(self, info: RequestInfo) -> None:
+        with self._lock:
+            self._get(info.endpoint).in_flight += 1
+
+    def on_response(self, info: RequestInfo) -> None:
+        self._complete(info, error=False)
+
+    def on_error(self, info: RequestInfo, error: BaseException) -> None:
+        self._complete(info, error=True)
+
+    def snapshot(self) -> ClientStats:
+        with self._lock:
+            return ClientStats(
+                {endpoint: stats.copy() for endpoint, stats in self._endpoints.items()}
+            )
+
+    def reset(self) -> None:
+        """Start counting from zero, keeping the calls in flight."""
+        with self._lock:
+            self._endpoints = {
+                endpoint: EndpointStats(
+                    in_flight=stats.in_flight,
+                    latency=LatencyHistogram(self.precision),
+                )
+                for endpoint, stats in self._endpoints.items()
+                if stats.in_flight
+            }
+
+    def _complete(self, info: RequestInfo, error: bool) -> None:
+        duration = info.duration
+        with self._lock:
+            stats = self._get(info.endpoint)
+            stats.in_flight = max(stats.in_flight - 1, 0)
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.retries += max(info.attempts - 1, 0)
+            stats.latency.record(duration)
+
+    def _get(self, endpoint: str) -> EndpointStats:
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = EndpointStats(latency=LatencyHistogram(self.precision))
+            self._endpoints[endpoint] = stats
+        return stats
@@ -0,0 +1,985 @@
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections import deque
+from collections.abc import Iterator
+from collections.abc import Mapping
+from datetime import datetime
+from datetime import timezone
+from email.message import EmailMessage
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from itertools import count
+from typing import Any
+from typing import Callable
+from typing import NamedTuple
+from typing import Optional
+from typing import Union
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+MESSAGES_PAGE_SIZE = 30
+SUPPRESSIONS_PAGE_SIZE = 1000
+
+Payload = Union[dict[str, Any], list[Any], str, bytes, None]
+
+
+class StubError(Exception):
+    def __init__(self, status: int, *errors: str) -> None:
+        super().__init__(status, errors)
+        self.status = status
+        self.errors = list(errors)
+
+
+class RecordedRequest(NamedTuple):
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+
+class _Fault(NamedTuple):
+    status: int
+    path_prefix: Optional[str]
+    location: Optional[str] = None
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _permissions() -> dict[str, bool]:
+    return {"can_read": True, "can_update": True, "can_destroy": True, "can_leave": True}
+
+
+def _address(value: Any) -> tuple[str, str]:
+    if isinstance(value, dict):
+        return value.get("email", ""), value.get("name", "")
+    return "", ""
+
+
+class StubState:
+    """
+    In-memory data of the stub API: one account with its testing projects,
+    contacts, templates and suppressions, plus everything sent.
+
+    A project with one inbox exists from the start, `default_inbox_id`
+    can be used as the `inbox_id` of a sandbox client. Responses to keyed
+    sends are kept per path for the `max_sent` most recently used keys.
+    """
+
+    def __init__(self, max_sent: int = 10_000) -> None:
+        self.lock = threading.RLock()
+        self.sent: deque[dict[str, Any]] = deque(maxlen=max_sent)
+        self.sent_count = 0
+        self.projects: dict[int, dict[str, Any]] = {}
+        self.inboxes: dict[int, dict[str, Any]] = {}
+        self.messages: dict[int, dict[str, Any]] = {}
+        self.contacts: dict[str, dict[str, Any]] = {}
+        self.contact_lists: dict[int, dict[str, Any]] = {}
+        self.contact_fields: dict[int, dict[str, Any]] = {}
+        self.contact_imports: dict[int, dict[str, Any]] = {}
+        self.templates: dict[int, dict[str, Any]] = {}
+        self.suppressions: dict[str, dict[str, Any]] = {}
+        self.idempotent_responses: OrderedDict[tuple[str, str], dict[str, Any]] = (
+            OrderedDict()
+        )
+        self.max_idempotent_responses = max_sent
+        self._ids: dict[str, Iterator[int]] = {}
+
+        project = self.add_project("Default project")
+        self.default_inbox_id = self.add_inbox(project["id"], "Default inbox")["id"]
+
+    def next_id(self, kind: str) -> int:
+        return next(self._ids.setdefault(kind, count(1)))
+
+    def add_project(self, name: str) -> dict[str, Any]:
+        project_id = self.next_id("project")
+        project = {"id": project_id, "name": name, "permissions": _permissions()}
+        self.projects[project_id] = project
+        return project
+
+    def add_inbox(self, project_id: int, name: str) -> dict[str, Any]:
+        inbox_id = self.next_id("inbox")
+        username = uuid.uuid4().hex[:14]
+        inbox = {
+            "id": inbox_id,
+            "name": name,
+            "username": username,
+            "password": uuid.uuid4().hex[:14],
+            "max_size": 0,
+            "status": "active",
+            "email_username": f"inbox-{inbox_id}",
+            "email_username_enabled": False,
+            "sent_messages_count": 0,
+            "forwarded_messages_count": 0,
+            "used": False,
+            "forward_from_email_address": f"inbox-{inbox_id}@forward.mailtrap.info",
+            "project_id": project_id,
+            "domain": "sandbox.smtp.mailtrap.io",
+            "pop3_domain": "pop3.mailtrap.io",
+            "email_domain": "inbox.mailtrap.io",
+            "api_domain": "sandbox.api.mailtrap.io",
+            "smtp_ports": [25, 465, 587, 2525],
+            "pop3_ports": [1100, 9950],
+            "max_message_size": 5242880,
+            "permissions": _permissions(),
+            "last_message_sent_at": None,
+        }
+        self.inboxes[inbox_id] = inbox
+        return inbox
+
+    def add_suppression(
+        self, email: str, type: str = "hard bounce", sending_stream: str = "transactional"
+    ) -> dict[str, Any]:
+        suppression = {
+            "id": str(uuid.uuid4()),
+            "type": type,
+            "created_at": _now(),
+            "email": email,
+            "sending_stream": sending_stream,
+        }
+        self.suppressions[suppression["id"]] = suppression
+        return suppression
+
+    def render_inbox(self, inbox: dict[str, Any]) -> dict[str, Any]:
+        messages = [
+            message
+            for message in self.messages.values()
+            if message["data"]["inbox_id"] == inbox["id"]
+        ]
+        return {
+            **inbox,
+            "emails_count": len(messages),
+            "emails_unread_count": sum(
+                not message["data"]["is_read"] for message in messages
+            ),
+        }
+
+    def render_project(self, project: dict[str, Any]) -> dict[str, Any]:
+        inboxes = [
+            self.render_inbox(inbox)
+            for inbox in self.inboxes.values()
+            if inbox["project_id"] == project["id"]
+        ]
+        return {**project, "inboxes": inboxes}
+
+    def deliver(self, mail: dict[str, Any], inbox_id: Optional[int]) -> str:
+        """Record a sent email and, in sandbox mode, store it in the inbox."""
+        message_id = str(uuid.uuid4())
+        self.sent.append(mail)
+        self.sent_count += 1
+        if inbox_id is not None:
+            self._store_message(self.inboxes[inbox_id], mail)
+        return message_id
+
+    def _store_message(self, inbox: dict[str, Any], mail: dict[str, Any]) -> None:
+        message_id = self.next_id("message")
+        from_email, from_name = _address(mail.get("from"))
+        to_email, to_name = _address((mail.get("to") or [{}])[0])
+        text = mail.get("text") or ""
+        html = mail.get("html") or ""
+        subject = mail.get("subject") or ""
+
+        eml = EmailMessage()
+        eml["From"] = f"{from_name} <{from_email}>" if from_name else from_email
+        eml["To"] = ", ".join(_address(to)[0] for to in mail.get("to") or [])
+        eml["Subject"] = subject
+        eml.set_content(text)
+        if html:
+            eml.add_alternative(html, subtype="html")
+
+        attachments = []
+        for attachment in mail.get("attachments") or []:
+            attachment_id = self.next_id("attachment")
+            size = len(attachment.get("content", "")) * 3 // 4
+            attachments.append(
+                {
+                    "id": attachment_id,
+                    "message_id": message_id,
+                    "filename": attachment.get("filename", ""),
+                    "attachment_type": attachment.get("disposition") or "attachment",
+                    "content_type": attachment.get("type") or "application/octet-stream",
+                    "content_id": attachment.get("content_id"),
+                    "transfer_encoding": "base64",
+                    "attachment_size": size,
+                    "created_at": _now(),
+                    "updated_at": _now(),
+                    "attachment_human_size": f"{size} Bytes",
+                    "download_path": (
+                        f"/api/accounts/1/inboxes/{inbox['id']}/messages/{message_id}"
+                        f"/attachments/{attachment_id}/download"
+                    ),
+                }
+            )
+
+        eml_bytes = eml.as_bytes()
+        path = f"/api/accounts/1/inboxes/{inbox['id']}/messages/{message_id}"
+        now = _now()
+        self.messages[message_id] = {
+            "data": {
+                "id": message_id,
+                "inbox_id": inbox["id"],
+                "subject": subject,
+                "sent_at": now,
+                "from_email": from_email,
+                "from_name": from_name,
+                "to_email": to_email,
+                "to_name": to_name,
+                "email_size": len(eml_bytes),
+                "is_read": False,
+                "created_at": now,
+                "updated_at": now,
+                "html_body_size": len(html),
+                "text_body_size": len(text),
+                "human_size": f"{len(eml_bytes)} Bytes",
+                "html_path": f"{path}/body.html",
+                "txt_path": f"{path}/body.txt",
+                "raw_path": f"{path}/body.raw",
+                "download_path": f"{path}/body.eml",
+                "html_source_path": f"{path}/body.htmlsource",
+                "blacklists_report_info": False,
+                "smtp_information": {"ok": True},
+            },
+            "headers": {key.lower(): value for key, value in eml.items()},
+            "bodies": {
+                "raw": eml_bytes,
+                "eml": eml_bytes,
+                "txt": text.encode(),
+                "html": html.encode(),
+                "htmlsource": html.encode(),
+            },
+            "attachments": {attachment["id"]: attachment for attachment in attachments},
+        }
+        inbox["used"] = True
+        inbox["sent_messages_count"] += 1
+        inbox["last_message_sent_at"] = now
+
+
+class _Call(NamedTuple):
+    state: StubState
+    match: "re.Match[str]"
+    query: dict[str, str]
+    body: Any
+
+
+Handler = Callable[[_Call], Payload]
+
+_ROUTES: list[tuple[str, "re.Pattern[str]", Handler]] = []
+
+ACCOUNT = r"/api/accounts/[^/]+"
+
+
+def _route(method: str, pattern: str) -> Callable[[Handler], Handler]:
+    def register(handler: Handler) -> Handler:
+        _ROUTES.append((method, re.compile(f"^{pattern}$"), handler))
+        return handler
+
+    return register
+
+
+def _get(collection: Mapping[Any, dict[str, Any]], key: Any) -> dict[str, Any]:
+    item = collection.get(key)
+    if item is None:
+        raise StubError(404, "Not Found")
+    return item
+
+
+def _validate_mail(mail: Any) -> list[str]:
+    if not isinstance(mail, dict):
+        return ["Invalid email"]
+    errors = []
+    if not _address(mail.get("from"))[0]:
+        errors.append("'from' address is required")
+    if not any(mail.get(field) for field in ("to", "cc", "bcc")):
+        errors.append("At least one recipient is required")
+    if not mail.get("template_uuid"):
+        if not mail.get("subject"):
+            errors.append("'subject' is required")
+        if not mail.get("text") and not mail.get("html"):
+            errors.append("'text' or 'html' is required")
+    return errors
+
+
+def _sandbox_inbox(state: StubState, inbox_id: Optional[str]) -> Optional[int]:
+    if inbox_id is None:
+        return None
+    _get(state.inboxes, int(inbox_id))
+    return int(inbox_id)
+
+
+# Sending
+
+
+@_route("POST", r"/api/send(?:/(?P<inbox_id>\d+))?")
+def _send(call: _Call) -> Payload:
+    inbox_id = _sandbox_inbox(call.state, call.match["inbox_id"])
+    errors = _validate_mail(call.body)
+    if errors:
+        raise StubError(400, *errors)
+    return {"success": True, "message_ids": [call.state.deliver(call.body, inbox_id)]}
+
+
+@_route("POST", r"/api/batch(?:/(?P<inbox_id>\d+))?")
+def _batch(call: _Call) -> Payload:
+    inbox_id = _sandbox_inbox(call.state, call.match["inbox_id"])
+    requests = call.body.get("requests") if isinstance(call.body, dict) else None
+    if not requests:
+        raise StubError(400, "'requests' are required")
+    if len(requests) > 500:
+        raise StubError(422, "A batch may contain up to 500 requests")
+
+    base = call.body.get("base") or {}
+    responses = []
+    for request in requests:
+        mail = {**base, **request}
+        errors = _validate_mail(mail)
+        if errors:
+            responses.append({"success": False, "errors": errors})
+        else:
+            message_ids = [call.state.deliver(mail, inbox_id)]
+            responses.append({"success": True, "message_ids": message_ids})
+    return {"success": True, "responses": responses}
+
+
+# Testing: projects, inboxes, messages and attachments
+
+
+@_route("GET", f"{ACCOUNT}/projects")
+def _list_projects(call: _Call) -> Payload:
+    return [
+        call.state.render_project(project) for project in call.state.projects.values()
+    ]
+
+
+@_route("POST", f"{ACCOUNT}/projects")
+def _create_project(call: _Call) -> Payload:
+    name = (call.body.get("project") or {}).get("name", "")
+    if not 2 <= len(name) <= 100:
+        raise StubError(422, "Name is too short (minimum is 2 characters)")
+    return call.state.render_project(call.state.add_project(name))
+
+
+@_route("GET", rf"{ACCOUNT}/projects/(?P<id>\d+)")
+def _get_project(call: _Call) -> Payload:
+    return call.state.render_project(_get(call.state.projects, int(call.match["id"])))
+
+
+@_route("PATCH", rf"{ACCOUNT}/projects/(?P<id>\d+)")
+def _update_project(call: _Call) -> Payload:
+    project = _get(call.state.projects, int(call.match["id"]))
+    project.update(call.body.get("project") or {})
+    return call.state.render_project(project)
+
+
+@_route("DELETE", rf"{ACCOUNT}/projects/(?P<id>\d+)")
+def _delete_project(call: _Call) -> Payload:
+    project = call.state.projects.pop(int(call.match["id"]), None)
+    if project is None:
+        raise StubError(404, "Not Found")
+    for inbox in list(call.state.inboxes.values()):
+        if inbox["project_id"] == project["id"]:
+            del call.state.inboxes[inbox["id"]]
+    return {"id": project["id"]}
+
+
+@_route("GET", f"{ACCOUNT}/inboxes")
+def _list_inboxes(call: _Call) -> Payload:
+    return [call.state.render_inbox(inbox) for inbox in call.state.inboxes.values()]
+
+
+@_route("POST", rf"{ACCOUNT}/projects/(?P<id>\d+)/inboxes")
+def _create_inbox(call: _Call) -> Payload:
+    project = _get(call.state.projects, int(call.match["id"]))
+    name = (call.body.get("inbox") or {}).get("name", "")
+    return call.state.render_inbox(call.state.add_inbox(project["id"], name))
+
+
+@_route("GET", rf"{ACCOUNT}/inboxes/(?P<id>\d+)")
+def _get_inbox(call: _Call) -> Payload:
+    return call.state.render_inbox(_get(call.state.inboxes, int(call.match["id"])))
+
+
+@_route("PATCH", rf"{ACCOUNT}/inboxes/(?P<id>\d+)")
+def _update_inbox(call: _Call) -> Payload:
+    inbox = _get(call.state.inboxes, int(call.match["id"]))
+    inbox.update(call.body.get("inbox") or {})
+    return call.state.render_inbox(inbox)
+
+
+@_route("DELETE", rf"{ACCOUNT}/inboxes/(?P<id>\d+)")
+def _delete_inbox(call: _Call) -> Payload:
+    inbox = call.state.render_inbox(_get(call.state.inboxes, int(call.match["id"])))
+    del call.state.inboxes[inbox["id"]]
+    return inbox
+
+
+@_route("PATCH", rf"{ACCOUNT}/inboxes/(?P<id>\d+)/(?P<action>\w+)")
+def _inbox_action(call: _Call) -> Payload:
+    inbox = _get(call.state.inboxes, int(call.match["id"]))
+    action = call.match["action"]
+    inbox_messages = [
+        message["data"]
+        for message in call.state.messages.values()
+        if message["data"]["inbox_id"] == inbox["id"]
+    ]
+    if action == "clean":
+        for message in inbox_messages:
+            del call.state.messages[message["id"]]
+    elif action == "all_read":
+        for message in inbox_messages:
+            message["is_read"] = True
+    elif action == "reset_credentials":
+        inbox["password"] = uuid.uuid4().hex[:14]
+    elif action == "toggle_email_username":
+        inbox["email_username_enabled"] = not inbox["email_username_enabled"]
+    elif action == "reset_email_username":
+        inbox["email_username"] = f"inbox-{inbox['id']}-{uuid.uuid4().hex[:6]}"
+    else:
+        raise StubError(404, "Not Found")
+    return call.state.render_inbox(inbox)
+
+
+def _get_message(state: StubState, match: "re.Match[str]") -> dict[str, Any]:
+    message = _get(state.messages, int(match["id"]))
+    if message["data"]["inbox_id"] != int(match["inbox_id"]):
+        raise StubError(404, "Not Found")
+    return message
+
+
+MESSAGES = rf"{ACCOUNT}/inboxes/(?P<inbox_id>\d+)/messages"
+MESSAGE = rf"{MESSAGES}/(?P<id>\d+)"
+
+
+@_route("GET", MESSAGES)
+def _list_messages(call: _Call) -> Payload:
+    inbox_id = _get(call.state.inboxes, int(call.match["inbox_id"]))["id"]
+    search = call.query.get("search", "").lower()
+    messages = sorted(
+        (
+            message["data"]
+            for message in call.state.messages.values()
+            if message["data"]["inbox_id"] == inbox_id
+            and any(
+                search in message["data"][field].lower()
+                for field in ("subject", "to_email", "to_name")
+            )
+        ),
+        key=lambda data: -data["id"],
+    )
+    if "last_id" in call.query:
+        last_id = int(call.query["last_id"])
+        messages = [data for data in messages if data["id"] < last_id]
+    elif "page" in call.query:
+        start = (int(call.query["page"]) - 1) * MESSAGES_PAGE_SIZE
+        messages = messages[start:]
+    return messages[:MESSAGES_PAGE_SIZE]
+
+
+@_route("GET", MESSAGE)
+def _show_message(call: _Call) -> Payload:
+    data: dict[str, Any] = _get_message(call.state, call.match)["data"]
+    return data
+
+
+@_route("PATCH", MESSAGE)
+def _update_message(call: _Call) -> Payload:
+    data: dict[str, Any] = _get_message(call.state, call.match)["data"]
+    is_read = (call.body.get("message") or {}).get("is_read")
+    if is_read is not None:
+        data["is_read"] = str(is_read).lower() == "true"
+    data["updated_at"] = _now()
+    return data
+
+
+@_route("DELETE", MESSAGE)
+def _delete_message(call: _Call) -> Payload:
+    data: dict[str, Any] = _get_message(call.state, call.match)["data"]
+    del call.state.messages[data["id"]]
+    return data
+
+
+@_route("POST", f"{MESSAGE}/forward")
+def _forward_message(call: _Call) -> Payload:
+    _get_message(call.state, call.match)
+    return {"message": "Your email message has been successfully forwarded"}
+
+
+@_route("GET", f"{MESSAGE}/spam_report")
+def _spam_report(call: _Call) -> Payload:
+    _get_message(call.state, call.match)
+    return {
+        "report": {
+            "ResponseCode": 2,
+            "ResponseMessage": "Not spam",
+            "ResponseVersion": "1.2",
+            "Score": 0.0,
+            "Spam": False,
+            "Threshold": 5,
+            "Details": [],
+        }
+    }
+
+
+@_route("GET", f"{MESSAGE}/analyze")
+def _analyze(call: _Call) -> Payload:
+    _get_message(call.state, call.match)
+    return {"report": {"status": "success", "errors": []}}
+
+
+@_route("GET", f"{MESSAGE}/mail_headers")
+def _mail_headers(call: _Call) -> Payload:
+    return {"headers": _get_message(call.state, call.match)["headers"]}
+
+
+@_route("GET", rf"{MESSAGE}/body\.(?P<format>raw|eml|htmlsource|html|txt)")
+def _message_body(call: _Call) -> Payload:
+    content: bytes = _get_message(call.state, call.match)["bodies"][call.match["format"]]
+    return content
+
+
+@_route("GET", f"{MESSAGE}/attachments")
+def _list_attachments(call: _Call) -> Payload:
+    return list(_get_message(call.state, call.match)["attachments"].values())
+
+
+@_route("GET", rf"{MESSAGE}/attachments/(?P<attachment_id>\d+)")
+def _get_attachment(call: _Call) -> Payload:
+    attachments = _get_message(call.state, call.match)["attachments"]
+    return _get(attachments, int(call.match["attachment_id"]))
+
+
+# Contacts
+
+
+def _contact_key(state: StubState, id_or_email: str) -> str:
+    id_or_email = unquote(id_or_email)
+    for contact_id, contact in state.contacts.items():
+        if id_or_email in (contact_id, contact["email"]):
+            return contact_id
+    raise StubError(404, "Not Found")
+
+
+def _render_contact(contact: dict[str, Any]) -> dict[str, Any]:
+    return {"data": contact}
+
+
+def _timestamp() -> int:
+    return int(time.time() * 1000)
+
+
+@_route("POST", f"{ACCOUNT}/contacts")
+def _create_contact(call: _Call) -> Payload:
+    params = call.body.get("contact") or {}
+    email = params.get("email")
+    if not email:
+        raise StubError(422, "Email can't be blank")
+    if any(contact["email"] == email for contact in call.state.contacts.values()):
+        raise StubError(409, "Contact already exists")
+    contact = {
+        "id": str(uuid.uuid4()),
+        "email": email,
+        "fields": params.get("fields") or {},
+        "list_ids": params.get("list_ids") or [],
+        "status": "subscribed",
+        "created_at": _timestamp(),
+        "updated_at": _timestamp(),
+    }
+    call.state.contacts[contact["id"]] = contact
+    return _render_contact(contact)
+
+
+@_route("GET", f"{ACCOUNT}/contacts/(?P<id>(?!lists$|fields$|imports$)[^/]+)")
+def _get_contact(call: _Call) -> Payload:
+    return _render_contact(
+        call.state.contacts[_contact_key(call.state, call.match["id"])]
+    )
+
+
+@_route("PATCH", f"{ACCOUNT}/contacts/(?P<id>(?!lists$|fields$|imports$)[^/]+)")
+def _update_contact(call: _Call) -> Payload:
+    contact = call.state.contacts[_contact_key(call.state, call.match["id"])]
+    params = call.body.get("contact") or {}
+    if params.get("email"):
+        contact["email"] = params["email"]
+    contact["fields"].update(params.get("fields") or {})
+    included = params.get("list_ids_included") or []
+    excluded = set(params.get("list_ids_excluded") or [])
+    contact["list_ids"] = [
+        list_id
+        for list_id in dict.fromkeys([*contact["list_ids"], *included])
+        if list_id not in excluded
+    ]
+    if params.get("unsubscribed") is not None:
+        contact["status"] = "unsubscribed" if params["unsubscribed"] else "subscribed"
+    contact["updated_at"] = _timestamp()
+    return _render_contact(contact)
+
+
+@_route("DELETE", f"{ACCOUNT}/contacts/(?P<id>(?!lists$|fields$|imports$)[^/]+)")
+def _delete_contact(call: _Call) -> Payload:
+    del call.state.contacts[_contact_key(call.state, call.match["id"])]
+    return None
+
+
+def _crud_routes(
+    collection: str, path: str, wrapper: Optional[str], defaults: Mapping[str, Any]
+) -> None:
+    """Register list, create, get, update and delete of a simple collection."""
+
+    def items(state: StubState) -> dict[int, dict[str, Any]]:
+        items: dict[int, dict[str, Any]] = getattr(state, collection)
+        return items
+
+    def params(body: Any) -> dict[str, Any]:
+        if not isinstance(body, dict):
+            return {}
+        return dict(body.get(wrapper) or {}) if wrapper else body
+
+    def list_items(call: _Call) -> Payload:
+        return list(items(call.state).values())
+
+    def create(call: _Call) -> Payload:
+        item_id = call.state.next_id(collection)
+        item = {**defaults, **params(call.body), "id": item_id}
+        if "created_at" in defaults:
+            item["created_at"] = item["updated_at"] = _now()
+        if "uuid" in defaults:
+            item["uuid"] = str(uuid.uuid4())
+        items(call.state)[item_id] = item
+        return item
+
+    def get(call: _Call) -> Payload:
+        return _get(items(call.state), int(call.match["id"]))
+
+    def update(call: _Call) -> Payload:
+        item = _get(items(call.state), int(call.match["id"]))
+        item.update(params(call.body))
+        if "updated_at" in item:
+            item["updated_at"] = _now()
+        return item
+
+    def delete(call: _Call) -> Payload:
+        _get(items(call.state), int(call.match["id"]))
+        del items(call.state)[int(call.match["id"])]
+        return None
+
+    _route("GET", path)(list_items)
+    _route("POST", path)(create)
+    _route("GET", rf"{path}/(?P<id>\d+)")(get)
+    _route("PATCH", rf"{path}/(?P<id>\d+)")(update)
+    _route("DELETE", rf"{path}/(?P<id>\d+)")(delete)
+
+
+_crud_routes("contact_lists", f"{ACCOUNT}/contacts/lists", None, {})
+_crud_routes(
+    "contact_fields",
+    f"{ACCOUNT}/contacts/fields",
+    None,
+    {"data_type": "text", "merge_tag": ""},
+)
+_crud_routes(
+    "templates",
+    f"{ACCOUNT}/email_templates",
+    "email_template",
+    {
+        "uuid": "",
+        "category": "",
+        "body_text": None,
+        "body_html": None,
+        "created_at": "",
+        "updated_at": "",
+    },
+)
+
+
+@_route("POST", f"{ACCOUNT}/contacts/imports")
+def _import_contacts(call: _Call) -> Payload:
+    created = updated = 0
+    for params in call.body.get("contacts") or []:
+        existing = [
+            c for c in call.state.contacts.values() if c["email"] == params["email"]
+        ]
+        if existing:
+            existing[0]["fields"].update(params.get("fields") or {})
+            updated += 1
+            continue
+        _create_contact(call._replace(body={"contact": params}))
+        created += 1
+
+    import_id = call.state.next_id("contact_import")
+    call.state.contact_imports[import_id] = {
+        "id": import_id,
+        "status": "finished",
+        "created_contacts_count": created,
+        "updated_contacts_count": updated,
+        "contacts_over_limit_count": 0,
+    }
+    return {"id": import_id, "status": "created"}
+
+
+@_route("GET", rf"{ACCOUNT}/contacts/imports/(?P<id>\d+)")
+def _get_import(call: _Call) -> Payload:
+    return _get(call.state.contact_imports, int(call.match["id"]))
+
+
+# Suppressions
+
+
+@_route("GET", f"{ACCOUNT}/suppressions")
+def _list_suppressions(call: _Call) -> Payload:
+    email = call.query.get("email")
+    suppressions = [
+        suppression
+        for suppression in call.state.suppressions.values()
+        if email is None or suppression["email"] == email
+    ]
+    return suppressions[:SUPPRESSIONS_PAGE_SIZE]
+
+
+@_route("DELETE", f"{ACCOUNT}/suppressions/(?P<id>[^/]+)")
+def _delete_suppression(call: _Call) -> Payload:
+    suppression = call.state.suppressions.pop(call.match["id"], None)
+    if suppression is None:
+        raise StubError(404, "Not Found")
+    return suppression
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, don't wait for ACKs in between.
+    disable_nagle_algorithm = True
+    server: "_HTTPServer"
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PUT(self) -> None:
+        self._handle("PUT")
+
+    def do_PATCH(self) -> None:
+        self._handle("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._handle("DELETE")
+
+    def do_HEAD(self) -> None:
+        """Answer connection warm-ups on any path, with headers only."""
+        path = urlsplit(self.path).path
+        stub = self.server.stub
+        stub._record(RecordedRequest("HEAD", path, dict(self.headers), b""))
+        fault = stub._take_fault(path)
+        self.send_response(204 if fault is None else fault.status)
+        self.send_header("Content-Length", "0")
+        if fault is not None and fault.location is not None:
+            self.send_header("Location", fault.location)
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep test output clean."""
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        url = urlsplit(self.path)
+        stub = self.server.stub
+        stub._record(RecordedRequest(method, url.path, dict(self.headers), raw_body))
+
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        location = None
+        try:
+            fault = stub._take_fault(url.path)
+            if fault is not None:
+                location = fault.location
+                raise StubError(fault.status, "Injected error")
+            if self.headers.get("Authorization") is None:
+                raise StubError(401, "Incorrect API token")
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            body = json.loads(raw_body) if raw_body else {}
+            status, payload = stub._dispatch(
+                method, url.path, query, body, self.headers.get("Idempotency-Key")
+            )
+        except StubError as exc:
+            status, payload = exc.status, {"errors": exc.errors}
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            status, payload = 400, {"errors": [f"Invalid request: {exc}"]}
+        self._respond(status, payload, location)
+
+    def _respond(
+        self, status: int, payload: Payload, location: Optional[str] = None
+    ) -> None:
+        if payload is None:
+            content, content_type = b"", None
+        elif isinstance(payload, bytes):
+            content, content_type = payload, "application/octet-stream"
+        elif isinstance(payload, str):
+            content, content_type = payload.encode(), "text/plain; charset=utf-8"
+        else:
+            content, content_type = json.dumps(payload).encode(), "application/json"
+
+        self.send_response(204 if payload is None and status == 200 else status)
+        if content_type is not None:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        if location is not None:
+            self.send_header("Location", location)
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubServer"
+
+
+class StubServer:
+    """
+    Local stand-in for the Mailtrap API, an HTTP server with the data of
+    one account in memory, for offline integration and load tests.
+
+    It implements sending (including batches and sandbox inboxes), the
+    testing API, contacts, email templates and suppressions closely enough
+    for the client's models. Point a client at it with the server `url`:
+
+        with StubServer() as server:
+            client = mt.MailtrapClient(
+                token="any", api_host=server.url, general_api_host=server.url
+            )
+            client.send(mail)
+            assert server.state.sent
+
+    `latency` delays every response. `error_rate` of the responses fail
+    with `error_status`; `fail_next` injects failures deterministically.
+    Sends with the same `Idempotency-Key` header are accepted once.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+        max_recorded_requests: int = 1000,
+        max_sent: int = 10_000,
+    ) -> None:
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.state = StubState(max_sent)
+        self.requests: deque[RecordedRequest] = deque(maxlen=max_recorded_requests)
+        self.request_count = 0
+
+        self._random = random.Random(seed)
+        self._faults: deque[_Fault] = deque()
+        self._lock = threading.Lock()
+        self._server = _HTTPServer((host, port), _RequestHandler)
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="mailtrap-stub-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._thread = None
+
+    def fail_next(
+        self,
+        status: int = 503,
+        times: int = 1,
+        path_prefix: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> None:
+        """
+        Answer the next `times` requests, optionally only to a path, with
+        `status`. `location` is sent as the `Location` header, for redirects.
+        """
+        with self._lock:
+            self._faults.extend([_Fault(status, path_prefix, location)] * times)
+
+    def _record(self, request: RecordedRequest) -> None:
+        with self._lock:
+            self.request_count += 1
+            self.requests.append(request)
+
+    def _take_fault(self, path: str) -> Optional[_Fault]:
+        with self._lock:
+            for fault in self._faults:
+                if fault.path_prefix is None or path.startswith(fault.path_prefix):
+                    self._faults.remove(fault)
+                    return fault
+            if self.error_rate and self._random.random() < self.error_rate:
+                return _Fault(self.error_status, None)
+        return None
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        query: dict[str, str],
+        body: Any,
+        idempotency_key: Optional[str],
+    ) -> tuple[int, Payload]:
+        state = self.state
+        path_exists = False
+        for route_method, pattern, handler in _ROUTES:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            path_exists = True
+            if route_method != method:
+                continue
+            if method != "POST":
+                idempotency_key = None
+            with state.lock:
+                responses = state.idempotent_responses
+                if idempotency_key is not None:
+                    cached = responses.get((path, idempotency_key))
+                    if cached is not None:
+                        responses.move_to_end((path, idempotency_key))
+                        return 200, cached
+                payload = handler(_Call(state, match, query, body))
+                if idempotency_key is not None and isinstance(payload, dict):
+                    responses[(path, idempotency_key)] = payload
+                    if len(responses) > state.max_idempotent_responses:
+                        responses.popitem(last=False)
+            return 200, payload
+        raise StubError(405 if path_exists else 404, "Not Found")
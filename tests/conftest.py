@@ -1,3 +1,10 @@
+from collections.abc import Iterator
+
+import pytest
+
+from mailtrap.client import MailtrapClient
+from mailtrap.stub_server import StubServer
+
 UNAUTHORIZED_STATUS_CODE = 401
 UNAUTHORIZED_ERROR_MESSAGE = "Incorrect API token"
 UNAUTHORIZED_RESPONSE = {"error": UNAUTHORIZED_ERROR_MESSAGE}
@@ -19,3 +26,21 @@ INTERNAL_SERVER_ERROR_MESSAGE = "Unexpected error"
 INTERNAL_SERVER_ERROR_RESPONSE = {"errors": "Unexpected error"}
 
 VALIDATION_ERRORS_STATUS_CODE = 422
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    """Local stand-in for the Mailtrap API, see `mailtrap.stub_server`."""
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def stub_client(stub_server: StubServer) -> MailtrapClient:
+    """Client with all API hosts pointed at `stub_server`."""
+    return MailtrapClient(
+        token="stub-token",
+        account_id="1",
+        api_host=stub_server.url,
+        general_api_host=stub_server.url,
+    )
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.contact_fields import AsyncContactFieldsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.common import DeletedObject
+from mailtrap.models.contacts import ContactField
+from mailtrap.models.contacts import CreateContactFieldParams
+from mailtrap.models.contacts import UpdateContactFieldParams
+from tests import conftest
+
+ACCOUNT_ID = "321"
+FIELD_ID = 6730
+BASE_CONTACT_FIELDS_URL = (
+    f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/contacts/fields"
+)
+
+
+@pytest.fixture
+def client() -> AsyncContactFieldsApi:
+    return AsyncContactFieldsApi(
+        account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST)
+    )
+
+
+@pytest.fixture
+def sample_contact_field_dict() -> dict[str, Any]:
+    return {
+        "id": FIELD_ID,
+        "name": "First name",
+        "data_type": "text",
+        "merge_tag": "first_name",
+    }
+
+
+class TestAsyncContactFieldsApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+            (
+                conftest.RATE_LIMIT_ERROR_STATUS_CODE,
+                conftest.RATE_LIMIT_ERROR_RESPONSE,
+                conftest.RATE_LIMIT_ERROR_MESSAGE,
+            ),
+            (
+                conftest.INTERNAL_SERVER_ERROR_STATUS_CODE,
+                conftest.INTERNAL_SERVER_ERROR_RESPONSE,
+                conftest.INTERNAL_SERVER_ERROR_MESSAGE,
+            ),
+        ],
+    )
+    @respx.mock
+    def test_get_list_should_raise_api_errors(
+        self,
+        client: AsyncContactFieldsApi,
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.get(BASE_CONTACT_FIELDS_URL).mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.get_list())
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_get_list_should_return_contact_field_list(
+        self, client: AsyncContactFieldsApi, sample_contact_field_dict: dict
+    ) -> None:
+        respx.get(BASE_CONTACT_FIELDS_URL).mock(
+            return_value=httpx.Response(200, json=[sample_contact_field_dict])
+        )
+
+        contact_fields = asyncio.run(client.get_list())
+
+        assert isinstance(contact_fields, list)
+        assert all(isinstance(field, ContactField) for field in contact_fields)
+        assert contact_fields[0].id == FIELD_ID
+
+    @respx.mock
+    def test_get_by_id_should_return_contact_field(
+        self, client: AsyncContactFieldsApi, sample_contact_field_dict: dict
+    ) -> None:
+        respx.get(f"{BASE_CONTACT_FIELDS_URL}/{FIELD_ID}").mock(
+            return_value=httpx.Response(200, json=sample_contact_field_dict)
+        )
+
+        contact_field = asyncio.run(client.get_by_id(FIELD_ID))
+
+        assert isinstance(contact_field, ContactField)
+        assert contact_field.merge_tag == "first_name"
+
+    @respx.mock
+    def test_create_should_return_created_contact_field(
+        self, client: AsyncContactFieldsApi, sample_contact_field_dict: dict
+    ) -> None:
+        route = respx.post(BASE_CONTACT_FIELDS_URL).mock(
+            return_value=httpx.Response(201, json=sample_contact_field_dict)
+        )
+        params = CreateContactFieldParams(
+            name="First name", data_type="text", merge_tag="first_name"
+        )
+
+        contact_field = asyncio.run(client.create(params))
+
+        assert isinstance(contact_field, ContactField)
+        assert contact_field.id == FIELD_ID
+        assert json.loads(route.calls.last.request.read()) == {
+            "name": "First name",
+            "data_type": "text",
+            "merge_tag": "first_name",
+        }
+
+    @respx.mock
+    def test_update_should_return_updated_contact_field(
+        self, client: AsyncContactFieldsApi, sample_contact_field_dict: dict
+    ) -> None:
+        route = respx.patch(f"{BASE_CONTACT_FIELDS_URL}/{FIELD_ID}").mock(
+            return_value=httpx.Response(
+                200, json={**sample_contact_field_dict, "name": "Updated name"}
+            )
+        )
+
+        contact_field = asyncio.run(
+            client.update(FIELD_ID, UpdateContactFieldParams(name="Updated name"))
+        )
+
+        assert contact_field.name == "Updated name"
+        assert json.loads(route.calls.last.request.read()) == {"name": "Updated name"}
+
+    @respx.mock
+    def test_delete_should_return_deleted_object(
+        self, client: AsyncContactFieldsApi
+    ) -> None:
+        respx.delete(f"{BASE_CONTACT_FIELDS_URL}/{FIELD_ID}").mock(
+            return_value=httpx.Response(204)
+        )
+
+        deleted_object = asyncio.run(client.delete(FIELD_ID))
+
+        assert isinstance(deleted_object, DeletedObject)
+        assert deleted_object.id == FIELD_ID
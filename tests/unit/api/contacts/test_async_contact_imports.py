@@ -0,0 +1,143 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.contact_imports import AsyncContactImportsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.contacts import ContactImport
+from mailtrap.models.contacts import ContactImportStatus
+from mailtrap.models.contacts import ImportContactParams
+from tests import conftest
+
+ACCOUNT_ID = "321"
+IMPORT_ID = 1234
+BASE_CONTACT_IMPORTS_URL = (
+    f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/contacts/imports"
+)
+
+
+@pytest.fixture
+def client() -> AsyncContactImportsApi:
+    return AsyncContactImportsApi(
+        account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST)
+    )
+
+
+@pytest.fixture
+def sample_finished_contact_import_dict() -> dict[str, Any]:
+    return {
+        "id": IMPORT_ID,
+        "status": "finished",
+        "created_contacts_count": 1,
+        "updated_contacts_count": 3,
+        "contacts_over_limit_count": 3,
+    }
+
+
+@pytest.fixture
+def import_contacts_params() -> list[ImportContactParams]:
+    return [
+        ImportContactParams(
+            email="john.smith@example.com",
+            fields={"first_name": "John", "last_name": "Smith"},
+            list_ids_included=[1],
+            list_ids_excluded=[2],
+        ),
+        ImportContactParams(
+            email="john.doe@example.com",
+            fields={"first_name": "John", "last_name": "Doe"},
+            list_ids_included=[3],
+            list_ids_excluded=[4],
+        ),
+    ]
+
+
+class TestAsyncContactImportsApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+            (
+                conftest.VALIDATION_ERRORS_STATUS_CODE,
+                {
+                    "errors": [
+                        {
+                            "email": "test@example.com",
+                            "errors": {"base": ["contacts limit reached"]},
+                        }
+                    ]
+                },
+                "contacts limit reached",
+            ),
+        ],
+    )
+    @respx.mock
+    def test_import_contacts_should_raise_api_errors(
+        self,
+        client: AsyncContactImportsApi,
+        import_contacts_params: list[ImportContactParams],
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.post(BASE_CONTACT_IMPORTS_URL).mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.import_contacts(import_contacts_params))
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_import_contacts_should_return_started_import(
+        self,
+        client: AsyncContactImportsApi,
+        import_contacts_params: list[ImportContactParams],
+    ) -> None:
+        route = respx.post(BASE_CONTACT_IMPORTS_URL).mock(
+            return_value=httpx.Response(201, json={"id": IMPORT_ID, "status": "started"})
+        )
+
+        contact_import = asyncio.run(client.import_contacts(import_contacts_params))
+
+        assert isinstance(contact_import, ContactImport)
+        assert contact_import.id == IMPORT_ID
+        assert contact_import.status == ContactImportStatus.STARTED
+        assert json.loads(route.calls.last.request.read()) == {
+            "contacts": [contact.api_data for contact in import_contacts_params]
+        }
+
+    @respx.mock
+    def test_get_by_id_should_return_finished_import(
+        self,
+        client: AsyncContactImportsApi,
+        sample_finished_contact_import_dict: dict,
+    ) -> None:
+        respx.get(f"{BASE_CONTACT_IMPORTS_URL}/{IMPORT_ID}").mock(
+            return_value=httpx.Response(200, json=sample_finished_contact_import_dict)
+        )
+
+        contact_import = asyncio.run(client.get_by_id(IMPORT_ID))
+
+        assert isinstance(contact_import, ContactImport)
+        assert contact_import.status == ContactImportStatus.FINISHED
+        assert contact_import.created_contacts_count == 1
+        assert contact_import.updated_contacts_count == 3
+        assert contact_import.contacts_over_limit_count == 3
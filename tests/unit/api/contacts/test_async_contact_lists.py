@@ -0,0 +1,152 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.contact_lists import AsyncContactListsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.common import DeletedObject
+from mailtrap.models.contacts import ContactList
+from mailtrap.models.contacts import ContactListParams
+from tests import conftest
+
+ACCOUNT_ID = "321"
+LIST_ID = 1234
+BASE_CONTACT_LISTS_URL = (
+    f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/contacts/lists"
+)
+
+
+@pytest.fixture
+def client() -> AsyncContactListsApi:
+    return AsyncContactListsApi(
+        account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST)
+    )
+
+
+@pytest.fixture
+def sample_contact_list_dict() -> dict[str, Any]:
+    return {
+        "id": LIST_ID,
+        "name": "My Contact List",
+    }
+
+
+class TestAsyncContactListsApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+            (
+                conftest.NOT_FOUND_STATUS_CODE,
+                conftest.NOT_FOUND_RESPONSE,
+                conftest.NOT_FOUND_ERROR_MESSAGE,
+            ),
+        ],
+    )
+    @respx.mock
+    def test_get_by_id_should_raise_api_errors(
+        self,
+        client: AsyncContactListsApi,
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.get(f"{BASE_CONTACT_LISTS_URL}/{LIST_ID}").mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.get_by_id(LIST_ID))
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_get_list_should_return_contact_list_list(
+        self, client: AsyncContactListsApi, sample_contact_list_dict: dict
+    ) -> None:
+        respx.get(BASE_CONTACT_LISTS_URL).mock(
+            return_value=httpx.Response(200, json=[sample_contact_list_dict])
+        )
+
+        contact_lists = asyncio.run(client.get_list())
+
+        assert isinstance(contact_lists, list)
+        assert all(isinstance(item, ContactList) for item in contact_lists)
+        assert contact_lists[0].id == LIST_ID
+
+    @respx.mock
+    def test_get_by_id_should_return_contact_list(
+        self, client: AsyncContactListsApi, sample_contact_list_dict: dict
+    ) -> None:
+        respx.get(f"{BASE_CONTACT_LISTS_URL}/{LIST_ID}").mock(
+            return_value=httpx.Response(200, json=sample_contact_list_dict)
+        )
+
+        contact_list = asyncio.run(client.get_by_id(LIST_ID))
+
+        assert isinstance(contact_list, ContactList)
+        assert contact_list.name == "My Contact List"
+
+    @respx.mock
+    def test_create_should_return_created_contact_list(
+        self, client: AsyncContactListsApi, sample_contact_list_dict: dict
+    ) -> None:
+        route = respx.post(BASE_CONTACT_LISTS_URL).mock(
+            return_value=httpx.Response(201, json=sample_contact_list_dict)
+        )
+
+        contact_list = asyncio.run(
+            client.create(ContactListParams(name="My Contact List"))
+        )
+
+        assert isinstance(contact_list, ContactList)
+        assert contact_list.id == LIST_ID
+        assert json.loads(route.calls.last.request.read()) == {"name": "My Contact List"}
+
+    @respx.mock
+    def test_update_should_return_updated_contact_list(
+        self, client: AsyncContactListsApi
+    ) -> None:
+        route = respx.patch(f"{BASE_CONTACT_LISTS_URL}/{LIST_ID}").mock(
+            return_value=httpx.Response(
+                200, json={"id": LIST_ID, "name": "Updated Contact List"}
+            )
+        )
+
+        contact_list = asyncio.run(
+            client.update(LIST_ID, ContactListParams(name="Updated Contact List"))
+        )
+
+        assert contact_list.name == "Updated Contact List"
+        assert json.loads(route.calls.last.request.read()) == {
+            "name": "Updated Contact List"
+        }
+
+    @respx.mock
+    def test_delete_should_return_deleted_object(
+        self, client: AsyncContactListsApi
+    ) -> None:
+        respx.delete(f"{BASE_CONTACT_LISTS_URL}/{LIST_ID}").mock(
+            return_value=httpx.Response(204)
+        )
+
+        deleted_object = asyncio.run(client.delete(LIST_ID))
+
+        assert isinstance(deleted_object, DeletedObject)
+        assert deleted_object.id == LIST_ID
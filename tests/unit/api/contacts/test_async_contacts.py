@@ -0,0 +1,159 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.contacts import AsyncContactsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.common import DeletedObject
+from mailtrap.models.contacts import Contact
+from mailtrap.models.contacts import ContactStatus
+from mailtrap.models.contacts import CreateContactParams
+from mailtrap.models.contacts import UpdateContactParams
+from tests import conftest
+
+ACCOUNT_ID = "321"
+CONTACT_ID = "018dd5e3-f6d2-7c00-8f9b-e5c3f2d8a132"
+BASE_CONTACTS_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/contacts"
+
+
+@pytest.fixture
+def client() -> AsyncContactsApi:
+    return AsyncContactsApi(account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST))
+
+
+@pytest.fixture
+def sample_contact_dict() -> dict[str, Any]:
+    return {
+        "data": {
+            "id": CONTACT_ID,
+            "status": "subscribed",
+            "email": "john.smith@example.com",
+            "fields": {"first_name": "John", "last_name": "Smith"},
+            "list_ids": [1, 2, 3],
+            "created_at": 1742820600230,
+            "updated_at": 1742820600230,
+        }
+    }
+
+
+class TestAsyncContactsApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+            (
+                conftest.NOT_FOUND_STATUS_CODE,
+                conftest.NOT_FOUND_RESPONSE,
+                conftest.NOT_FOUND_ERROR_MESSAGE,
+            ),
+        ],
+    )
+    @respx.mock
+    def test_get_by_id_should_raise_api_errors(
+        self,
+        client: AsyncContactsApi,
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.get(f"{BASE_CONTACTS_URL}/{CONTACT_ID}").mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.get_by_id(CONTACT_ID))
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_get_by_id_should_return_contact(
+        self, client: AsyncContactsApi, sample_contact_dict: dict
+    ) -> None:
+        respx.get(f"{BASE_CONTACTS_URL}/{CONTACT_ID}").mock(
+            return_value=httpx.Response(200, json=sample_contact_dict)
+        )
+
+        contact = asyncio.run(client.get_by_id(CONTACT_ID))
+
+        assert isinstance(contact, Contact)
+        assert contact.id == CONTACT_ID
+        assert contact.status == ContactStatus.SUBSCRIBED
+        assert contact.list_ids == [1, 2, 3]
+
+    @respx.mock
+    def test_get_by_email_should_encode_email(
+        self, client: AsyncContactsApi, sample_contact_dict: dict
+    ) -> None:
+        route = respx.get(f"{BASE_CONTACTS_URL}/john.smith%40example.com").mock(
+            return_value=httpx.Response(200, json=sample_contact_dict)
+        )
+
+        contact = asyncio.run(client.get_by_id("john.smith@example.com"))
+
+        assert route.called
+        assert contact.email == "john.smith@example.com"
+
+    @respx.mock
+    def test_create_should_return_created_contact(
+        self, client: AsyncContactsApi, sample_contact_dict: dict
+    ) -> None:
+        route = respx.post(BASE_CONTACTS_URL).mock(
+            return_value=httpx.Response(201, json=sample_contact_dict)
+        )
+        params = CreateContactParams(
+            email="john.smith@example.com",
+            fields={"first_name": "John", "last_name": "Smith"},
+            list_ids=[1, 2, 3],
+        )
+
+        contact = asyncio.run(client.create(params))
+
+        assert isinstance(contact, Contact)
+        assert contact.id == CONTACT_ID
+        assert json.loads(route.calls.last.request.read()) == {"contact": params.api_data}
+
+    @respx.mock
+    def test_update_should_return_updated_contact(
+        self, client: AsyncContactsApi, sample_contact_dict: dict
+    ) -> None:
+        updated_contact_dict = {
+            "data": {**sample_contact_dict["data"], "email": "john.updated@example.com"}
+        }
+        route = respx.patch(f"{BASE_CONTACTS_URL}/{CONTACT_ID}").mock(
+            return_value=httpx.Response(200, json=updated_contact_dict)
+        )
+        params = UpdateContactParams(email="john.updated@example.com")
+
+        contact = asyncio.run(client.update(CONTACT_ID, params))
+
+        assert contact.email == "john.updated@example.com"
+        assert json.loads(route.calls.last.request.read()) == {
+            "contact": {"email": "john.updated@example.com"}
+        }
+
+    @respx.mock
+    def test_delete_should_return_deleted_object(self, client: AsyncContactsApi) -> None:
+        respx.delete(f"{BASE_CONTACTS_URL}/{CONTACT_ID}").mock(
+            return_value=httpx.Response(204)
+        )
+
+        deleted_object = asyncio.run(client.delete(CONTACT_ID))
+
+        assert isinstance(deleted_object, DeletedObject)
+        assert deleted_object.id == CONTACT_ID
@@ -1,3 +1,4 @@
+import json
 from typing import Any
 
 import pytest
@@ -136,6 +137,10 @@ class TestContactImportsApi:
         assert isinstance(contact_import, ContactImport)
         assert contact_import.id == IMPORT_ID
         assert contact_import.status == ContactImportStatus.STARTED
+        request = responses.calls[0].request  # type: ignore
+        assert json.loads(request.body) == {
+            "contacts": [contact.api_data for contact in import_contacts_params]
+        }
 
     @pytest.mark.parametrize(
         "status_code,response_json,expected_error_message",
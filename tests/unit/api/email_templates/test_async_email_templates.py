@@ -0,0 +1,158 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.templates import AsyncTemplatesApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.common import DeletedObject
+from mailtrap.models.templates import CreateEmailTemplateParams
+from mailtrap.models.templates import EmailTemplate
+from mailtrap.models.templates import UpdateEmailTemplateParams
+from tests import conftest
+
+ACCOUNT_ID = "321"
+TEMPLATE_ID = 26730
+BASE_TEMPLATES_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/email_templates"
+
+
+@pytest.fixture
+def client() -> AsyncTemplatesApi:
+    return AsyncTemplatesApi(account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST))
+
+
+@pytest.fixture
+def sample_template_dict() -> dict[str, Any]:
+    return {
+        "id": TEMPLATE_ID,
+        "name": "Promotion Template",
+        "uuid": "b81aabcd-1a1e-41cf-91b6-eca0254b3d96",
+        "category": "Promotion",
+        "subject": "Promotion Template subject",
+        "body_text": "Text body",
+        "body_html": "<div>body</div>",
+        "created_at": "2025-01-01T10:00:00Z",
+        "updated_at": "2025-01-02T10:00:00Z",
+    }
+
+
+class TestAsyncTemplatesApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+        ],
+    )
+    @respx.mock
+    def test_get_list_should_raise_api_errors(
+        self,
+        client: AsyncTemplatesApi,
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.get(BASE_TEMPLATES_URL).mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.get_list())
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_get_list_should_return_template_list(
+        self, client: AsyncTemplatesApi, sample_template_dict: dict
+    ) -> None:
+        respx.get(BASE_TEMPLATES_URL).mock(
+            return_value=httpx.Response(200, json=[sample_template_dict])
+        )
+
+        templates = asyncio.run(client.get_list())
+
+        assert isinstance(templates, list)
+        assert all(isinstance(t, EmailTemplate) for t in templates)
+        assert templates[0].id == TEMPLATE_ID
+
+    @respx.mock
+    def test_get_by_id_should_return_single_template(
+        self, client: AsyncTemplatesApi, sample_template_dict: dict
+    ) -> None:
+        respx.get(f"{BASE_TEMPLATES_URL}/{TEMPLATE_ID}").mock(
+            return_value=httpx.Response(200, json=sample_template_dict)
+        )
+
+        template = asyncio.run(client.get_by_id(TEMPLATE_ID))
+
+        assert isinstance(template, EmailTemplate)
+        assert template.uuid == sample_template_dict["uuid"]
+
+    @respx.mock
+    def test_create_should_return_new_template(
+        self, client: AsyncTemplatesApi, sample_template_dict: dict
+    ) -> None:
+        route = respx.post(BASE_TEMPLATES_URL).mock(
+            return_value=httpx.Response(201, json=sample_template_dict)
+        )
+        params = CreateEmailTemplateParams(
+            name="Promotion Template",
+            subject="Promotion Template subject",
+            category="Promotion",
+        )
+
+        template = asyncio.run(client.create(params))
+
+        assert isinstance(template, EmailTemplate)
+        assert template.name == "Promotion Template"
+        assert json.loads(route.calls.last.request.read()) == {
+            "email_template": {
+                "name": "Promotion Template",
+                "subject": "Promotion Template subject",
+                "category": "Promotion",
+            }
+        }
+
+    @respx.mock
+    def test_update_should_return_updated_template(
+        self, client: AsyncTemplatesApi, sample_template_dict: dict
+    ) -> None:
+        route = respx.patch(f"{BASE_TEMPLATES_URL}/{TEMPLATE_ID}").mock(
+            return_value=httpx.Response(
+                200, json={**sample_template_dict, "name": "Updated Template"}
+            )
+        )
+
+        template = asyncio.run(
+            client.update(TEMPLATE_ID, UpdateEmailTemplateParams(name="Updated Template"))
+        )
+
+        assert template.name == "Updated Template"
+        assert json.loads(route.calls.last.request.read()) == {
+            "email_template": {"name": "Updated Template"}
+        }
+
+    @respx.mock
+    def test_delete_should_return_deleted_object(self, client: AsyncTemplatesApi) -> None:
+        respx.delete(f"{BASE_TEMPLATES_URL}/{TEMPLATE_ID}").mock(
+            return_value=httpx.Response(204)
+        )
+
+        deleted_object = asyncio.run(client.delete(TEMPLATE_ID))
+
+        assert isinstance(deleted_object, DeletedObject)
+        assert deleted_object.id == TEMPLATE_ID
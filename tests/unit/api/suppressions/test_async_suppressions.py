@@ -0,0 +1,130 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.suppressions import AsyncSuppressionsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.suppressions import SendingStream
+from mailtrap.models.suppressions import Suppression
+from mailtrap.models.suppressions import SuppressionType
+from tests import conftest
+
+ACCOUNT_ID = "321"
+SUPPRESSION_ID = "supp_123456"
+BASE_SUPPRESSIONS_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/suppressions"
+
+
+@pytest.fixture
+def client() -> AsyncSuppressionsApi:
+    return AsyncSuppressionsApi(
+        account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST)
+    )
+
+
+@pytest.fixture
+def sample_suppression_dict() -> dict[str, Any]:
+    return {
+        "id": SUPPRESSION_ID,
+        "type": "unsubscription",
+        "created_at": "2024-12-26T09:40:44.161Z",
+        "email": "recipient@example.com",
+        "sending_stream": "transactional",
+        "domain_name": "sender.com",
+        "message_bounce_category": None,
+        "message_category": "Welcome email",
+        "message_client_ip": "123.123.123.123",
+        "message_created_at": "2024-12-26T07:10:00.889Z",
+        "message_outgoing_ip": "1.1.1.1",
+        "message_recipient_mx_name": "Other Providers",
+        "message_sender_email": "hello@sender.com",
+        "message_subject": "Welcome!",
+    }
+
+
+class TestAsyncSuppressionsApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+            (
+                conftest.NOT_FOUND_STATUS_CODE,
+                conftest.NOT_FOUND_RESPONSE,
+                conftest.NOT_FOUND_ERROR_MESSAGE,
+            ),
+        ],
+    )
+    @respx.mock
+    def test_delete_should_raise_api_errors(
+        self,
+        client: AsyncSuppressionsApi,
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.delete(f"{BASE_SUPPRESSIONS_URL}/{SUPPRESSION_ID}").mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.delete(SUPPRESSION_ID))
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_get_list_should_return_suppression_list(
+        self, client: AsyncSuppressionsApi, sample_suppression_dict: dict
+    ) -> None:
+        route = respx.get(BASE_SUPPRESSIONS_URL).mock(
+            return_value=httpx.Response(200, json=[sample_suppression_dict])
+        )
+
+        suppressions = asyncio.run(client.get_list())
+
+        assert isinstance(suppressions, list)
+        assert all(isinstance(s, Suppression) for s in suppressions)
+        assert suppressions[0].id == SUPPRESSION_ID
+        assert not route.calls.last.request.url.params
+
+    @respx.mock
+    def test_get_list_with_email_filter_should_send_email_param(
+        self, client: AsyncSuppressionsApi, sample_suppression_dict: dict
+    ) -> None:
+        email_filter = "recipient@example.com"
+        route = respx.get(BASE_SUPPRESSIONS_URL, params={"email": email_filter}).mock(
+            return_value=httpx.Response(200, json=[sample_suppression_dict])
+        )
+
+        suppressions = asyncio.run(client.get_list(email=email_filter))
+
+        assert route.called
+        assert suppressions[0].email == email_filter
+
+    @respx.mock
+    def test_delete_should_return_deleted_suppression(
+        self, client: AsyncSuppressionsApi, sample_suppression_dict: dict
+    ) -> None:
+        respx.delete(f"{BASE_SUPPRESSIONS_URL}/{SUPPRESSION_ID}").mock(
+            return_value=httpx.Response(200, json=sample_suppression_dict)
+        )
+
+        suppression = asyncio.run(client.delete(SUPPRESSION_ID))
+
+        assert isinstance(suppression, Suppression)
+        assert suppression.id == SUPPRESSION_ID
+        assert suppression.type == SuppressionType.UNSUBSCRIPTION
+        assert suppression.sending_stream == SendingStream.TRANSACTIONAL
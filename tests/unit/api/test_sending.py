@@ -1,13 +1,18 @@
 import json
+from collections.abc import Iterator
+from typing import Any
 
 import pytest
 import responses
+from requests import ConnectionError
 
 import mailtrap as mt
 from mailtrap.api.sending import SendingApi
 from mailtrap.config import SENDING_HOST
+from mailtrap.dedup import get_idempotency_key
 from mailtrap.http import HttpClient
 from mailtrap.models.mail.base import SendingMailResponse
+from mailtrap.models.mail.batch import BatchSendResponse
 
 ACCOUNT_ID = "321"
 PROJECT_ID = 123
@@ -29,6 +34,7 @@ DUMMY_MAIL_FROM_TEMPLATE = mt.MailFromTemplate(
 MAIL_ENTITIES = [DUMMY_MAIL, DUMMY_MAIL_FROM_TEMPLATE]
 
 SEND_FULL_URL = f"https://{SENDING_HOST}/api/send"
+BATCH_FULL_URL = f"https://{SENDING_HOST}/api/batch"
 
 
 def get_sending_api() -> SendingApi:
@@ -94,4 +100,279 @@ class TestSendingApi:
         assert result.success is True
         assert len(responses.calls) == 1
         request = responses.calls[0].request  # type: ignore
-        assert request.body == json.dumps(mail.api_data).encode()
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.body == mail.to_json_bytes()
+        assert json.loads(request.body) == mail.api_data
+
+    @responses.activate
+    def test_send_with_idempotency_key_should_send_header_and_be_retried(
+        self,
+    ) -> None:
+        responses.post(SEND_FULL_URL, json={"errors": ["Unavailable"]}, status=503)
+        responses.post(SEND_FULL_URL, json={"success": True, "message_ids": ["1"]})
+        retry_policy = mt.RetryPolicy(backoff_base=0, retry_keyed_sends=True)
+        api = SendingApi(client=HttpClient(SENDING_HOST, retry_policy=retry_policy))
+
+        response = api.send(DUMMY_MAIL, idempotency_key="key-1")
+
+        assert response.message_ids == ["1"]
+        assert len(responses.calls) == 2
+        for call in responses.calls:
+            assert call.request.headers["Idempotency-Key"] == "key-1"
+            assert call.request.headers["Content-Type"] == "application/json"
+
+    @responses.activate
+    def test_send_with_idempotency_key_should_not_be_retried_by_default(
+        self,
+    ) -> None:
+        responses.post(SEND_FULL_URL, json={"errors": ["Unavailable"]}, status=503)
+        client = HttpClient(SENDING_HOST, retry_policy=mt.RetryPolicy(backoff_base=0))
+        api = SendingApi(client=client)
+
+        with pytest.raises(mt.APIError):
+            api.send(DUMMY_MAIL, idempotency_key="key-1")
+
+        assert len(responses.calls) == 1
+        assert responses.calls[0].request.headers["Idempotency-Key"] == "key-1"
+
+    @responses.activate
+    def test_send_without_idempotency_key_should_not_be_retried(self) -> None:
+        responses.post(SEND_FULL_URL, json={"errors": ["Unavailable"]}, status=503)
+        client = HttpClient(SENDING_HOST, retry_policy=mt.RetryPolicy(backoff_base=0))
+        api = SendingApi(client=client)
+
+        with pytest.raises(mt.APIError):
+            api.send(DUMMY_MAIL)
+
+        assert len(responses.calls) == 1
+        assert "Idempotency-Key" not in responses.calls[0].request.headers
+
+    @responses.activate
+    def test_send_with_dedup_cache_should_suppress_repeated_mail(self) -> None:
+        responses.post(SEND_FULL_URL, json={"success": True, "message_ids": ["1"]})
+        cache = mt.DedupCache()
+        api = SendingApi(client=HttpClient(SENDING_HOST), dedup_cache=cache)
+
+        first = api.send(DUMMY_MAIL)
+        repeated = api.send(DUMMY_MAIL)
+        other = api.send(DUMMY_MAIL_FROM_TEMPLATE)
+
+        assert first == repeated == SendingMailResponse(success=True, message_ids=["1"])
+        assert other.message_ids == ["1"]
+        assert len(responses.calls) == 2
+        assert cache.hits == 1
+        keys = {call.request.headers["Idempotency-Key"] for call in responses.calls}
+        assert keys == {
+            get_idempotency_key(DUMMY_MAIL.to_json_bytes()),
+            get_idempotency_key(DUMMY_MAIL_FROM_TEMPLATE.to_json_bytes()),
+        }
+
+    @responses.activate
+    def test_send_with_dedup_cache_should_not_record_failed_send(self) -> None:
+        responses.post(SEND_FULL_URL, json={"errors": ["Bad request"]}, status=400)
+        responses.post(SEND_FULL_URL, json={"success": True, "message_ids": ["1"]})
+        cache = mt.DedupCache()
+        api = SendingApi(client=HttpClient(SENDING_HOST), dedup_cache=cache)
+
+        with pytest.raises(mt.APIError):
+            api.send(DUMMY_MAIL, idempotency_key="key-1")
+        response = api.send(DUMMY_MAIL, idempotency_key="key-1")
+
+        assert response.message_ids == ["1"]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_send_batch_should_post_base_and_requests(self) -> None:
+        response_body = {
+            "success": True,
+            "responses": [
+                {"success": True, "message_ids": ["1"]},
+                {"success": False, "errors": ["'to' address is invalid"]},
+            ],
+        }
+        responses.post(BATCH_FULL_URL, json=response_body)
+        base = mt.BatchMail(sender=DUMMY_ADDRESS, subject="Email subject")
+        requests = [
+            mt.BatchEmailRequest(to=[DUMMY_ADDRESS]),
+            mt.BatchEmailRequest(to=[DUMMY_ADDRESS], subject="Overridden subject"),
+        ]
+
+        api = get_sending_api()
+        result = api.send_batch(base, requests)
+
+        assert isinstance(result, BatchSendResponse)
+        assert [item.success for item in result.responses] == [True, False]
+        assert result.responses[0].message_ids == ["1"]
+        assert result.responses[1].errors == ["'to' address is invalid"]
+        request = responses.calls[0].request  # type: ignore
+        assert json.loads(request.body) == {
+            "base": {"from": {"email": "joe@mail.com"}, "subject": "Email subject"},
+            "requests": [
+                {"to": [{"email": "joe@mail.com"}]},
+                {"to": [{"email": "joe@mail.com"}], "subject": "Overridden subject"},
+            ],
+        }
+
+    @responses.activate
+    def test_send_batch_should_use_sandbox_inbox_url(self) -> None:
+        responses.post(f"{BATCH_FULL_URL}/{INBOX_ID}", json={"success": True})
+
+        api = SendingApi(client=HttpClient(SENDING_HOST), inbox_id=INBOX_ID)
+        result = api.send_batch(None, [mt.BatchEmailRequest(to=[DUMMY_ADDRESS])])
+
+        assert result.success is True
+        request = responses.calls[0].request  # type: ignore
+        assert "base" not in json.loads(request.body)
+
+    @responses.activate
+    def test_send_in_batches_should_split_mails_and_keep_order(self) -> None:
+        def callback(request: Any) -> tuple[int, dict, str]:
+            batch = json.loads(request.body)["requests"]
+            items = [
+                {"success": True, "message_ids": [mail["subject"]]} for mail in batch
+            ]
+            return 200, {}, json.dumps({"success": True, "responses": items})
+
+        responses.add_callback(responses.POST, BATCH_FULL_URL, callback=callback)
+        mails = (
+            mt.Mail(sender=DUMMY_ADDRESS, to=[DUMMY_ADDRESS], subject=str(i))
+            for i in range(5)
+        )
+
+        api = get_sending_api()
+        results = api.send_in_batches(mails, batch_size=2)
+
+        assert len(responses.calls) == 3
+        assert [item.message_ids for item in results] == [[str(i)] for i in range(5)]
+
+    @responses.activate
+    def test_send_in_batches_should_mark_rejected_batch_as_failed(self) -> None:
+        responses.post(BATCH_FULL_URL, json={"errors": ["Invalid batch"]}, status=422)
+        responses.post(
+            BATCH_FULL_URL,
+            json={"success": True, "responses": [{"success": True, "message_ids": []}]},
+        )
+
+        api = get_sending_api()
+        results = api.send_in_batches([DUMMY_MAIL] * 3, batch_size=2)
+
+        assert [item.success for item in results] == [False, False, True]
+        assert results[0].errors == ["Invalid batch"]
+
+    @responses.activate
+    def test_send_in_batches_should_mark_unsent_batch_as_failed(self) -> None:
+        responses.post(BATCH_FULL_URL, body=ConnectionError("Connection reset"))
+        responses.post(
+            BATCH_FULL_URL,
+            json={"success": True, "responses": [{"success": True, "message_ids": []}]},
+        )
+
+        api = get_sending_api()
+        results = api.send_in_batches([DUMMY_MAIL] * 3, batch_size=2)
+
+        assert [item.success for item in results] == [False, False, True]
+        assert results[0].errors == ["Connection reset"]
+        assert results[0] is not results[1]
+        assert results[0].errors is not results[1].errors
+
+    @responses.activate
+    def test_send_in_batches_should_fail_batch_with_missing_results(self) -> None:
+        responses.post(
+            BATCH_FULL_URL,
+            json={"success": True, "responses": [{"success": True, "message_ids": []}]},
+        )
+
+        api = get_sending_api()
+        results = api.send_in_batches([DUMMY_MAIL] * 2)
+
+        assert [item.success for item in results] == [False, False]
+        assert results[0].errors == ["Expected 2 results in the batch response, got 1"]
+
+    @pytest.mark.parametrize("size", [0, 501])
+    def test_send_batch_should_validate_batch_size(self, size: int) -> None:
+        api = get_sending_api()
+
+        with pytest.raises(ValueError):
+            api.send_batch(None, [mt.BatchEmailRequest(to=[DUMMY_ADDRESS])] * size)
+
+    @responses.activate
+    def test_send_in_batches_should_raise_authorization_error(self) -> None:
+        responses.post(BATCH_FULL_URL, json={"errors": ["Unauthorized"]}, status=401)
+
+        api = get_sending_api()
+
+        with pytest.raises(mt.AuthorizationError):
+            api.send_in_batches([DUMMY_MAIL])
+
+    @pytest.mark.parametrize("batch_size", [0, 501])
+    def test_send_in_batches_should_validate_batch_size(self, batch_size: int) -> None:
+        api = get_sending_api()
+
+        with pytest.raises(ValueError):
+            api.send_in_batches([DUMMY_MAIL], batch_size=batch_size)
+
+    @staticmethod
+    def echo_subject(request: Any) -> tuple[int, dict, str]:
+        subject = json.loads(request.body)["subject"]
+        if subject == "fail":
+            return 500, {}, json.dumps({"errors": ["Internal error"]})
+        return 200, {}, json.dumps({"success": True, "message_ids": [subject]})
+
+    @responses.activate
+    def test_send_many_should_keep_input_order(self) -> None:
+        responses.add_callback(responses.POST, SEND_FULL_URL, callback=self.echo_subject)
+        subjects = [str(i) for i in range(10)]
+        subjects[3] = "fail"
+        mails = [
+            mt.Mail(sender=DUMMY_ADDRESS, to=[DUMMY_ADDRESS], subject=subject)
+            for subject in subjects
+        ]
+
+        api = get_sending_api()
+        results = list(api.send_many(mails, concurrency=3))
+
+        assert [result.index for result in results] == list(range(10))
+        assert [result.mail for result in results] == mails
+        assert [result.success for result in results].count(False) == 1
+        assert isinstance(results[3].error, mt.APIError)
+        assert results[4].response == SendingMailResponse(success=True, message_ids=["4"])
+
+    @responses.activate
+    def test_send_many_unordered_should_return_every_result(self) -> None:
+        responses.add_callback(responses.POST, SEND_FULL_URL, callback=self.echo_subject)
+        mails = [
+            mt.Mail(sender=DUMMY_ADDRESS, to=[DUMMY_ADDRESS], subject=str(i))
+            for i in range(10)
+        ]
+
+        api = get_sending_api()
+        results = list(api.send_many(mails, concurrency=3, ordered=False))
+
+        assert sorted(result.index for result in results) == list(range(10))
+        assert all(result.success for result in results)
+
+    @responses.activate
+    def test_send_many_should_consume_mails_lazily(self) -> None:
+        responses.add_callback(responses.POST, SEND_FULL_URL, callback=self.echo_subject)
+        consumed = 0
+
+        def mails() -> Iterator[mt.Mail]:
+            nonlocal consumed
+            for i in range(1000):
+                consumed += 1
+                yield mt.Mail(sender=DUMMY_ADDRESS, to=[DUMMY_ADDRESS], subject=str(i))
+
+        api = get_sending_api()
+        results = api.send_many(mails(), concurrency=2)
+        first = next(results)
+        results.close()
+
+        assert first.index == 0
+        assert consumed <= 4
+        assert len(responses.calls) <= 4
+
+    def test_send_many_should_validate_concurrency(self) -> None:
+        api = get_sending_api()
+
+        with pytest.raises(ValueError):
+            next(api.send_many([DUMMY_MAIL], concurrency=0))
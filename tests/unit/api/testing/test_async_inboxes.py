@@ -0,0 +1,207 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.inboxes import AsyncInboxesApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.inboxes import CreateInboxParams
+from mailtrap.models.inboxes import Inbox
+from mailtrap.models.inboxes import UpdateInboxParams
+from tests import conftest
+
+ACCOUNT_ID = "321"
+INBOX_ID = 3538
+PROJECT_ID = 2293
+BASE_INBOXES_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/inboxes"
+BASE_PROJECT_INBOXES_URL = (
+    f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/projects/{PROJECT_ID}/inboxes"
+)
+
+
+@pytest.fixture
+def client() -> AsyncInboxesApi:
+    return AsyncInboxesApi(account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST))
+
+
+@pytest.fixture
+def sample_inbox_dict() -> dict[str, Any]:
+    return {
+        "id": INBOX_ID,
+        "name": "Admin Inbox",
+        "username": "b3a87978452ae1",
+        "password": "6be9fcfc613a7c",
+        "max_size": 0,
+        "status": "active",
+        "email_username": "b7eae548c3-54c542",
+        "email_username_enabled": False,
+        "sent_messages_count": 52,
+        "forwarded_messages_count": 0,
+        "used": False,
+        "forward_from_email_address": "a3538-i4088@forward.mailtrap.info",
+        "project_id": PROJECT_ID,
+        "domain": "localhost",
+        "pop3_domain": "localhost",
+        "email_domain": "localhost",
+        "api_domain": "localhost",
+        "emails_count": 0,
+        "emails_unread_count": 0,
+        "last_message_sent_at": None,
+        "smtp_ports": [25, 465, 587, 2525],
+        "pop3_ports": [1100, 9950],
+        "max_message_size": 5242880,
+        "permissions": {
+            "can_read": True,
+            "can_update": True,
+            "can_destroy": True,
+            "can_leave": True,
+        },
+    }
+
+
+class TestAsyncInboxesApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+            (
+                conftest.NOT_FOUND_STATUS_CODE,
+                conftest.NOT_FOUND_RESPONSE,
+                conftest.NOT_FOUND_ERROR_MESSAGE,
+            ),
+        ],
+    )
+    @respx.mock
+    def test_get_by_id_should_raise_api_errors(
+        self,
+        client: AsyncInboxesApi,
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.get(f"{BASE_INBOXES_URL}/{INBOX_ID}").mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.get_by_id(INBOX_ID))
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_get_list_should_return_inbox_list(
+        self, client: AsyncInboxesApi, sample_inbox_dict: dict
+    ) -> None:
+        respx.get(BASE_INBOXES_URL).mock(
+            return_value=httpx.Response(200, json=[sample_inbox_dict])
+        )
+
+        inboxes = asyncio.run(client.get_list())
+
+        assert isinstance(inboxes, list)
+        assert all(isinstance(inbox, Inbox) for inbox in inboxes)
+        assert inboxes[0].id == INBOX_ID
+
+    @respx.mock
+    def test_get_by_id_should_return_single_inbox(
+        self, client: AsyncInboxesApi, sample_inbox_dict: dict
+    ) -> None:
+        respx.get(f"{BASE_INBOXES_URL}/{INBOX_ID}").mock(
+            return_value=httpx.Response(200, json=sample_inbox_dict)
+        )
+
+        inbox = asyncio.run(client.get_by_id(INBOX_ID))
+
+        assert isinstance(inbox, Inbox)
+        assert inbox.id == INBOX_ID
+
+    @respx.mock
+    def test_create_should_return_new_inbox(
+        self, client: AsyncInboxesApi, sample_inbox_dict: dict
+    ) -> None:
+        route = respx.post(BASE_PROJECT_INBOXES_URL).mock(
+            return_value=httpx.Response(201, json=sample_inbox_dict)
+        )
+
+        inbox = asyncio.run(
+            client.create(PROJECT_ID, CreateInboxParams(name="Admin Inbox"))
+        )
+
+        assert isinstance(inbox, Inbox)
+        assert inbox.name == "Admin Inbox"
+        request_body = json.loads(route.calls.last.request.read())
+        assert request_body == {"inbox": {"name": "Admin Inbox"}}
+
+    @respx.mock
+    def test_update_should_return_updated_inbox(
+        self, client: AsyncInboxesApi, sample_inbox_dict: dict
+    ) -> None:
+        route = respx.patch(f"{BASE_INBOXES_URL}/{INBOX_ID}").mock(
+            return_value=httpx.Response(
+                200, json={**sample_inbox_dict, "name": "Updated Inbox"}
+            )
+        )
+
+        inbox = asyncio.run(
+            client.update(INBOX_ID, UpdateInboxParams(name="Updated Inbox"))
+        )
+
+        assert inbox.name == "Updated Inbox"
+        request_body = json.loads(route.calls.last.request.read())
+        assert request_body == {"inbox": {"name": "Updated Inbox"}}
+
+    @respx.mock
+    def test_delete_should_return_deleted_inbox(
+        self, client: AsyncInboxesApi, sample_inbox_dict: dict
+    ) -> None:
+        respx.delete(f"{BASE_INBOXES_URL}/{INBOX_ID}").mock(
+            return_value=httpx.Response(200, json=sample_inbox_dict)
+        )
+
+        inbox = asyncio.run(client.delete(INBOX_ID))
+
+        assert isinstance(inbox, Inbox)
+        assert inbox.id == INBOX_ID
+
+    @pytest.mark.parametrize(
+        "method_name,path",
+        [
+            ("clean", "clean"),
+            ("mark_as_read", "all_read"),
+            ("reset_credentials", "reset_credentials"),
+            ("enable_email_address", "toggle_email_username"),
+            ("reset_email_username", "reset_email_username"),
+        ],
+    )
+    @respx.mock
+    def test_inbox_actions_should_return_inbox(
+        self,
+        client: AsyncInboxesApi,
+        sample_inbox_dict: dict,
+        method_name: str,
+        path: str,
+    ) -> None:
+        route = respx.patch(f"{BASE_INBOXES_URL}/{INBOX_ID}/{path}").mock(
+            return_value=httpx.Response(200, json=sample_inbox_dict)
+        )
+
+        inbox = asyncio.run(getattr(client, method_name)(INBOX_ID))
+
+        assert isinstance(inbox, Inbox)
+        assert inbox.id == INBOX_ID
+        assert route.called
@@ -0,0 +1,134 @@
+import asyncio
+from io import BytesIO
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.messages import AsyncMessagesApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.messages import EmailMessage
+from tests import conftest
+
+ACCOUNT_ID = "321"
+INBOX_ID = 3538
+MESSAGE_ID = 2323
+BASE_MESSAGES_URL = (
+    f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/inboxes/{INBOX_ID}/messages"
+)
+
+
+@pytest.fixture
+def client() -> AsyncMessagesApi:
+    return AsyncMessagesApi(account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST))
+
+
+def message_dict(message_id: int) -> dict[str, Any]:
+    return {
+        "id": message_id,
+        "inbox_id": INBOX_ID,
+        "subject": "Test email",
+        "sent_at": "2022-07-01T19:29:59.295Z",
+        "from_email": "john@mailtrap.io",
+        "from_name": "John",
+        "to_email": "mary@mailtrap.io",
+        "to_name": "Mary",
+        "email_size": 300,
+        "is_read": False,
+        "created_at": "2022-07-01T19:29:59.295Z",
+        "updated_at": "2022-07-01T19:29:59.295Z",
+        "html_body_size": 150,
+        "text_body_size": 100,
+        "human_size": "300 Bytes",
+        "html_path": "/body.html",
+        "txt_path": "/body.txt",
+        "raw_path": "/body.raw",
+        "download_path": "/body.eml",
+        "html_source_path": "/body.htmlsource",
+        "blacklists_report_info": False,
+        "smtp_information": {"ok": True},
+    }
+
+
+async def collect(client: AsyncMessagesApi, prefetch: bool) -> list[EmailMessage]:
+    return [m async for m in client.iter_messages(INBOX_ID, prefetch=prefetch)]
+
+
+class TestAsyncMessagesApi:
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    @respx.mock
+    def test_iter_messages_should_walk_pages_by_last_id(
+        self, client: AsyncMessagesApi, prefetch: bool
+    ) -> None:
+        route = respx.get(BASE_MESSAGES_URL)
+        route.side_effect = [
+            httpx.Response(200, json=[message_dict(30), message_dict(20)]),
+            httpx.Response(200, json=[message_dict(10)]),
+            httpx.Response(200, json=[]),
+        ]
+
+        messages = asyncio.run(collect(client, prefetch))
+
+        assert [m.id for m in messages] == [30, 20, 10]
+        assert route.call_count == 3
+        assert "last_id" not in route.calls[0].request.url.params
+        assert route.calls[1].request.url.params["last_id"] == "20"
+        assert route.calls[2].request.url.params["last_id"] == "10"
+
+    @respx.mock
+    def test_iter_messages_should_raise_api_errors(
+        self, client: AsyncMessagesApi
+    ) -> None:
+        respx.get(BASE_MESSAGES_URL).mock(
+            return_value=httpx.Response(
+                conftest.UNAUTHORIZED_STATUS_CODE, json=conftest.UNAUTHORIZED_RESPONSE
+            )
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(collect(client, prefetch=False))
+
+        assert conftest.UNAUTHORIZED_ERROR_MESSAGE in str(exc_info.value)
+
+    @respx.mock
+    def test_get_body_bytes_should_return_undecoded_body(
+        self, client: AsyncMessagesApi
+    ) -> None:
+        body = "Subject: Café\r\n\r\nBody".encode("latin-1")
+        respx.get(f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.eml").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+
+        assert asyncio.run(client.get_body_bytes(INBOX_ID, MESSAGE_ID)) == body
+
+    @respx.mock
+    def test_download_body_should_write_to_file(self, client: AsyncMessagesApi) -> None:
+        body = b"Subject: Test\r\n\r\n" + b"x" * 100_000
+        respx.get(f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.raw").mock(
+            return_value=httpx.Response(200, content=body)
+        )
+        file = BytesIO()
+
+        size = asyncio.run(client.download_body(INBOX_ID, MESSAGE_ID, file, "raw"))
+
+        assert size == len(body)
+        assert file.getvalue() == body
+
+    @respx.mock
+    def test_download_body_should_raise_api_errors(
+        self, client: AsyncMessagesApi
+    ) -> None:
+        respx.get(f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.eml").mock(
+            return_value=httpx.Response(
+                conftest.FORBIDDEN_STATUS_CODE, json=conftest.FORBIDDEN_RESPONSE
+            )
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.download_body(INBOX_ID, MESSAGE_ID, BytesIO()))
+
+        assert conftest.FORBIDDEN_ERROR_MESSAGE in str(exc_info.value)
@@ -0,0 +1,117 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from mailtrap.api.resources.projects import AsyncProjectsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import AsyncHttpClient
+from mailtrap.models.common import DeletedObject
+from mailtrap.models.projects import Project
+from mailtrap.models.projects import ProjectParams
+from tests import conftest
+
+ACCOUNT_ID = "321"
+PROJECT_ID = 123
+BASE_PROJECTS_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/projects"
+
+
+@pytest.fixture
+def client() -> AsyncProjectsApi:
+    return AsyncProjectsApi(account_id=ACCOUNT_ID, client=AsyncHttpClient(GENERAL_HOST))
+
+
+@pytest.fixture
+def sample_project_dict() -> dict[str, Any]:
+    return {
+        "id": PROJECT_ID,
+        "name": "Test Project",
+        "inboxes": [],
+        "share_links": {
+            "admin": "https://mailtrap.io/projects/321/admin",
+            "viewer": "https://mailtrap.io/projects/321/viewer",
+        },
+        "permissions": {
+            "can_read": True,
+            "can_update": True,
+            "can_destroy": True,
+            "can_leave": True,
+        },
+    }
+
+
+class TestAsyncProjectsApi:
+
+    @pytest.mark.parametrize(
+        "status_code,response_json,expected_error_message",
+        [
+            (
+                conftest.UNAUTHORIZED_STATUS_CODE,
+                conftest.UNAUTHORIZED_RESPONSE,
+                conftest.UNAUTHORIZED_ERROR_MESSAGE,
+            ),
+            (
+                conftest.FORBIDDEN_STATUS_CODE,
+                conftest.FORBIDDEN_RESPONSE,
+                conftest.FORBIDDEN_ERROR_MESSAGE,
+            ),
+        ],
+    )
+    @respx.mock
+    def test_get_list_should_raise_api_errors(
+        self,
+        client: AsyncProjectsApi,
+        status_code: int,
+        response_json: dict,
+        expected_error_message: str,
+    ) -> None:
+        respx.get(BASE_PROJECTS_URL).mock(
+            return_value=httpx.Response(status_code, json=response_json)
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.get_list())
+
+        assert expected_error_message in str(exc_info.value)
+
+    @respx.mock
+    def test_get_list_should_return_project_list(
+        self, client: AsyncProjectsApi, sample_project_dict: dict
+    ) -> None:
+        respx.get(BASE_PROJECTS_URL).mock(
+            return_value=httpx.Response(200, json=[sample_project_dict])
+        )
+
+        projects = asyncio.run(client.get_list())
+
+        assert isinstance(projects, list)
+        assert all(isinstance(p, Project) for p in projects)
+        assert projects[0].id == PROJECT_ID
+
+    @respx.mock
+    def test_create_should_return_new_project(
+        self, client: AsyncProjectsApi, sample_project_dict: dict
+    ) -> None:
+        route = respx.post(BASE_PROJECTS_URL).mock(
+            return_value=httpx.Response(200, json=sample_project_dict)
+        )
+
+        project = asyncio.run(client.create(ProjectParams(name="Test Project")))
+
+        assert isinstance(project, Project)
+        assert project.name == "Test Project"
+        assert route.calls.last.request.read() == b'{"project":{"name":"Test Project"}}'
+
+    @respx.mock
+    def test_delete_should_return_deleted_object(self, client: AsyncProjectsApi) -> None:
+        respx.delete(f"{BASE_PROJECTS_URL}/{PROJECT_ID}").mock(
+            return_value=httpx.Response(200, json={"id": PROJECT_ID})
+        )
+
+        deleted_object = asyncio.run(client.delete(PROJECT_ID))
+
+        assert isinstance(deleted_object, DeletedObject)
+        assert deleted_object.id == PROJECT_ID
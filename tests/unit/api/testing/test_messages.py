@@ -1,3 +1,4 @@
+from io import BytesIO
 from typing import Any
 
 import pytest
@@ -205,6 +206,41 @@ class TestMessagesApi:
         assert "last_id=123" in request.url
         assert "page=5" in request.url
 
+    @pytest.mark.parametrize("prefetch", [False, True])
+    @responses.activate
+    def test_iter_messages_should_walk_pages_by_last_id(
+        self, client: MessagesApi, sample_message_dict: dict, prefetch: bool
+    ) -> None:
+        pages: list[tuple[dict[str, Any], list[int]]] = [
+            ({"search": "welcome"}, [30, 20]),
+            ({"search": "welcome", "last_id": "20"}, [10]),
+            ({"search": "welcome", "last_id": "10"}, []),
+        ]
+        for params, ids in pages:
+            responses.get(
+                BASE_MESSAGES_URL,
+                json=[{**sample_message_dict, "id": id_} for id_ in ids],
+                status=200,
+                match=[responses.matchers.query_param_matcher(params)],
+            )
+
+        messages = client.iter_messages(INBOX_ID, search="welcome", prefetch=prefetch)
+
+        assert [m.id for m in messages] == [30, 20, 10]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_iter_messages_should_be_lazy(
+        self, client: MessagesApi, sample_message_dict: dict
+    ) -> None:
+        responses.get(BASE_MESSAGES_URL, json=[sample_message_dict], status=200)
+
+        messages = client.iter_messages(INBOX_ID)
+
+        assert len(responses.calls) == 0
+        assert next(messages).id == MESSAGE_ID
+        assert len(responses.calls) == 1
+
     @pytest.mark.parametrize(
         "status_code,response_json,expected_error_message",
         [
@@ -859,6 +895,61 @@ class TestMessagesApi:
 
         assert result == eml_content
 
+    @responses.activate
+    def test_get_body_bytes_should_return_undecoded_body(
+        self, client: MessagesApi
+    ) -> None:
+        body = "Subject: Café\r\n\r\nBody".encode("latin-1")
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.eml"
+        responses.get(url, body=body, status=200, content_type="message/rfc822")
+
+        assert client.get_body_bytes(INBOX_ID, MESSAGE_ID) == body
+
+    @responses.activate
+    def test_get_body_bytes_should_raise_api_errors(self, client: MessagesApi) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.raw"
+        responses.get(
+            url,
+            json=conftest.UNAUTHORIZED_RESPONSE,
+            status=conftest.UNAUTHORIZED_STATUS_CODE,
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.get_body_bytes(INBOX_ID, MESSAGE_ID, "raw")
+
+        assert conftest.UNAUTHORIZED_ERROR_MESSAGE in str(exc_info.value)
+
+    @responses.activate
+    def test_stream_body_should_yield_chunks(self, client: MessagesApi) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.raw"
+        responses.get(url, body=b"raw message body", status=200)
+
+        chunks = client.stream_body(INBOX_ID, MESSAGE_ID, "raw", chunk_size=8)
+
+        assert list(chunks) == [b"raw mess", b"age body"]
+
+    @responses.activate
+    def test_download_body_should_write_to_file(self, client: MessagesApi) -> None:
+        body = b"Subject: Test\r\n\r\n" + b"x" * 100_000
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.eml"
+        responses.get(url, body=body, status=200)
+        file = BytesIO()
+
+        size = client.download_body(INBOX_ID, MESSAGE_ID, file)
+
+        assert size == len(body)
+        assert file.getvalue() == body
+
+    @responses.activate
+    def test_download_body_should_raise_api_errors(self, client: MessagesApi) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.htmlsource"
+        responses.get(url, body="", status=conftest.NOT_FOUND_STATUS_CODE)
+
+        with pytest.raises(APIError) as exc_info:
+            client.download_body(INBOX_ID, MESSAGE_ID, BytesIO(), "htmlsource")
+
+        assert conftest.NOT_FOUND_ERROR_MESSAGE in str(exc_info.value)
+
     @responses.activate
     def test_get_mail_headers_should_return_headers(
         self, client: MessagesApi, sample_mail_headers_dict: dict
@@ -1,3 +1,8 @@
+import base64
+import json
+from io import BytesIO
+from pathlib import Path
+
 from mailtrap.models.mail.attachment import Attachment
 from mailtrap.models.mail.attachment import Disposition
 
@@ -22,3 +27,58 @@ class TestAttachment:
             "disposition": "inline",
             "content_id": "test_id",
         }
+
+    def test_from_path_should_encode_file_on_serialization(self, tmp_path: Path) -> None:
+        path = tmp_path / "report.pdf"
+        path.write_bytes(b"first version")
+        entity = Attachment.from_path(path)
+
+        path.write_bytes(b"%PDF-1.4 binary \x00\xff content")
+
+        assert entity.api_data == {
+            "content": base64.b64encode(b"%PDF-1.4 binary \x00\xff content").decode(),
+            "filename": "report.pdf",
+            "type": "application/pdf",
+        }
+
+    def test_from_path_should_allow_overriding_file_attributes(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "logo"
+        path.write_bytes(b"")
+
+        entity = Attachment.from_path(
+            str(path),
+            filename="logo.png",
+            disposition=Disposition.INLINE,
+            content_id="logo",
+        )
+
+        assert entity.api_data == {
+            "content": "",
+            "filename": "logo.png",
+            "type": "image/png",
+            "disposition": "inline",
+            "content_id": "logo",
+        }
+
+    def test_from_file_should_read_rest_of_regular_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "notes.txt"
+        path.write_bytes(b"skip:attached text")
+
+        with path.open("rb") as file:
+            file.seek(5)
+            entity = Attachment.from_file(file, filename="notes.txt")
+
+        assert json.loads(entity.to_json_bytes()) == {
+            "content": base64.b64encode(b"attached text").decode(),
+            "filename": "notes.txt",
+            "type": "text/plain",
+        }
+
+    def test_from_file_should_read_in_memory_file(self) -> None:
+        entity = Attachment.from_file(BytesIO(b"in memory"), filename="data")
+
+        assert entity.to_json_bytes() == (
+            b'{"content":"' + base64.b64encode(b"in memory") + b'","filename":"data"}'
+        )
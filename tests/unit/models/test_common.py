@@ -0,0 +1,70 @@
+import json
+
+from pydantic.dataclasses import dataclass
+
+from mailtrap.models.common import RESPONSE_MODEL_CONFIG
+from mailtrap.models.common import _type_adapters
+from mailtrap.models.common import dump_json_array
+from mailtrap.models.common import dump_json_object
+from mailtrap.models.common import get_type_adapter
+from mailtrap.models.common import warmup_models
+from mailtrap.models.mail import Address
+from mailtrap.models.mail import Mail
+from mailtrap.models.mail.base import SendingMailResponse
+
+
+class TestGetTypeAdapter:
+    def test_adapter_should_be_built_once_per_type(self) -> None:
+        assert get_type_adapter(Mail) is get_type_adapter(Mail)
+        assert get_type_adapter(list[Address]) is get_type_adapter(list[Address])
+        assert get_type_adapter(Mail) is not get_type_adapter(Address)
+
+    def test_adapter_should_dump_response_models(self) -> None:
+        response = SendingMailResponse(success=True, message_ids=["1"])
+
+        data = get_type_adapter(SendingMailResponse).dump_python(response)
+
+        assert data == {"success": True, "message_ids": ["1"]}
+
+
+class TestJsonBytes:
+    MAIL = Mail(
+        sender=Address(email="joe@mail.com"),
+        to=[Address(email="joe@mail.com", name="Joe")],
+        subject="Email subject",
+        text="email text",
+    )
+
+    def test_to_json_bytes_should_match_api_data(self) -> None:
+        assert json.loads(self.MAIL.to_json_bytes()) == self.MAIL.api_data
+
+    def test_dump_json_array_should_join_serialized_models(self) -> None:
+        data = dump_json_array([self.MAIL, Address(email="joe@mail.com")])
+
+        assert json.loads(data) == [self.MAIL.api_data, {"email": "joe@mail.com"}]
+
+    def test_dump_json_object_should_wrap_serialized_values(self) -> None:
+        data = dump_json_object(mail=self.MAIL.to_json_bytes(), empty=b"[]")
+
+        assert json.loads(data) == {"mail": self.MAIL.api_data, "empty": []}
+
+
+class TestResponseModels:
+    def test_validator_should_be_built_on_first_use(self) -> None:
+        @dataclass(config=RESPONSE_MODEL_CONFIG)
+        class Item:
+            id: int
+
+        assert not Item.__pydantic_complete__
+        assert Item(id="1").id == 1  # type: ignore[arg-type]
+        assert Item.__pydantic_complete__
+
+    def test_warmup_models_should_build_validators_and_list_adapters(self) -> None:
+        @dataclass(config=RESPONSE_MODEL_CONFIG)
+        class Item:
+            id: int
+
+        warmup_models(Item)
+
+        assert Item.__pydantic_complete__
+        assert list[Item] in _type_adapters
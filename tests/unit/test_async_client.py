@@ -0,0 +1,175 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+import mailtrap as mt
+from mailtrap.api.sending import AsyncSendingApi
+from mailtrap.api.testing import AsyncTestingApi
+
+DUMMY_ADDRESS = mt.Address(email="joe@mail.com")
+DUMMY_MAIL = mt.Mail(
+    sender=DUMMY_ADDRESS,
+    to=[DUMMY_ADDRESS],
+    subject="Email subject",
+    text="email text",
+)
+
+
+class TestAsyncMailtrapClient:
+    SEND_URL = "https://send.api.mailtrap.io/api/send"
+
+    @staticmethod
+    def get_client(**kwargs: Any) -> mt.AsyncMailtrapClient:
+        props = {"token": "fake_token", **kwargs}
+        return mt.AsyncMailtrapClient(**props)
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            {"sandbox": True},
+            {"inbox_id": "12345"},
+            {"bulk": True, "sandbox": True, "inbox_id": "12345"},
+        ],
+    )
+    def test_client_validation(self, arguments: dict[str, Any]) -> None:
+        with pytest.raises(mt.ClientConfigurationError):
+            self.get_client(**arguments)
+
+    def test_get_testing_api_validation(self) -> None:
+        client = self.get_client()
+        with pytest.raises(mt.ClientConfigurationError) as exc_info:
+            _ = client.testing_api
+
+        assert "`account_id` is required for Testing API" in str(exc_info.value)
+
+    def test_api_facades_should_share_http_client_per_host(self) -> None:
+        client = self.get_client(account_id="12345")
+
+        assert isinstance(client.testing_api, AsyncTestingApi)
+        assert isinstance(client.sending_api, AsyncSendingApi)
+        general_client = client.testing_api._client
+        assert client.contacts_api._client is general_client
+        assert client.email_templates_api._client is general_client
+        assert client.suppressions_api._client is general_client
+        assert client.sending_api._client is not general_client
+
+    @respx.mock
+    def test_send_should_handle_success_response(self) -> None:
+        route = respx.post(self.SEND_URL).mock(
+            return_value=httpx.Response(
+                200, json={"success": True, "message_ids": ["12345"]}
+            )
+        )
+
+        async def send() -> mt.SEND_ENDPOINT_RESPONSE:
+            async with self.get_client() as client:
+                return await client.send(DUMMY_MAIL)
+
+        result = asyncio.run(send())
+
+        assert result == {"success": True, "message_ids": ["12345"]}
+        request = route.calls.last.request
+        assert request.headers["Authorization"] == "Bearer fake_token"
+        assert json.loads(request.read()) == DUMMY_MAIL.api_data
+
+    @respx.mock
+    def test_send_should_run_concurrently_on_one_pool(self) -> None:
+        respx.post(self.SEND_URL).mock(
+            return_value=httpx.Response(
+                200, json={"success": True, "message_ids": ["12345"]}
+            )
+        )
+
+        async def send_many() -> list[mt.SEND_ENDPOINT_RESPONSE]:
+            async with self.get_client(pool_maxsize=2) as client:
+                return await asyncio.gather(*(client.send(DUMMY_MAIL) for _ in range(20)))
+
+        results = asyncio.run(send_many())
+
+        assert len(results) == 20
+        assert respx.calls.call_count == 20
+
+    @respx.mock
+    def test_send_many_should_yield_results_in_input_order(self) -> None:
+        def echo_subject(request: httpx.Request) -> httpx.Response:
+            subject = json.loads(request.read())["subject"]
+            if subject == "fail":
+                return httpx.Response(500, json={"errors": ["Internal error"]})
+            return httpx.Response(200, json={"success": True, "message_ids": [subject]})
+
+        respx.post(self.SEND_URL).mock(side_effect=echo_subject)
+        subjects = ["0", "1", "fail", "3", "4"]
+        mails = [
+            mt.Mail(sender=DUMMY_ADDRESS, to=[DUMMY_ADDRESS], subject=subject)
+            for subject in subjects
+        ]
+
+        async def send_many() -> list[Any]:
+            async with self.get_client() as client:
+                return [result async for result in client.send_many(mails, 2)]
+
+        results = asyncio.run(send_many())
+
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert [result.success for result in results] == [True, True, False, True, True]
+        assert isinstance(results[2].error, mt.APIError)
+        assert results[3].response.message_ids == ["3"]
+
+    @respx.mock
+    def test_send_in_batches_should_mark_unsent_batch_as_failed(self) -> None:
+        item = {"success": True, "message_ids": ["1"]}
+        respx.post("https://send.api.mailtrap.io/api/batch").mock(
+            side_effect=[
+                httpx.ConnectError("Connection refused"),
+                httpx.Response(200, json={"success": True, "responses": [item]}),
+            ]
+        )
+
+        async def send_in_batches() -> list[Any]:
+            async with self.get_client() as client:
+                return await client.sending_api.send_in_batches(
+                    [DUMMY_MAIL] * 3, batch_size=2
+                )
+
+        results = asyncio.run(send_in_batches())
+
+        assert [item.success for item in results] == [False, False, True]
+        assert results[0].errors == ["Connection refused"]
+
+    @respx.mock
+    def test_send_should_raise_authorization_error(self) -> None:
+        respx.post(self.SEND_URL).mock(
+            return_value=httpx.Response(401, json={"errors": ["Unauthorized"]})
+        )
+
+        with pytest.raises(mt.AuthorizationError):
+            asyncio.run(self.get_client().send(DUMMY_MAIL))
+
+    @respx.mock
+    def test_get_requests_should_be_retried(self) -> None:
+        url = "https://mailtrap.io/api/accounts/12345/projects"
+        respx.get(url).mock(
+            side_effect=[
+                httpx.Response(429, json={"errors": ["Rate limit exceeded"]}),
+                httpx.Response(200, json=[]),
+            ]
+        )
+        client = self.get_client(
+            account_id="12345", retry_policy=mt.RetryPolicy(backoff_base=0)
+        )
+
+        assert asyncio.run(client.testing_api.projects.get_list()) == []
+        assert client.testing_api._client.retry_count == 1
+
+    def test_aclose_should_release_http_clients(self) -> None:
+        client = self.get_client()
+        http_client = client.sending_api._client
+
+        asyncio.run(client.aclose())
+
+        assert http_client._client.is_closed
+        assert client.sending_api._client is not http_client
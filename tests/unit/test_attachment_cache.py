@@ -0,0 +1,80 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+import mailtrap as mt
+from mailtrap.attachment_cache import AttachmentCache
+
+
+class TestAttachmentCache:
+
+    def test_attachments_with_same_content_should_share_encoding(
+        self, tmp_path: Path
+    ) -> None:
+        first = tmp_path / "terms.pdf"
+        second = tmp_path / "terms-copy.pdf"
+        first.write_bytes(b"terms of service")
+        second.write_bytes(b"terms of service")
+        cache = AttachmentCache()
+
+        attachments = [
+            cache.attachment(first),
+            cache.attachment(second),
+            cache.attachment(b"terms of service", filename="terms.pdf"),
+        ]
+
+        assert len(cache) == 1
+        assert cache.size == len(base64.b64encode(b"terms of service"))
+        assert attachments[0].content is attachments[1].content
+        assert attachments[0].content is attachments[2].content
+        assert attachments[1].api_data == {
+            "content": base64.b64encode(b"terms of service").decode(),
+            "filename": "terms-copy.pdf",
+            "type": "application/pdf",
+        }
+
+    def test_changed_file_should_be_encoded_again(self, tmp_path: Path) -> None:
+        path = tmp_path / "logo.png"
+        path.write_bytes(b"old logo")
+        cache = AttachmentCache()
+        old = cache.attachment(path)
+
+        path.write_bytes(b"new logo, different size")
+        new = cache.attachment(path)
+
+        assert old.content is not new.content
+        assert json.loads(new.to_json_bytes())["content"] == (
+            base64.b64encode(b"new logo, different size").decode()
+        )
+
+    def test_should_evict_least_recently_used_content(self) -> None:
+        cache = AttachmentCache(max_bytes=8)
+        first = cache.get_content(b"aaa")
+        cache.get_content(b"bbb")
+        assert cache.get_content(b"aaa") is first
+
+        cache.get_content(b"ccc")
+
+        assert len(cache) == 2
+        assert cache.size == 8
+        assert cache.get_content(b"aaa") is first
+        assert (cache.hits, cache.misses) == (2, 3)
+
+    def test_should_not_store_content_larger_than_cache(self) -> None:
+        cache = AttachmentCache(max_bytes=4)
+
+        content = cache.get_content(b"too large")
+
+        assert content.encode() == base64.b64encode(b"too large")
+        assert len(cache) == 0
+
+    def test_attachment_from_bytes_should_require_filename(self) -> None:
+        cache = AttachmentCache()
+
+        with pytest.raises(ValueError):
+            cache.attachment(b"data")
+
+    def test_should_be_exported(self) -> None:
+        assert mt.AttachmentCache is AttachmentCache
@@ -1,8 +1,10 @@
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 import mailtrap as mt
+from mailtrap.client import BaseMailtrapClient
 
 DUMMY_ADDRESS = mt.Address(email="joe@mail.com")
 DUMMY_MAIL = mt.Mail(
@@ -90,3 +92,63 @@ class TestMailtrapClient:
                 "mailtrap-python (https://github.com/railsware/mailtrap-python)"
             ),
         }
+
+    def test_api_facades_should_share_http_client_per_host(self) -> None:
+        client = self.get_client(account_id="12345")
+
+        general_client = client.testing_api._client
+        assert client.contacts_api._client is general_client
+        assert client.email_templates_api._client is general_client
+        assert client.suppressions_api._client is general_client
+        assert client.sending_api._client is client.sending_api._client
+        assert client.sending_api._client is not general_client
+
+    def test_token_change_should_take_effect_on_next_call(self) -> None:
+        client = self.get_client()
+        http_client = client.sending_api._client
+
+        client.token = "new_token"
+        new_http_client = client.sending_api._client
+
+        assert new_http_client is not http_client
+        assert new_http_client._session.headers["Authorization"] == "Bearer new_token"
+        assert client.sending_api._client is new_http_client
+
+    def test_base_client_should_be_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            BaseMailtrapClient(token="fake_token")  # type: ignore[abstract]
+
+    def test_close_should_release_http_clients(self) -> None:
+        client = self.get_client(account_id="12345")
+        http_client = client.sending_api._client
+
+        with patch.object(http_client, "close") as close:
+            with client:
+                pass
+
+        close.assert_called_once_with()
+        assert client.sending_api._client is not http_client
+
+    @pytest.mark.parametrize(
+        "arguments, expected_host",
+        [
+            ({}, "send.api.mailtrap.io"),
+            ({"bulk": True}, "bulk.api.mailtrap.io"),
+            ({"sandbox": True, "inbox_id": "12345"}, "sandbox.api.mailtrap.io"),
+            ({"api_host": "example.send.com"}, "example.send.com"),
+        ],
+    )
+    def test_sending_api_should_use_pool_for_sending_host(
+        self, arguments: dict[str, Any], expected_host: str
+    ) -> None:
+        client = self.get_client(**arguments)
+
+        assert client.sending_api._client.host == expected_host
+
+    def test_pool_settings_should_be_passed_to_http_client(self) -> None:
+        client = self.get_client(pool_maxsize=25, keep_alive=False)
+
+        http_client = client.sending_api._client
+        adapter = http_client._session.get_adapter("https://send.api.mailtrap.io")
+        assert adapter._pool_maxsize == 25  # type: ignore[attr-defined]
+        assert http_client._session.headers["Connection"] == "close"
@@ -0,0 +1,50 @@
+from unittest import mock
+
+from mailtrap.dedup import DedupCache
+from mailtrap.dedup import get_idempotency_key
+from mailtrap.models.mail.base import SendingMailResponse
+
+RESPONSE = SendingMailResponse(success=True, message_ids=["1"])
+
+
+class TestDedupCache:
+    def test_should_return_recorded_response(self) -> None:
+        cache = DedupCache()
+        cache.add("key", RESPONSE)
+
+        assert cache.get("key") == RESPONSE
+        assert cache.get("other") is None
+        assert cache.hits == 1
+
+    def test_should_forget_sends_outside_window(self) -> None:
+        cache = DedupCache(window=10)
+        with mock.patch("mailtrap.dedup.time.monotonic", return_value=100.0):
+            cache.add("key", RESPONSE)
+
+        with mock.patch("mailtrap.dedup.time.monotonic", return_value=110.0):
+            assert cache.get("key") == RESPONSE
+        with mock.patch("mailtrap.dedup.time.monotonic", return_value=110.1):
+            assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_should_evict_oldest_keys(self) -> None:
+        cache = DedupCache(max_size=2)
+        for key in ("a", "b", "c"):
+            cache.add(key, RESPONSE)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c") == RESPONSE
+
+    def test_clear_should_remove_all_keys(self) -> None:
+        cache = DedupCache()
+        cache.add("key", RESPONSE)
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+def test_idempotency_key_should_depend_on_payload_only() -> None:
+    assert get_idempotency_key(b"{}") == get_idempotency_key(b"{}")
+    assert get_idempotency_key(b"{}") != get_idempotency_key(b"[]")
@@ -0,0 +1,154 @@
+import asyncio
+from typing import Optional
+
+import httpx
+import pytest
+import responses
+import respx
+from requests import ConnectionError
+
+import mailtrap as mt
+from mailtrap.config import GENERAL_HOST
+from mailtrap.hooks import BACKOFF
+from mailtrap.hooks import NETWORK
+from mailtrap.hooks import PARSE
+from mailtrap.hooks import SERIALIZE
+from mailtrap.http import AsyncHttpClient
+from mailtrap.http import HttpClient
+from mailtrap.retry import RetryPolicy
+
+URL = "https://test.mailtrap.com/api/resource/1"
+
+
+class RecordingHooks(mt.RequestHooks):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, mt.RequestInfo]] = []
+        self.error: Optional[BaseException] = None
+
+    def on_request_start(self, info: mt.RequestInfo) -> None:
+        self.events.append(("start", info))
+
+    def on_response(self, info: mt.RequestInfo) -> None:
+        self.events.append(("response", info))
+
+    def on_error(self, info: mt.RequestInfo, error: BaseException) -> None:
+        self.events.append(("error", info))
+        self.error = error
+
+
+class FailingHooks(mt.RequestHooks):
+    def on_response(self, info: mt.RequestInfo) -> None:
+        raise RuntimeError("Broken hook")
+
+
+class TestRequestHooks:
+
+    @staticmethod
+    def get_client(
+        hooks: mt.RequestHooks, retry_policy: Optional[RetryPolicy] = None
+    ) -> HttpClient:
+        return HttpClient("test.mailtrap.com", retry_policy=retry_policy, hooks=[hooks])
+
+    @responses.activate
+    def test_hooks_should_receive_call_info(self) -> None:
+        responses.post(URL, json={"id": 1}, status=200)
+        hooks = RecordingHooks()
+
+        self.get_client(hooks).post(
+            "/api/resource/1", json={"name": "test"}, endpoint="resource.create"
+        )
+
+        assert [event for event, _ in hooks.events] == ["start", "response"]
+        info = hooks.events[-1][1]
+        assert info.method == "POST"
+        assert info.endpoint == "resource.create"
+        assert info.path == "/api/resource/1"
+        assert info.status == 200
+        assert info.attempts == 1
+        assert info.request_bytes == len(b'{"name":"test"}')
+        assert info.response_bytes == len(b'{"id": 1}')
+        assert {SERIALIZE, NETWORK, PARSE} <= set(info.timings)
+        assert info.duration == sum(info.timings.values())
+
+    @responses.activate
+    def test_endpoint_should_default_to_path(self) -> None:
+        responses.get(URL, json={}, status=200)
+        hooks = RecordingHooks()
+
+        self.get_client(hooks).get("/api/resource/1")
+
+        assert hooks.events[-1][1].endpoint == "/api/resource/1"
+
+    @responses.activate
+    def test_hooks_should_count_retries_as_one_call(self) -> None:
+        responses.get(URL, body=ConnectionError("Connection reset"))
+        responses.get(URL, json={"errors": ["Unavailable"]}, status=503)
+        responses.get(URL, json={"id": 1}, status=200)
+        hooks = RecordingHooks()
+        client = self.get_client(hooks, retry_policy=RetryPolicy(backoff_base=0))
+
+        client.get("/api/resource/1")
+
+        assert [event for event, _ in hooks.events] == ["start", "response"]
+        info = hooks.events[-1][1]
+        assert info.attempts == 3
+        assert info.status == 200
+        assert BACKOFF in info.timings
+
+    @responses.activate
+    def test_on_error_should_receive_api_errors(self) -> None:
+        responses.delete(URL, json={"errors": ["Not found"]}, status=404)
+        hooks = RecordingHooks()
+
+        with pytest.raises(mt.APIError):
+            self.get_client(hooks).delete("/api/resource/1", endpoint="resource.delete")
+
+        assert [event for event, _ in hooks.events] == ["start", "error"]
+        assert hooks.events[-1][1].status == 404
+        assert isinstance(hooks.error, mt.APIError)
+
+    @responses.activate
+    def test_failing_hooks_should_not_affect_calls(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        responses.get(URL, json={"id": 1}, status=200)
+
+        result = self.get_client(FailingHooks()).get("/api/resource/1")
+
+        assert result == {"id": 1}
+        assert "hook" in caplog.text
+
+    @responses.activate
+    def test_resources_should_report_stable_endpoint_labels(self) -> None:
+        responses.delete(
+            f"https://{GENERAL_HOST}/api/accounts/1/projects/123",
+            json={"id": 123},
+            status=200,
+        )
+        hooks = RecordingHooks()
+        client = mt.MailtrapClient(token="fake_token", account_id="1", hooks=[hooks])
+
+        client.testing_api.projects.delete(123)
+
+        info = hooks.events[-1][1]
+        assert info.endpoint == "projects.delete"
+        assert info.path == "/api/accounts/1/projects/123"
+
+    def test_async_hooks_should_receive_call_info(self) -> None:
+        hooks = RecordingHooks()
+
+        async def run() -> None:
+            client = AsyncHttpClient("test.mailtrap.com", hooks=[hooks])
+            with respx.mock:
+                respx.get(URL).mock(return_value=httpx.Response(200, json={"id": 1}))
+                await client.get("/api/resource/1", endpoint="resource.get")
+            await client.aclose()
+
+        asyncio.run(run())
+
+        assert [event for event, _ in hooks.events] == ["start", "response"]
+        info = hooks.events[-1][1]
+        assert info.endpoint == "resource.get"
+        assert info.status == 200
+        assert info.attempts == 1
+        assert NETWORK in info.timings
@@ -1,11 +1,22 @@
+import gc
 import json
+import os
+import time
+import weakref
+from typing import Any
 from unittest.mock import Mock
+from unittest.mock import patch
 
 import pytest
+import responses
+from requests import ConnectionError
 
+from mailtrap import http
 from mailtrap.exceptions import APIError
 from mailtrap.exceptions import AuthorizationError
 from mailtrap.http import HttpClient
+from mailtrap.models.common import DeletedObject
+from mailtrap.retry import RetryPolicy
 
 
 class TestHttpClient:
@@ -102,3 +113,223 @@ class TestHttpClient:
 
         assert exc_info.value.status == 500
         assert "Internal server error" in exc_info.value.errors
+
+    def test_session_should_use_configured_pool_size(self) -> None:
+        client = HttpClient("test.mailtrap.com", pool_maxsize=42)
+
+        adapter = client._session.get_adapter("https://test.mailtrap.com")
+
+        assert adapter._pool_maxsize == 42  # type: ignore[attr-defined]
+        assert client._session.headers["Connection"] == "keep-alive"
+
+    def test_session_should_disable_keep_alive(self) -> None:
+        client = HttpClient("test.mailtrap.com", keep_alive=False)
+
+        assert client._session.headers["Connection"] == "close"
+
+    def test_context_manager_should_close_session(self) -> None:
+        with HttpClient("test.mailtrap.com") as client:
+            session = client._session
+
+        with patch.object(session, "close") as close:
+            client.close()
+        close.assert_called_once_with()
+
+    def test_close_idle_should_close_only_idle_connections(self) -> None:
+        client = HttpClient("test.mailtrap.com", max_idle_time=60)
+
+        with patch.object(client._session, "close") as close:
+            client.close_idle()
+            close.assert_not_called()
+
+            client._last_used -= 60
+            client.close_idle()
+            close.assert_called_once_with()
+
+    @responses.activate
+    def test_idle_connections_should_be_closed_before_request(self) -> None:
+        responses.get("https://test.mailtrap.com/api/resource", json={}, status=200)
+        client = HttpClient("test.mailtrap.com", max_idle_time=60)
+        client._last_used -= 60
+
+        with patch.object(client._session, "close") as close:
+            client.get("/api/resource")
+
+        close.assert_called_once_with()
+        assert not client._is_idle(time.perf_counter())
+
+    def test_idle_connections_should_be_reaped_in_background(self) -> None:
+        client = HttpClient("test.mailtrap.com", max_idle_time=0.01)
+
+        with patch.object(client._session, "close") as close:
+            deadline = time.monotonic() + 2
+            while not close.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert close.called
+
+    def test_reaper_should_stop_once_clients_are_collected(self) -> None:
+        gc.collect()
+        client = HttpClient("test.mailtrap.com", max_idle_time=0.01)
+        reaper = http._reaper
+        assert reaper is not None
+        with patch.object(client._session, "close") as close:
+            deadline = time.monotonic() + 2
+            while not close.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+        client_ref = weakref.ref(client)
+        del client, close
+
+        deadline = time.monotonic() + 2
+        while client_ref() is not None and time.monotonic() < deadline:
+            gc.collect()
+            time.sleep(0.01)
+        reaper.join(2)
+
+        assert client_ref() is None
+        assert not reaper.is_alive()
+
+    def test_session_should_be_replaced_after_fork(self) -> None:
+        client = HttpClient("test.mailtrap.com", headers={"Authorization": "Bearer x"})
+        session = client._session
+
+        client._reset_after_fork()
+
+        assert client._session is not session
+        assert client._session.headers["Authorization"] == "Bearer x"
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_should_get_own_session(self) -> None:
+        client = HttpClient("test.mailtrap.com")
+        parent_session_id = id(client._session)
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            os.write(write_fd, b"1" if id(client._session) != parent_session_id else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        assert os.read(read_fd, 1) == b"1"
+        os.close(read_fd)
+        assert id(client._session) == parent_session_id
+
+    def test_url_should_use_https_unless_host_has_scheme(self) -> None:
+        assert HttpClient("test.mailtrap.com")._url("/api/send") == (
+            "https://test.mailtrap.com/api/send"
+        )
+        assert HttpClient("http://127.0.0.1:8025/")._url("/api/send") == (
+            "http://127.0.0.1:8025/api/send"
+        )
+
+    @responses.activate
+    def test_get_should_validate_response_type_from_raw_body(self) -> None:
+        url = "https://test.mailtrap.com/api/resource"
+        responses.get(url, body=b'[{"id": 1}, {"id": 2}]', status=200)
+        client = HttpClient("test.mailtrap.com")
+
+        result = client.get("/api/resource", response_type=list[DeletedObject])
+
+        assert result == [DeletedObject(id=1), DeletedObject(id=2)]
+
+    @responses.activate
+    def test_get_with_list_response_type_should_return_empty_list_for_empty_body(
+        self,
+    ) -> None:
+        url = "https://test.mailtrap.com/api/resource"
+        responses.get(url, body=b"", status=200)
+        client = HttpClient("test.mailtrap.com")
+
+        assert client.get("/api/resource", response_type=list[DeletedObject]) == []
+        assert client.get("/api/resource", response_type=DeletedObject) is None
+
+    @responses.activate
+    def test_stream_should_yield_body_in_chunks(self) -> None:
+        url = "https://test.mailtrap.com/api/resource"
+        responses.get(url, body=b"x" * 10, status=200)
+        client = HttpClient("test.mailtrap.com")
+
+        chunks = list(client.stream("/api/resource", chunk_size=4))
+
+        assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+    @responses.activate
+    def test_stream_should_raise_api_errors_before_iteration(self) -> None:
+        url = "https://test.mailtrap.com/api/resource"
+        responses.get(url, json={"errors": ["Not allowed"]}, status=403)
+        client = HttpClient("test.mailtrap.com")
+
+        with pytest.raises(APIError) as exc_info:
+            client.stream("/api/resource")
+
+        assert exc_info.value.errors == ["Not allowed"]
+
+
+class TestHttpClientRetries:
+    URL = "https://test.mailtrap.com/api/resource"
+
+    @staticmethod
+    def get_client(**kwargs: Any) -> HttpClient:
+        policy = RetryPolicy(backoff_base=0, **kwargs)
+        return HttpClient("test.mailtrap.com", retry_policy=policy)
+
+    @responses.activate
+    def test_get_should_be_retried_until_success(self) -> None:
+        responses.get(self.URL, json={"errors": ["Unavailable"]}, status=503)
+        responses.get(self.URL, json={"errors": ["Rate limit"]}, status=429)
+        responses.get(self.URL, json={"id": 1}, status=200)
+        client = self.get_client()
+
+        assert client.get("/api/resource") == {"id": 1}
+        assert len(responses.calls) == 3
+        assert client.retry_count == 2
+
+    @responses.activate
+    def test_get_should_raise_last_error_after_max_attempts(self) -> None:
+        responses.get(self.URL, json={"errors": ["Unavailable"]}, status=503)
+        client = self.get_client(max_attempts=2)
+
+        with pytest.raises(APIError) as exc_info:
+            client.get("/api/resource")
+
+        assert exc_info.value.status == 503
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_get_should_retry_connection_errors(self) -> None:
+        responses.get(self.URL, body=ConnectionError("Connection reset"))
+        responses.get(self.URL, json={"id": 1}, status=200)
+        client = self.get_client()
+
+        assert client.get("/api/resource") == {"id": 1}
+
+    @responses.activate
+    def test_post_should_not_be_retried_by_default(self) -> None:
+        responses.post(self.URL, json={"errors": ["Unavailable"]}, status=503)
+        client = self.get_client()
+
+        with pytest.raises(APIError):
+            client.post("/api/resource", json={})
+
+        assert len(responses.calls) == 1
+        assert client.retry_count == 0
+
+    @responses.activate
+    def test_post_marked_as_idempotent_should_be_retried(self) -> None:
+        responses.post(self.URL, json={"errors": ["Unavailable"]}, status=503)
+        responses.post(self.URL, json={"id": 1}, status=200)
+        client = self.get_client()
+
+        assert client.post("/api/resource", json={}, idempotent=True) == {"id": 1}
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_client_errors_should_not_be_retried(self) -> None:
+        responses.get(self.URL, json={"errors": ["Bad request"]}, status=400)
+        client = self.get_client()
+
+        with pytest.raises(APIError):
+            client.get("/api/resource")
+
+        assert len(responses.calls) == 1
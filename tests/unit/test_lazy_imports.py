@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import mailtrap as mt
+
+SEND_PATH = """
+import sys
+import mailtrap as mt
+mt.MailtrapClient(token="token").sending_api
+mt.Mail(sender=mt.Address(email="a@b.c"), to=[], subject="", text="")
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+def test_all_names_should_be_importable() -> None:
+    for name in mt.__all__:
+        assert getattr(mt, name) is not None
+        assert name in dir(mt)
+
+
+def test_unknown_name_should_raise_attribute_error() -> None:
+    with pytest.raises(AttributeError):
+        _ = mt.NoSuchName  # type: ignore[attr-defined]
+
+
+def test_sending_should_not_import_unused_apis() -> None:
+    output = subprocess.run(
+        [sys.executable, "-c", SEND_PATH], check=True, capture_output=True, text=True
+    ).stdout
+    modules = set(output.split())
+
+    assert "mailtrap.api.sending" in modules
+    assert "mailtrap.api.testing" not in modules
+    assert "mailtrap.models.messages" not in modules
+    assert "mailtrap.models.contacts" not in modules
+    assert "asyncio" not in modules
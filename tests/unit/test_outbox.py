@@ -0,0 +1,196 @@
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import responses
+
+import mailtrap as mt
+from mailtrap.api.sending import SendingApi
+from mailtrap.config import SENDING_HOST
+from mailtrap.http import HttpClient
+from mailtrap.outbox import FAILED
+from mailtrap.outbox import Outbox
+
+BATCH_FULL_URL = f"https://{SENDING_HOST}/api/batch"
+
+DUMMY_ADDRESS = mt.Address(email="joe@mail.com")
+
+
+def make_mail(subject: str) -> mt.Mail:
+    return mt.Mail(sender=DUMMY_ADDRESS, to=[DUMMY_ADDRESS], subject=subject, text="t")
+
+
+def accept_all(request: Any) -> tuple[int, dict, str]:
+    batch = json.loads(request.body)["requests"]
+    items = [
+        (
+            {"success": False, "errors": ["Invalid subject"]}
+            if mail["subject"] == "invalid"
+            else {"success": True, "message_ids": [mail["subject"]]}
+        )
+        for mail in batch
+    ]
+    return 200, {}, json.dumps({"success": True, "responses": items})
+
+
+@pytest.fixture
+def outbox(tmp_path: Path) -> Outbox:
+    return Outbox(
+        SendingApi(client=HttpClient(SENDING_HOST)),
+        tmp_path / "outbox.sqlite3",
+        batch_size=2,
+        retry_policy=mt.RetryPolicy(max_attempts=2, backoff_base=0),
+    )
+
+
+class TestOutbox:
+
+    @responses.activate
+    def test_drain_should_deliver_queued_mails_in_batches(self, outbox: Outbox) -> None:
+        responses.add_callback(responses.POST, BATCH_FULL_URL, callback=accept_all)
+        for i in range(5):
+            outbox.enqueue(make_mail(str(i)))
+
+        assert outbox.drain() == 5
+        assert outbox.count() == 0
+        assert len(responses.calls) == 3
+        subjects = [
+            mail["subject"]
+            for call in responses.calls
+            for mail in json.loads(call.request.body)["requests"]
+        ]
+        assert subjects == ["0", "1", "2", "3", "4"]
+
+    @responses.activate
+    def test_rejected_mails_should_be_kept_as_failed(self, outbox: Outbox) -> None:
+        responses.add_callback(responses.POST, BATCH_FULL_URL, callback=accept_all)
+        outbox.enqueue(make_mail("valid"))
+        invalid_id = outbox.enqueue(make_mail("invalid"))
+
+        assert outbox.drain() == 1
+        assert outbox.count() == 0
+        assert outbox.get_failed() == [(invalid_id, "Invalid subject")]
+
+        assert outbox.requeue_failed() == 1
+        assert outbox.count() == 1
+
+    @responses.activate
+    def test_server_errors_should_be_retried_until_max_attempts(
+        self, outbox: Outbox
+    ) -> None:
+        responses.post(BATCH_FULL_URL, json={"errors": ["Unavailable"]}, status=503)
+        outbox.enqueue(make_mail("0"))
+
+        assert outbox.drain() == 0
+        assert outbox.count() == 0
+        assert outbox.count(FAILED) == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_retried_mails_should_wait_for_backoff(self, outbox: Outbox) -> None:
+        responses.post(BATCH_FULL_URL, json={"errors": ["Unavailable"]}, status=503)
+        outbox.retry_policy = mt.RetryPolicy(backoff_base=60, backoff_cap=60)
+        outbox.enqueue(make_mail("0"))
+
+        assert outbox.drain() == 0
+        assert outbox.count() == 1
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_rejected_batch_should_not_be_retried(self, outbox: Outbox) -> None:
+        responses.post(BATCH_FULL_URL, json={"errors": ["Bad request"]}, status=400)
+        outbox.enqueue(make_mail("0"))
+
+        outbox.drain()
+
+        assert outbox.count(FAILED) == 1
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_unauthorized_batch_should_be_kept_as_failed(self, outbox: Outbox) -> None:
+        responses.post(BATCH_FULL_URL, json={"errors": ["Unauthorized"]}, status=401)
+        outbox.enqueue(make_mail("0"))
+
+        assert outbox.drain() == 0
+        assert outbox.count() == 0
+        assert outbox.get_failed()[0][1] == "Unauthorized"
+        assert len(responses.calls) == 1
+
+        assert outbox.requeue_failed() == 1
+        assert outbox.count() == 1
+
+    @responses.activate
+    def test_mails_should_survive_restart(self, outbox: Outbox) -> None:
+        responses.add_callback(responses.POST, BATCH_FULL_URL, callback=accept_all)
+        outbox.enqueue(make_mail("0"))
+
+        restarted = Outbox(outbox.sending_api, outbox.path)
+
+        assert restarted.drain() == 1
+        assert outbox.count() == 0
+
+    @responses.activate
+    def test_mails_claimed_by_lost_worker_should_be_delivered_after_lease(
+        self, outbox: Outbox
+    ) -> None:
+        responses.add_callback(responses.POST, BATCH_FULL_URL, callback=accept_all)
+        outbox.enqueue(make_mail("0"))
+        outbox.lease_timeout = 0
+        outbox._claim()
+
+        assert outbox.drain() == 1
+
+    @responses.activate
+    def test_worker_should_deliver_in_background(self, outbox: Outbox) -> None:
+        responses.add_callback(responses.POST, BATCH_FULL_URL, callback=accept_all)
+
+        with outbox:
+            outbox.enqueue(make_mail("0"))
+            deadline = time.monotonic() + 5
+            while outbox.count() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert outbox.count() == 0
+        assert len(responses.calls) == 1
+
+    def test_invalid_batch_size_should_raise(self, outbox: Outbox) -> None:
+        with pytest.raises(ValueError):
+            Outbox(outbox.sending_api, outbox.path, batch_size=0)
+        with pytest.raises(ValueError):
+            Outbox(outbox.sending_api, outbox.path, batch_size=501)
+
+    @responses.activate
+    def test_malformed_response_should_be_retried(self, outbox: Outbox) -> None:
+        responses.post(BATCH_FULL_URL, json={"responses": "invalid"}, status=200)
+        outbox.enqueue(make_mail("0"))
+
+        assert outbox.drain() == 0
+        assert outbox.count(FAILED) == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_mails_without_result_should_be_kept_as_failed(self, outbox: Outbox) -> None:
+        item = {"success": True, "message_ids": ["0"]}
+        responses.post(
+            BATCH_FULL_URL, json={"success": True, "responses": [item]}, status=200
+        )
+        outbox.enqueue(make_mail("0"))
+        outbox.enqueue(make_mail("1"))
+
+        assert outbox.drain() == 0
+        assert outbox.count(FAILED) == 2
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_mails_out_of_attempts_should_not_be_claimed(self, outbox: Outbox) -> None:
+        responses.add_callback(responses.POST, BATCH_FULL_URL, callback=accept_all)
+        outbox.enqueue(make_mail("0"))
+        outbox.lease_timeout = 0
+        outbox._claim()
+        outbox._claim()
+
+        assert outbox.drain() == 0
+        assert outbox.get_failed() == [(1, "Out of delivery attempts")]
+        assert len(responses.calls) == 0
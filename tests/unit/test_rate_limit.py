@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+import pytest
+import responses
+
+from mailtrap import rate_limit
+from mailtrap.exceptions import APIError
+from mailtrap.http import HttpClient
+from mailtrap.rate_limit import RateLimiter
+from mailtrap.rate_limit import TokenBucket
+
+HOST = "test.mailtrap.com"
+
+
+class FakeClock:
+    """Stand-in for the `time` module of `mailtrap.rate_limit`."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+class TestTokenBucket:
+
+    def test_burst_should_not_wait(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=1, capacity=5)
+
+        for _ in range(5):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+        bucket.acquire()
+        assert clock.sleeps == [pytest.approx(1.0)]
+
+    def test_acquire_should_wait_for_next_token(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock.sleeps == [pytest.approx(0.05), pytest.approx(0.05)]
+
+    def test_acquire_async_should_wait_for_next_token(self) -> None:
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        async def acquire_all() -> None:
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(3)))
+
+        started_at = time.monotonic()
+        asyncio.run(acquire_all())
+
+        assert time.monotonic() - started_at >= 0.09
+
+    def test_set_rate_should_change_limit_at_runtime(self) -> None:
+        bucket = TokenBucket(rate=1, capacity=10)
+
+        bucket.set_rate(100, capacity=2)
+
+        assert bucket.rate == 100
+        assert bucket.capacity == 2
+        assert bucket._tokens == 2
+
+    def test_pause_should_withhold_tokens(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=100, capacity=100)
+
+        bucket.pause(0.05)
+        bucket.acquire()
+
+        assert clock.sleeps == [pytest.approx(0.06)]
+
+    @pytest.mark.parametrize("rate", [0, -1])
+    def test_rate_should_be_positive(self, rate: float) -> None:
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate)
+
+
+class TestRateLimiter:
+
+    def test_limits_should_be_configured_per_host(self) -> None:
+        limiter = RateLimiter({"a.mailtrap.io": 10, "b.mailtrap.io": (5, 50)})
+
+        bucket_a = limiter.get_bucket("a.mailtrap.io")
+        bucket_b = limiter.get_bucket("b.mailtrap.io")
+        assert bucket_a is not None and bucket_b is not None
+        assert (bucket_a.rate, bucket_a.capacity) == (10, 10)
+        assert (bucket_b.rate, bucket_b.capacity) == (5, 50)
+        assert limiter.get_bucket("c.mailtrap.io") is None
+
+    def test_set_limit_should_update_existing_bucket(self) -> None:
+        limiter = RateLimiter({HOST: 10})
+        bucket = limiter.get_bucket(HOST)
+
+        limiter.set_limit(HOST, 20)
+
+        assert limiter.get_bucket(HOST) is bucket
+        assert bucket is not None and bucket.rate == 20
+
+    def test_unlimited_host_should_not_be_throttled(self, clock: FakeClock) -> None:
+        limiter = RateLimiter()
+
+        for _ in range(100):
+            limiter.acquire(HOST)
+
+        assert clock.sleeps == []
+
+    @responses.activate
+    def test_http_client_should_acquire_token_per_request(self, clock: FakeClock) -> None:
+        responses.get(f"https://{HOST}/api/resource", json={})
+        limiter = RateLimiter({HOST: (20, 1)})
+        client = HttpClient(HOST, rate_limiter=limiter)
+
+        for _ in range(3):
+            client.get("/api/resource")
+
+        assert clock.sleeps == [pytest.approx(0.05), pytest.approx(0.05)]
+
+    @responses.activate
+    def test_http_client_should_pause_bucket_on_rate_limit_response(self) -> None:
+        responses.get(
+            f"https://{HOST}/api/resource",
+            json={"errors": ["Rate limit exceeded"]},
+            status=429,
+            headers={"Retry-After": "30"},
+        )
+        limiter = RateLimiter({HOST: 10})
+        client = HttpClient(HOST, rate_limiter=limiter)
+
+        with pytest.raises(APIError):
+            client.get("/api/resource")
+
+        bucket = limiter.get_bucket(HOST)
+        assert bucket is not None and bucket._tokens <= -299
@@ -0,0 +1,78 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from mailtrap.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+
+    @pytest.mark.parametrize(
+        "method, status_code, expected",
+        [
+            ("GET", 429, True),
+            ("GET", 503, True),
+            ("DELETE", 500, True),
+            ("GET", None, True),
+            ("GET", 400, False),
+            ("GET", 401, False),
+            ("POST", 429, False),
+            ("PATCH", 503, False),
+            ("POST", None, False),
+        ],
+    )
+    def test_should_retry_only_idempotent_methods(
+        self, method: str, status_code: int, expected: bool
+    ) -> None:
+        policy = RetryPolicy()
+
+        assert policy.should_retry(method, 1, status_code) is expected
+
+    def test_should_retry_non_idempotent_method_marked_as_idempotent(self) -> None:
+        policy = RetryPolicy()
+
+        assert policy.should_retry("POST", 1, 503, idempotent=True) is True
+        assert policy.should_retry("GET", 1, 503, idempotent=False) is False
+
+    def test_should_not_retry_after_max_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.should_retry("GET", 2, 503) is True
+        assert policy.should_retry("GET", 3, 503) is False
+
+    def test_get_delay_should_use_full_jitter_within_cap(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_cap=4.0)
+
+        for attempt, upper_bound in [(1, 1.0), (2, 2.0), (3, 4.0), (10, 4.0)]:
+            for _ in range(50):
+                assert 0 <= policy.get_delay(attempt) <= upper_bound
+
+    def test_get_delay_should_honor_retry_after_seconds(self) -> None:
+        policy = RetryPolicy()
+
+        assert policy.get_delay(1, {"Retry-After": "7"}) == 7.0
+
+    def test_get_delay_should_honor_retry_after_http_date(self) -> None:
+        policy = RetryPolicy()
+
+        delay = policy.get_delay(1, {"Retry-After": formatdate(time.time() + 10)})
+
+        assert 8 <= delay <= 10
+
+    def test_get_delay_should_cap_retry_after(self) -> None:
+        policy = RetryPolicy(max_retry_after=5.0)
+
+        assert policy.get_delay(1, {"Retry-After": "120"}) == 5.0
+
+    def test_get_delay_should_honor_exhausted_rate_limit(self) -> None:
+        policy = RetryPolicy()
+
+        headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}
+
+        assert policy.get_delay(1, headers) == 3.0
+
+    def test_get_delay_should_ignore_headers_if_disabled(self) -> None:
+        policy = RetryPolicy(backoff_base=0.1, respect_retry_after=False)
+
+        assert policy.get_delay(1, {"Retry-After": "7"}) <= 0.1
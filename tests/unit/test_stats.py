@@ -0,0 +1,113 @@
+import pytest
+import responses
+
+import mailtrap as mt
+from mailtrap.config import GENERAL_HOST
+from mailtrap.hooks import RequestInfo
+from mailtrap.stats import StatsCollector
+
+PROJECTS_URL = f"https://{GENERAL_HOST}/api/accounts/1/projects"
+
+
+class TestLatencyHistogram:
+
+    def test_quantiles_should_be_within_relative_error(self) -> None:
+        histogram = mt.LatencyHistogram(precision=8)
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        max_error = 2 ** (1 / 8) - 1
+        assert histogram.count == 1000
+        assert histogram.quantile(0.5) == pytest.approx(0.5, rel=max_error)
+        assert histogram.quantile(0.99) == pytest.approx(0.99, rel=max_error)
+        assert histogram.quantile(1.0) == 1.0
+        assert histogram.mean == pytest.approx(0.5005)
+
+    def test_empty_histogram_should_report_zero(self) -> None:
+        histogram = mt.LatencyHistogram()
+
+        assert histogram.quantile(0.99) == 0.0
+        assert histogram.mean == 0.0
+
+    def test_merge_should_combine_histograms(self) -> None:
+        fast, slow = mt.LatencyHistogram(), mt.LatencyHistogram()
+        for _ in range(90):
+            fast.record(0.01)
+        for _ in range(10):
+            slow.record(1.0)
+
+        fast.merge(slow)
+
+        assert fast.count == 100
+        assert fast.min == 0.01
+        assert fast.max == 1.0
+        assert fast.quantile(0.5) == pytest.approx(0.01, rel=0.1)
+        assert fast.quantile(0.95) == 1.0
+
+    def test_merge_should_require_same_precision(self) -> None:
+        with pytest.raises(ValueError):
+            mt.LatencyHistogram(precision=4).merge(mt.LatencyHistogram(precision=8))
+
+
+class TestStatsCollector:
+
+    def test_in_flight_should_count_started_calls(self) -> None:
+        collector = StatsCollector()
+        info = RequestInfo(method="GET", endpoint="projects.get_list", path="/")
+
+        collector.on_request_start(info)
+        assert collector.snapshot().endpoints["projects.get_list"].in_flight == 1
+
+        collector.reset()
+        collector.on_response(info)
+        stats = collector.snapshot().endpoints["projects.get_list"]
+        assert stats.in_flight == 0
+        assert stats.requests == 1
+
+
+class TestClientStats:
+
+    @staticmethod
+    def get_client() -> mt.MailtrapClient:
+        return mt.MailtrapClient(
+            token="fake_token",
+            account_id="1",
+            collect_stats=True,
+            retry_policy=mt.RetryPolicy(backoff_base=0),
+        )
+
+    @responses.activate
+    def test_stats_should_count_calls_by_endpoint(self) -> None:
+        responses.get(PROJECTS_URL, json={"errors": ["Unavailable"]}, status=503)
+        responses.get(PROJECTS_URL, json=[], status=200)
+        responses.delete(f"{PROJECTS_URL}/2", json={"errors": ["Not found"]}, status=404)
+        client = self.get_client()
+
+        client.testing_api.projects.get_list()
+        with pytest.raises(mt.APIError):
+            client.testing_api.projects.delete(2)
+
+        stats = client.stats()
+        get_list = stats.endpoints["projects.get_list"]
+        assert (get_list.requests, get_list.errors, get_list.retries) == (1, 0, 1)
+        assert get_list.latency.count == 1
+        delete = stats.endpoints["projects.delete"]
+        assert (delete.requests, delete.errors, delete.retries) == (1, 1, 0)
+        assert stats.total.requests == 2
+        assert stats.total.latency.count == 2
+
+    @responses.activate
+    def test_reset_stats_should_clear_counters(self) -> None:
+        responses.get(PROJECTS_URL, json=[], status=200)
+        client = self.get_client()
+        client.testing_api.projects.get_list()
+
+        client.reset_stats()
+
+        assert client.stats().endpoints == {}
+
+    def test_stats_should_require_collect_stats(self) -> None:
+        client = mt.MailtrapClient(token="fake_token")
+
+        with pytest.raises(mt.ClientConfigurationError):
+            client.stats()
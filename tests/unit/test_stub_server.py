@@ -0,0 +1,325 @@
+import asyncio
+import time
+from io import BytesIO
+
+import pytest
+import requests
+
+import mailtrap as mt
+from mailtrap.stub_server import StubServer
+
+SENDER = mt.Address(email="sender@example.com", name="Sender")
+RECIPIENT = mt.Address(email="joe@example.com", name="Joe")
+
+
+def make_mail(subject: str = "Hello", **kwargs: object) -> mt.Mail:
+    return mt.Mail(
+        sender=SENDER, to=[RECIPIENT], subject=subject, text="Hi there", **kwargs
+    )
+
+
+def sandbox_client(server: StubServer) -> mt.MailtrapClient:
+    return mt.MailtrapClient(
+        token="stub-token",
+        account_id="1",
+        sandbox=True,
+        inbox_id=str(server.state.default_inbox_id),
+        api_host=server.url,
+        general_api_host=server.url,
+    )
+
+
+class TestStubServer:
+    def test_send_should_record_mail(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        response = stub_client.send(make_mail())
+
+        assert response["success"] is True
+        assert len(response["message_ids"]) == 1
+        assert stub_server.state.sent[0]["subject"] == "Hello"
+        assert stub_server.requests[0].headers["Authorization"] == "Bearer stub-token"
+
+    def test_send_should_reject_invalid_mail(
+        self, stub_client: mt.MailtrapClient
+    ) -> None:
+        mail = mt.Mail(sender=SENDER, to=[RECIPIENT], subject="No body")
+
+        with pytest.raises(mt.APIError) as exc_info:
+            stub_client.send(mail)
+
+        assert exc_info.value.status == 400
+        assert exc_info.value.errors == ["'text' or 'html' is required"]
+
+    def test_send_in_batches_should_return_result_per_mail(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        mails = [make_mail(str(i)) for i in range(5)]
+
+        results = stub_client.sending_api.send_in_batches(mails, batch_size=2)
+
+        assert [result.success for result in results] == [True] * 5
+        assert [mail["subject"] for mail in stub_server.state.sent] == list("01234")
+
+    def test_same_idempotency_key_should_be_sent_once(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        first = stub_client.send(make_mail(), idempotency_key="key")
+        second = stub_client.send(make_mail(), idempotency_key="key")
+
+        assert first == second
+        assert stub_server.state.sent_count == 1
+
+    def test_idempotency_key_should_be_scoped_to_path(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        batch = {"base": None, "requests": [make_mail().api_data]}
+        response = requests.post(
+            f"{stub_server.url}/api/batch",
+            json=batch,
+            headers={"Authorization": "Bearer stub-token", "Idempotency-Key": "key"},
+        )
+
+        sent = stub_client.send(make_mail(), idempotency_key="key")
+
+        assert "responses" in response.json()
+        assert sent["success"] is True
+        assert stub_server.state.sent_count == 2
+
+    def test_idempotent_responses_should_be_bounded(self) -> None:
+        with StubServer(max_sent=1) as server:
+            client = mt.MailtrapClient(
+                token="stub-token",
+                account_id="1",
+                api_host=server.url,
+                general_api_host=server.url,
+            )
+            client.send(make_mail(), idempotency_key="first")
+            client.send(make_mail(), idempotency_key="second")
+            client.send(make_mail(), idempotency_key="first")
+
+            assert len(server.state.idempotent_responses) == 1
+            assert server.state.sent_count == 3
+
+    def test_sandbox_send_should_store_message_in_inbox(
+        self, stub_server: StubServer
+    ) -> None:
+        client = sandbox_client(stub_server)
+        inbox_id = stub_server.state.default_inbox_id
+        client.send(
+            make_mail(
+                "Invoice",
+                attachments=[mt.Attachment(content=b"data", filename="invoice.pdf")],
+            )
+        )
+        messages_api = client.testing_api.messages
+
+        [message] = messages_api.get_list(inbox_id)
+        body = BytesIO()
+        messages_api.download_body(inbox_id, message.id, body)
+        [attachment] = client.testing_api.attachments.get_list(inbox_id, message.id)
+
+        assert message.subject == "Invoice"
+        assert message.to_email == RECIPIENT.email
+        assert b"Subject: Invoice" in body.getvalue()
+        assert messages_api.get_text_message(inbox_id, message.id) == "Hi there"
+        assert attachment.filename == "invoice.pdf"
+        assert client.testing_api.inboxes.get_by_id(inbox_id).emails_count == 1
+
+    def test_messages_should_be_paginated_by_last_id(
+        self, stub_server: StubServer
+    ) -> None:
+        client = sandbox_client(stub_server)
+        client.sending_api.send_in_batches([make_mail(str(i)) for i in range(40)])
+        messages_api = client.testing_api.messages
+
+        messages = list(messages_api.iter_messages(stub_server.state.default_inbox_id))
+
+        assert len(messages) == 40
+        assert [message.id for message in messages] == list(range(40, 0, -1))
+
+    def test_projects_and_inboxes_should_be_managed(
+        self, stub_client: mt.MailtrapClient
+    ) -> None:
+        testing_api = stub_client.testing_api
+
+        project = testing_api.projects.create(mt.ProjectParams(name="Staging"))
+        inbox = testing_api.inboxes.create(project.id, mt.CreateInboxParams(name="QA"))
+        renamed = testing_api.inboxes.update(inbox.id, mt.UpdateInboxParams(name="E2E"))
+
+        assert renamed.name == "E2E"
+        assert [i.id for i in testing_api.projects.get_by_id(project.id).inboxes] == [
+            inbox.id
+        ]
+        assert testing_api.projects.delete(project.id).id == project.id
+        with pytest.raises(mt.APIError):
+            testing_api.inboxes.get_by_id(inbox.id)
+
+    def test_contacts_should_be_managed(self, stub_client: mt.MailtrapClient) -> None:
+        contacts_api = stub_client.contacts_api
+        contact_list = contacts_api.contact_lists.create(
+            mt.ContactListParams(name="Customers")
+        )
+
+        contact = contacts_api.contacts.create(
+            mt.CreateContactParams(email="joe@example.com", list_ids=[contact_list.id])
+        )
+        updated = contacts_api.contacts.update(
+            "joe@example.com", mt.UpdateContactParams(unsubscribed=True)
+        )
+        contact_import = contacts_api.contact_imports.import_contacts(
+            [mt.ImportContactParams(email="ann@example.com")]
+        )
+
+        assert updated.id == contact.id
+        assert updated.list_ids == [contact_list.id]
+        assert updated.status == "unsubscribed"
+        imported = contacts_api.contact_imports.get_by_id(contact_import.id)
+        assert imported.created_contacts_count == 1
+        contacts_api.contacts.delete(contact.id)
+        with pytest.raises(mt.APIError):
+            contacts_api.contacts.get_by_id(contact.id)
+
+    def test_templates_should_be_managed(self, stub_client: mt.MailtrapClient) -> None:
+        templates_api = stub_client.email_templates_api.templates
+
+        template = templates_api.create(
+            mt.CreateEmailTemplateParams(
+                name="Welcome", subject="Hi", category="Onboarding", body_text="Hi"
+            )
+        )
+        templates_api.update(template.id, mt.UpdateEmailTemplateParams(subject="Hey"))
+
+        assert [t.subject for t in templates_api.get_list()] == ["Hey"]
+        templates_api.delete(template.id)
+        assert templates_api.get_list() == []
+
+    def test_suppressions_should_be_listed_and_deleted(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        suppression = stub_server.state.add_suppression("joe@example.com")
+        stub_server.state.add_suppression("ann@example.com")
+        suppressions_api = stub_client.suppressions_api.suppressions
+
+        found = suppressions_api.get_list(email="joe@example.com")
+        deleted = suppressions_api.delete(suppression["id"])
+
+        assert [s.email for s in found] == ["joe@example.com"]
+        assert deleted.id == suppression["id"]
+        assert len(suppressions_api.get_list()) == 1
+
+    def test_injected_errors_should_be_retried(self, stub_server: StubServer) -> None:
+        client = mt.MailtrapClient(
+            token="stub-token",
+            api_host=stub_server.url,
+            retry_policy=mt.RetryPolicy(backoff_base=0, retry_keyed_sends=True),
+        )
+        stub_server.fail_next(status=503, times=2, path_prefix="/api/send")
+
+        response = client.send(make_mail(), idempotency_key="key")
+
+        assert response["success"] is True
+        assert stub_server.request_count == 3
+        assert client.sending_api._client.retry_count == 2
+
+    def test_error_rate_should_fail_requests(self) -> None:
+        with StubServer(error_rate=1.0, error_status=500) as server:
+            client = mt.MailtrapClient(token="stub-token", api_host=server.url)
+
+            with pytest.raises(mt.APIError) as exc_info:
+                client.send(make_mail())
+
+        assert exc_info.value.status == 500
+
+    def test_request_without_token_should_be_unauthorized(
+        self, stub_server: StubServer
+    ) -> None:
+        response = requests.post(f"{stub_server.url}/api/send", json={})
+
+        assert response.status_code == 401
+
+    def test_async_client_should_send(self, stub_server: StubServer) -> None:
+        pytest.importorskip("httpx")
+
+        async def send() -> dict:
+            async with mt.AsyncMailtrapClient(
+                token="stub-token", api_host=stub_server.url
+            ) as client:
+                return await client.send(make_mail())
+
+        assert asyncio.run(send())["success"] is True
+
+    def test_warmup_should_open_pooled_connections(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        assert stub_client.warmup(connections=3) == {stub_server.url: 3}
+
+        session = stub_client.sending_api._client._session
+        pools = session.get_adapter(stub_server.url).poolmanager.pools
+        (pool,) = [pools[key] for key in pools.keys()]
+        assert pool.num_connections == 3
+        assert pool.pool is not None and pool.pool.qsize() >= 3
+        stub_client.send(make_mail())
+        assert pool.num_connections == 3
+
+    def test_warmup_should_not_follow_redirects(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        with StubServer() as other_server:
+            stub_server.fail_next(
+                status=301, times=2, path_prefix="/", location=f"{other_server.url}/"
+            )
+
+            assert stub_client.warmup(connections=2) == {stub_server.url: 2}
+
+            assert stub_server.request_count == 2
+            assert other_server.request_count == 0
+
+    def test_warmup_without_connections_should_not_send_requests(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        assert stub_client.warmup(connections=0) == {stub_server.url: 0}
+        assert stub_server.request_count == 0
+
+    def test_keepalive_should_repeat_warmup_until_closed(
+        self, stub_server: StubServer, stub_client: mt.MailtrapClient
+    ) -> None:
+        stub_client.warmup(connections=1, keepalive_interval=0.01)
+
+        deadline = time.monotonic() + 2
+        while stub_server.request_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stub_client.close()
+        pings = stub_server.request_count
+        time.sleep(0.05)
+
+        assert pings >= 3
+        assert stub_server.request_count == pings
+        assert {request.method for request in stub_server.requests} == {"HEAD"}
+
+    def test_async_warmup_should_open_pooled_connections(
+        self, stub_server: StubServer
+    ) -> None:
+        pytest.importorskip("httpx")
+
+        async def warmup() -> dict[str, int]:
+            async with mt.AsyncMailtrapClient(
+                token="stub-token", api_host=stub_server.url
+            ) as client:
+                return await client.warmup(connections=2)
+
+        assert asyncio.run(warmup()) == {stub_server.url: 2}
+
+    def test_async_warmup_without_connections_should_not_send_requests(
+        self, stub_server: StubServer
+    ) -> None:
+        pytest.importorskip("httpx")
+
+        async def warmup() -> dict[str, int]:
+            async with mt.AsyncMailtrapClient(
+                token="stub-token", api_host=stub_server.url
+            ) as client:
+                return await client.warmup(connections=0)
+
+        assert asyncio.run(warmup()) == {stub_server.url: 0}
+        assert stub_server.request_count == 0